@@ -0,0 +1,93 @@
+"""Benchmark the validation of DNSE minute bars read through a ColumnTable.
+
+Compare, on the same dict-of-lists payload, the peak memory allocated and the duration of:
+
+- transpose: `convert_dictlists_to_listdicts()`, then `validate_many()` of the list of rows;
+- column table: `validate_many()` of the rows yielded one at a time by `ColumnTable.rows()`;
+
+and of the selection of the last trading day of the bars:
+
+- filter rows: a list comprehension over the transposed rows;
+- between: `ColumnTable.between()`, a view of the same columns.
+
+Usage:
+    python benchmarks/column_table.py [--rows 100000] [--runs 3]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from vietfin.providers.dnse.models.equity_price_historical import (
+    DnseEquityHistoricalPriceData,
+)
+from vietfin.utils.column_table import ColumnTable
+from vietfin.utils.helpers import convert_dictlists_to_listdicts
+
+
+def minute_bars(n: int) -> dict[str, list]:
+    """Return n minute bars in the dict-of-lists format of the DNSE API."""
+    start = int(datetime(2020, 1, 2, 9, 15, tzinfo=timezone.utc).timestamp())
+    return {
+        "t": [start + i * 60 for i in range(n)],
+        "o": [67.795 + i % 100 for i in range(n)],
+        "h": [67.894 + i % 100 for i in range(n)],
+        "l": [67.3 + i % 100 for i in range(n)],
+        "c": [67.5 + i % 100 for i in range(n)],
+        "v": [1_000 + i for i in range(n)],
+        "nextTime": 0,
+    }
+
+
+def measure(func: Callable[[], Any], runs: int) -> tuple[float, float]:
+    """Return the median duration (in milliseconds) and the peak memory (in MB) of func."""
+    durations = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started_at) * 1000)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(durations), peak / 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    bars = minute_bars(args.rows)
+    model = DnseEquityHistoricalPriceData
+    last_day = datetime.fromtimestamp(bars["t"][-1], tz=timezone.utc).date()
+    since = datetime(last_day.year, last_day.month, last_day.day, tzinfo=timezone.utc)
+
+    cases: dict[str, Callable[[], Any]] = {
+        "transpose": lambda: model.validate_many(convert_dictlists_to_listdicts(bars)),
+        "column table": lambda: model.validate_many(
+            ColumnTable.from_dict(bars).rows()
+        ),
+        "filter rows": lambda: [
+            r
+            for r in convert_dictlists_to_listdicts(bars)
+            if r["t"] >= since.timestamp()
+        ],
+        "between": lambda: ColumnTable.from_dict(bars, index="t").between(last_day),
+    }
+
+    print(f"DNSE minute bars: {args.rows} rows")
+    for name, func in cases.items():
+        duration, peak = measure(func, args.runs)
+        print(f"  {name:<13} {duration:9.1f} ms  peak {peak:8.1f} MB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
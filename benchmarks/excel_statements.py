@@ -0,0 +1,132 @@
+"""Benchmark the parsing of the SSI financial statement workbooks.
+
+Compare, on each workbook:
+
+- reading the sheet: `pd.read_excel()` (openpyxl, as before), then `excel.read_sheet()`
+  with each installed engine;
+- unpivoting it: `pd.melt()` then one SsiEquityFundamentalIncomeData per cell, as before,
+  then the vectorized melt of `results_format="columns"`, and of `"models"`.
+
+The workbooks are SSI downloads stored on disk, e.g. saved from the url of
+`vf.equity.fundamental.income("VNM", provider="ssi").extra["api_url"]`, or by default
+a synthetic workbook with the same layout.
+
+Usage:
+    python benchmarks/excel_statements.py [WORKBOOK.xlsx ...] [--items 200] [--periods 100] [--runs 3]
+"""
+
+import argparse
+import statistics
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Callable
+
+import openpyxl
+import pandas as pd
+
+from vietfin.providers.ssi.models.equity_fundamental_income import (
+    SsiEquityFundamentalIncomeData,
+)
+from vietfin.providers.ssi.utils.equity_fundamental_income import (
+    _melt_statement,
+    year_quarter_regex,
+)
+from vietfin.utils import excel
+
+
+def synthetic_workbook(n_items: int, n_periods: int) -> bytes:
+    """Return a financial statement with the layout of the SSI downloads."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Income Statement"])
+    sheet.append(["Company: VNM"])
+    for _ in range(5):
+        sheet.append([])
+    quarters = [f"Q{q} {y}" for y in range(2000, 2030) for q in range(1, 5)]
+    sheet.append(["ITEMS", *quarters[:n_periods]])
+    for i in range(n_items):
+        sheet.append(
+            [f"Item {i}", *(i * 1_000_000 + p * 1.5 for p in range(n_periods))]
+        )
+    sheet.append([])
+    sheet.append(["Source: SSI"])
+    sheet.append(["Unit: VND"])
+
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def median_ms(func: Callable[[], Any], runs: int) -> float:
+    """Return the median duration (in milliseconds) of func."""
+    durations = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started_at) * 1000)
+    return statistics.median(durations)
+
+
+def melt_models(df: pd.DataFrame) -> list:
+    """Unpivot the sheet as before, then validate one model per cell."""
+    df = df.copy()
+    df["period"] = "quarter"
+    period_columns = [c for c in df.columns if year_quarter_regex.match(str(c))]
+    df = pd.melt(
+        df,
+        id_vars=["ITEMS", "period"],
+        value_vars=period_columns,
+        var_name="fiscal_period",
+        value_name="values",
+    )
+    return [SsiEquityFundamentalIncomeData(**r) for r in df.to_dict("records")]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("workbooks", nargs="*", type=Path)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--periods", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    workbooks = {str(path): path.read_bytes() for path in args.workbooks} or {
+        f"synthetic {args.items} items x {args.periods} periods": synthetic_workbook(
+            args.items, args.periods
+        )
+    }
+    print(f"Installed engines: {', '.join(excel.ENGINES)}")
+
+    default_engine = excel.engine
+    for name, content in workbooks.items():
+        print(f"\n{name}: {len(content) / 1e3:.0f} kB")
+
+        read_ms = median_ms(
+            lambda: pd.read_excel(BytesIO(content), skiprows=7), args.runs
+        )
+        print(f"  read   pd.read_excel       {read_ms:8.1f} ms   1.0x")
+        for engine in excel.ENGINES:
+            excel.set_engine(engine)
+            ms = median_ms(lambda: excel.read_sheet(content, skiprows=7), args.runs)
+            print(f"  read   {engine:<20} {ms:8.1f} ms {read_ms / ms:5.1f}x")
+        excel.set_engine(default_engine)
+
+        df = excel.read_sheet(content, skiprows=7).iloc[:-3]
+        melt_ms = median_ms(lambda: melt_models(df), args.runs)
+        columns_ms = median_ms(lambda: _melt_statement(df, "quarter"), args.runs)
+        models_ms = median_ms(
+            lambda: SsiEquityFundamentalIncomeData.validate_many(
+                _melt_statement(df, "quarter").to_dict(orient="records")
+            ),
+            args.runs,
+        )
+        print(f"  melt   pd.melt + models    {melt_ms:8.1f} ms   1.0x")
+        for label, ms in (("columns", columns_ms), ("models", models_ms)):
+            print(f"  melt   vectorized {label:<9} {ms:8.1f} ms {melt_ms / ms:5.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+"""Benchmark the startup time of VietFin, up to the first command call.
+
+Measure, each in a fresh Python interpreter so no module is cached:
+
+- `from vietfin import vf`;
+- the first access to a group of commands, e.g. `vf.equity.price`;
+- the first selection of a provider, i.e. what runs before the first API call.
+
+The script exits with status 1 if the median time of a step exceeds its budget,
+or if a step imports a module only needed by some commands (pandas, NumPy, sqlite3).
+
+Usage:
+    python benchmarks/import_time.py [--runs 10] [--budget-scale 1.0]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Name: (statement, time budget in milliseconds)
+STATEMENTS = {
+    "from vietfin import vf": ("from vietfin import vf", 50),
+    "first access to vf.equity.price": (
+        "from vietfin import vf; vf.equity.price",
+        450,
+    ),
+    "first selection of a provider": (
+        "from vietfin import vf; vf.equity.price._get_provider('tcbs')",
+        800,
+    ),
+}
+
+# Modules imported by the commands using them, never at startup
+DEFERRED_MODULES = ("pandas", "numpy", "sqlite3")
+
+
+def measure(statement: str, runs: int) -> tuple[list[float], list[str]]:
+    """Return the duration (in milliseconds) of the statement in `runs` fresh interpreters,
+    and the deferred modules it imported."""
+    code = (
+        "import sys, time, json; t = time.perf_counter(); "
+        f"{statement}; "
+        "ms = (time.perf_counter() - t) * 1000; "
+        f"print(json.dumps([ms, [m for m in {DEFERRED_MODULES!r} if m in sys.modules]]))"
+    )
+    durations, imported = [], set()
+    for _ in range(runs):
+        ms, modules = json.loads(
+            subprocess.check_output([sys.executable, "-c", code], text=True)
+        )
+        durations.append(ms)
+        imported.update(modules)
+    return durations, sorted(imported)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="multiply the time budgets, e.g. 2 on a slow machine",
+    )
+    args = parser.parse_args()
+
+    failures = []
+    for name, (statement, budget_ms) in STATEMENTS.items():
+        durations, imported = measure(statement, args.runs)
+        median = statistics.median(durations)
+        budget = budget_ms * args.budget_scale
+        print(
+            f"{name:<35} median {median:8.1f} ms  (min {min(durations):.1f}, max {max(durations):.1f})"
+            f"  budget {budget:.0f} ms"
+        )
+        if median > budget:
+            failures.append(f"{name} takes {median:.1f} ms > budget {budget:.0f} ms")
+        if imported:
+            failures.append(f"{name} imports {', '.join(imported)}")
+
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        return 1
+
+    print("OK: every step is within its budget, without importing the deferred modules")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""Benchmark the JSON decoding of provider responses with each installed backend.
+
+For each provider payload, measure the decoding alone, then the decoding followed by
+the validation of one data model per record, as done by the commands.
+With msgspec installed, also measure `jsonlib.decode_records()`, which only decodes
+the fields of the model.
+
+The payloads are synthetic, with the same shape and size as the real responses.
+
+Usage:
+    python benchmarks/json_decode.py [--rows 10000] [--runs 5]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from vietfin.utils import jsonlib
+from vietfin.utils.helpers import convert_dictlists_to_listdicts
+from vietfin.providers.dnse.models.equity_price_historical import (
+    DnseEquityHistoricalPriceData,
+)
+from vietfin.providers.ssi.models.derivatives_futures_quote import (
+    SsiDerivativesFuturesQuoteData,
+)
+from vietfin.providers.tcbs.models.equity_price_historical import (
+    TcbsEquityHistoricalPriceData,
+)
+from vietfin.providers.tcbs.models.equity_price_quote import (
+    TcbsEquityPriceQuoteData,
+)
+
+
+def tcbs_historical(n: int) -> dict:
+    start = datetime(2000, 1, 1)
+    return {
+        "ticker": "VNM",
+        "data": [
+            {
+                "open": 67795.0 + i,
+                "high": 67894.0 + i,
+                "low": 67300.0 + i,
+                "close": 67500.0 + i,
+                "volume": 1_000_000 + i,
+                "tradingDate": (start + timedelta(days=i)).strftime(
+                    "%Y-%m-%dT00:00:00.000Z"
+                ),
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def tcbs_quote(n: int) -> dict:
+    return {
+        "page": 0,
+        "size": n,
+        "total": n,
+        "data": [
+            {
+                "p": 67500.0,
+                "v": 100 + i,
+                "cp": 0.0,
+                "rcp": 0.0,
+                "a": "BU",
+                "ba": 0.0,
+                "sa": 0.0,
+                "hl": True,
+                "pcp": 100.0,
+                "t": "14:29:59",
+                "ap": 67400.0,
+                "n": 1,
+                "type": "Normal",
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def dnse_historical(n: int) -> dict:
+    start = int(datetime(2000, 1, 1).timestamp())
+    return {
+        "t": [start + i * 86400 for i in range(n)],
+        "o": [67.795 + i for i in range(n)],
+        "h": [67.894 + i for i in range(n)],
+        "l": [67.3 + i for i in range(n)],
+        "c": [67.5 + i for i in range(n)],
+        "v": [1_000_000 + i for i in range(n)],
+        "nextTime": 0,
+    }
+
+
+def ssi_futures_quote(n: int) -> dict:
+    return {
+        "code": "SUCCESS",
+        "data": {
+            "items": [
+                {
+                    "_id": f"093000{1700000000000 + i}",
+                    "time": "09:30:00",
+                    "vol": 1 + i % 10,
+                    "price": 1300.0,
+                    "priceChange": 1.5,
+                    "priceChangePercent": 0.1,
+                    "ref": 1298.5,
+                    "side": "bu",
+                    "stockSymbol": "VN30F2412",
+                    "accumulatedVol": i,
+                }
+                for i in range(n)
+            ]
+        },
+    }
+
+
+# payload builder, model, path of the records, and function returning the records of the document
+PAYLOADS: dict[str, tuple[Callable[[int], dict], Any, tuple, Callable[[Any], list]]] = {
+    "tcbs historical": (
+        tcbs_historical,
+        TcbsEquityHistoricalPriceData,
+        ("data",),
+        lambda d: d["data"],
+    ),
+    "tcbs quote": (
+        tcbs_quote,
+        TcbsEquityPriceQuoteData,
+        ("data",),
+        lambda d: d["data"],
+    ),
+    "dnse historical": (
+        dnse_historical,
+        DnseEquityHistoricalPriceData,
+        (),
+        convert_dictlists_to_listdicts,
+    ),
+    "ssi futures quote": (
+        ssi_futures_quote,
+        SsiDerivativesFuturesQuoteData,
+        ("data", "items"),
+        lambda d: d["data"]["items"],
+    ),
+}
+
+
+def best_of(func: Callable[[], Any], runs: int) -> float:
+    """Return the median duration (in milliseconds) of func."""
+    durations = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started_at) * 1000)
+    return statistics.median(durations)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    default_backend = jsonlib.backend
+    print(f"Installed backends: {', '.join(jsonlib.BACKENDS)}")
+
+    for name, (build, model, path, get_rows) in PAYLOADS.items():
+        content = json.dumps(build(args.rows)).encode()
+        print(f"\n{name}: {args.rows} records, {len(content) / 1e6:.1f} MB")
+
+        baseline = None
+        for backend in jsonlib.BACKENDS:
+            jsonlib.set_backend(backend)
+            decode_ms = best_of(lambda: jsonlib.loads(content), args.runs)
+            total_ms = best_of(
+                lambda: [model(**r) for r in get_rows(jsonlib.loads(content))],
+                args.runs,
+            )
+            if backend == "json":
+                baseline = (decode_ms, total_ms)
+            print(
+                f"  {backend:<8} decode {decode_ms:8.1f} ms   decode + validate {total_ms:8.1f} ms"
+            )
+
+        if "msgspec" in jsonlib.BACKENDS and path:
+            jsonlib.set_backend("msgspec")
+            records_ms = best_of(
+                lambda: [
+                    model(**r)
+                    for r in jsonlib.decode_records(content, model, path)
+                ],
+                args.runs,
+            )
+            print(f"  msgspec  decode_records + validate {records_ms:8.1f} ms")
+
+        jsonlib.set_backend(default_backend)
+        if baseline and default_backend != "json":
+            fast_ms = best_of(lambda: jsonlib.loads(content), args.runs)
+            print(
+                f"  speed-up of {default_backend} decode over json: {baseline[0] / fast_ms:.1f}x"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+"""Benchmark the validation of DNSE minute bars into data models.
+
+Compare, on the same rows:
+
+- legacy: one model per row, with the alias mapping rebuilt for every row, as before
+  the aliases of `__alias_dict__` were compiled once per class;
+- models: one model per row, `[DnseEquityHistoricalPriceData(**r) for r in rows]`;
+- validate_many: all rows in a single call, `DnseEquityHistoricalPriceData.validate_many(rows)`;
+- parse_ohlcv_columns: the vectorized OHLCV parser of the SSI dchart and DNSE APIs,
+  used by their `results_format="columns"`.
+
+Usage:
+    python benchmarks/validate_many.py [--rows 100000] [--runs 3]
+"""
+
+import argparse
+import statistics
+import time
+from datetime import date, datetime, timezone
+from typing import Any, Callable
+
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+
+from vietfin.providers.dnse.models.equity_price_historical import (
+    DnseEquityHistoricalPriceData,
+)
+from vietfin.utils.helpers import (
+    convert_dictlists_to_listdicts,
+    parse_ohlcv_columns,
+)
+
+
+class LegacyDnseBar(BaseModel):
+    """DnseEquityHistoricalPriceData, with the per-row alias mapping of the former Data class."""
+
+    __alias_dict__ = DnseEquityHistoricalPriceData.__alias_dict__
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True, strict=False)
+
+    date: date
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+
+    @model_validator(mode="before")
+    @classmethod
+    def _use_alias(cls, values: Any) -> dict:
+        aliases = {alias: original for original, alias in cls.__alias_dict__.items()}
+        return {aliases.get(key, key): value for key, value in values.items()}
+
+    @model_validator(mode="before")
+    @classmethod
+    def parse_unix_timestamp(cls, data: Any) -> Any:
+        data["t"] = datetime.fromtimestamp(data["t"], tz=timezone.utc).date()
+        return data
+
+    @field_validator("open", "high", "low", "close")
+    @classmethod
+    def multiply_1k(cls, value: float) -> float:
+        return value * 1000
+
+
+def minute_bars(n: int) -> dict[str, list]:
+    """Return n minute bars in the dict-of-lists format of the DNSE API."""
+    start = int(datetime(2020, 1, 2, 9, 15, tzinfo=timezone.utc).timestamp())
+    return {
+        "t": [start + i * 60 for i in range(n)],
+        "o": [67.795 + i % 100 for i in range(n)],
+        "h": [67.894 + i % 100 for i in range(n)],
+        "l": [67.3 + i % 100 for i in range(n)],
+        "c": [67.5 + i % 100 for i in range(n)],
+        "v": [1_000 + i for i in range(n)],
+    }
+
+
+def median_ms(func: Callable[[Any], Any], make_input: Callable[[], Any], runs: int) -> float:
+    """Return the median duration (in milliseconds) of func, on a fresh input at each run."""
+    durations = []
+    for _ in range(runs):
+        data = make_input()  # the validators update the rows in place
+        started_at = time.perf_counter()
+        func(data)
+        durations.append((time.perf_counter() - started_at) * 1000)
+    return statistics.median(durations)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    bars = minute_bars(args.rows)
+
+    def make_rows() -> list[dict]:
+        return convert_dictlists_to_listdicts(bars)
+
+    model = DnseEquityHistoricalPriceData
+    cases: dict[str, tuple[Callable[[Any], Any], Callable[[], Any]]] = {
+        "legacy": (lambda rows: [LegacyDnseBar(**r) for r in rows], make_rows),
+        "models": (lambda rows: [model(**r) for r in rows], make_rows),
+        "validate_many": (model.validate_many, make_rows),
+        "parse_ohlcv_columns": (parse_ohlcv_columns, lambda: dict(bars)),
+    }
+
+    print(f"DNSE minute bars: {args.rows} rows")
+    baseline = None
+    for name, (func, make_input) in cases.items():
+        duration = median_ms(func, make_input, args.runs)
+        baseline = baseline or duration
+        print(f"  {name:<20} {duration:9.1f} ms  {baseline / duration:5.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,31 +1,108 @@
-"""VietFin package directory."""
+"""VietFin package directory.
 
-# read version from installed package
-from importlib.metadata import version
+The package is loaded lazily: `from vietfin import vf` does not import any component
+or provider module (nor pandas). A group of commands, e.g. `vf.equity`, is imported
+the first time it is accessed, and a provider module the first time it is selected.
+"""
 
-__version__ = version("vietfin")
+from functools import cached_property
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-# Import and instantiate classes and expose them as part of the package namespace
-from vietfin.components.funds import Funds
-from vietfin.components.equity import Equity
-from vietfin.components.derivatives import Derivatives
-from vietfin.components.index import Index
-from vietfin.components.etf import Etf
-from vietfin.components.news import News
+if TYPE_CHECKING:
+    from vietfin.components.aio import Aio
+    from vietfin.components.derivatives import Derivatives
+    from vietfin.components.equity import Equity
+    from vietfin.components.etf import Etf
+    from vietfin.components.funds import Funds
+    from vietfin.components.index import Index
+    from vietfin.components.news import News
+
+# Classes exposed as part of the package namespace, imported on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "Funds": "vietfin.components.funds",
+    "Equity": "vietfin.components.equity",
+    "Derivatives": "vietfin.components.derivatives",
+    "Index": "vietfin.components.index",
+    "Etf": "vietfin.components.etf",
+    "News": "vietfin.components.news",
+    "Aio": "vietfin.components.aio",
+}
+
+
+def _version() -> str:
+    """Read version from installed package."""
+    from importlib.metadata import version  # pylint: disable=import-outside-toplevel
+
+    return version("vietfin")
 
 
 class VietFin:
-    def __init__(self) -> None:
-        self.__version__ = version("vietfin")
-        self.funds = Funds()
-        self.equity = Equity()
-        self.derivatives = Derivatives()
-        self.index = Index()
-        self.etf = Etf()
-        self.news = News()
+    """VietFin entry point, exposing the groups of commands, e.g. `vf.equity`.
+
+    Each group is imported and instantiated on first access.
+    """
+
+    @cached_property
+    def __version__(self) -> str:  # type: ignore[override]
+        return _version()
+
+    @cached_property
+    def funds(self) -> "Funds":
+        from vietfin.components.funds import Funds  # pylint: disable=import-outside-toplevel
+
+        return Funds()
+
+    @cached_property
+    def equity(self) -> "Equity":
+        from vietfin.components.equity import Equity  # pylint: disable=import-outside-toplevel
+
+        return Equity()
+
+    @cached_property
+    def derivatives(self) -> "Derivatives":
+        from vietfin.components.derivatives import Derivatives  # pylint: disable=import-outside-toplevel
+
+        return Derivatives()
+
+    @cached_property
+    def index(self) -> "Index":
+        from vietfin.components.index import Index  # pylint: disable=import-outside-toplevel
+
+        return Index()
+
+    @cached_property
+    def etf(self) -> "Etf":
+        from vietfin.components.etf import Etf  # pylint: disable=import-outside-toplevel
+
+        return Etf()
+
+    @cached_property
+    def news(self) -> "News":
+        from vietfin.components.news import News  # pylint: disable=import-outside-toplevel
+
+        return News()
+
+    @cached_property
+    def aio(self) -> "Aio":
+        from vietfin.components.aio import Aio  # pylint: disable=import-outside-toplevel
+
+        return Aio()
 
 
 vf = VietFin()
 
 
+def __getattr__(name: str) -> Any:
+    """Import the classes of the package namespace on first access."""
+    if name == "__version__":
+        return _version()
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value  # cache it, next accesses skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES, "__version__"])
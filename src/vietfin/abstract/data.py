@@ -1,6 +1,18 @@
 """The VietFin Standardized Data Model."""
 
-from pydantic import BaseModel, ConfigDict, model_validator
+import types
+from datetime import date, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, Union, get_args, get_origin
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, TypeAdapter
+from typing_extensions import Self
+
+from vietfin.utils.column_table import ColumnTable
+
+# pandas is only imported by the columnar validation, not at startup
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Data(BaseModel):
@@ -24,6 +36,8 @@ class Data(BaseModel):
     """
 
     __alias_dict__: dict[str, str] = {}
+    # field name of each alias, compiled from __alias_dict__
+    __field_names__: dict[str, str] = {}
 
     model_config = ConfigDict(
         extra="ignore",
@@ -31,19 +45,158 @@ class Data(BaseModel):
         strict=False,
     )
 
-    # Transform a dictionary of values received from external input,
-    # to match the internal naming conventions of the Pydantic model
-    # This method is invoked before the inner validator of the Pydantic model is called
-    @model_validator(mode="before")
+    # Compile __alias_dict__ once per class, when the class is created:
+    # each aliased field accepts its alias first, then its own name, resolved by the Pydantic core
+    # instead of rebuilding the input dict of every row
     @classmethod
-    def _use_alias(cls, values) -> dict:
-        """Maps field names to their aliases."""
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Set the validation alias of each field of __alias_dict__."""
+        super().__pydantic_init_subclass__(**kwargs)
+
         # swapping the keys and values of __alias_dict__
-        aliases = {
+        cls.__field_names__ = {
             alias: original for original, alias in cls.__alias_dict__.items()
         }
-        if aliases:
-            return {
-                aliases.get(key, key): value for key, value in values.items()
-            }
-        return values
+
+        changed = False
+        for name, field in cls.model_fields.items():
+            alias = cls.__alias_dict__.get(name)
+            if alias and alias != name and field.validation_alias is None:
+                field.validation_alias = AliasChoices(alias, name)
+                changed = True
+        if changed:
+            cls.model_rebuild(force=True)
+
+    @classmethod
+    def validate_many(cls, rows: Iterable[dict]) -> list[Self]:
+        """Validate many rows of raw data at once, into a list of models.
+
+        Same as `[cls(**r) for r in rows]`, in a single call of the Pydantic core.
+
+        Parameters
+        ----------
+        rows : Iterable[dict]
+            raw data from the API call, as a list-of-dicts,
+            or an iterator of rows, e.g. `ColumnTable.rows()`.
+
+        Returns
+        -------
+        list
+            one model per row.
+
+        Raises
+        ------
+        ValidationError
+            if a row is invalid
+        """
+        return _list_adapter(cls).validate_python(rows)
+
+    # Columnar validation: an opt-in alternative to instantiating one model per row,
+    # used by the commands called with results_format="columns"
+
+    @classmethod
+    def _transform_columns(cls, df: "pd.DataFrame") -> "pd.DataFrame":
+        """Vectorized counterpart of the model's own validators, applied to whole columns.
+
+        Called after the alias renames, before the dtype conversions.
+        Override it in a subclass whose validators transform the values, e.g. a unix timestamp to a date.
+        """
+        return df
+
+    @classmethod
+    def validate_columns(
+        cls, data: dict[str, list] | list[dict] | ColumnTable
+    ) -> "pd.DataFrame":
+        """Validate and convert raw data column by column, without instantiating a model per row.
+
+        Apply the same `__alias_dict__` renames and dtype rules as the model,
+        and return the same dataframe as converting a list of models with `VfObject.to_df()`.
+
+        Parameters
+        ----------
+        data : dict[str, list] | list[dict] | ColumnTable
+            raw data from the API call, either a dict-of-lists (only the list values are used),
+            a list-of-dicts, or a ColumnTable.
+
+        Returns
+        -------
+        pd.DataFrame
+            one column per field of the model, indexed and sorted by date if the model has a date field.
+
+        Raises
+        ------
+        ValueError
+            if a required field is missing, or has null or invalid values
+        """
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        if isinstance(data, dict):
+            df = pd.DataFrame({k: v for k, v in data.items() if isinstance(v, list)})
+        elif isinstance(data, ColumnTable):
+            df = data.to_df()
+        else:
+            df = pd.DataFrame.from_records(data)
+
+        df = df.rename(columns=cls.__field_names__)
+        df = cls._transform_columns(df)
+
+        columns = {}
+        for name, field in cls.model_fields.items():
+            if name not in df.columns:
+                if field.is_required():
+                    raise ValueError(f"Missing column for required field: {name}")
+                continue
+            columns[name] = _convert_column(df[name], name, field.annotation, field.is_required())
+
+        df = pd.DataFrame(columns, index=df.index)
+
+        if "date" in df.columns:
+            df = df.set_index("date").sort_index(axis=0, kind="stable")
+
+        return df
+
+
+def _convert_column(
+    col: "pd.Series", name: str, annotation: Any, required: bool
+) -> "pd.Series":
+    """Convert a column to the dtype of the annotation of its field."""
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    # unpack Optional[X] / X | None
+    nullable = False
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        nullable = len(args) < len(get_args(annotation))
+        annotation = args[0] if len(args) == 1 else args
+
+    if required and not nullable and col.isna().any():
+        raise ValueError(f"Null values found for required field: {name}")
+
+    try:
+        if annotation is date:
+            col = pd.to_datetime(col)
+            if col.dt.tz is not None:
+                col = col.dt.tz_localize(None)
+            return col.dt.normalize()
+        if annotation is datetime:
+            return pd.to_datetime(col)
+        if annotation is float:
+            return pd.to_numeric(col).astype("float64")
+        if annotation is int:
+            col = pd.to_numeric(col)
+            return col.astype("Int64" if col.isna().any() else "int64")
+        if annotation is bool:
+            return col.astype("boolean" if col.isna().any() else "bool")
+        if isinstance(annotation, list) and set(annotation) <= {int, float}:
+            # int | float
+            return pd.to_numeric(col)
+    except (TypeError, ValueError) as ex:
+        raise ValueError(f"Invalid values for field {name}: {ex}") from ex
+
+    return col
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[Data]) -> TypeAdapter:
+    """Return the TypeAdapter validating a list of models, built once per model."""
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
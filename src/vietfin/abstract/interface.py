@@ -1,9 +1,11 @@
 """VietFin abstract interface."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator
 
 from vietfin.abstract.vfobject import VfObject
+from vietfin.utils.helpers import RESULTS_FORMATS
+from vietfin.utils.concurrency import run_concurrently
 
 
 class IFunds(ABC):
@@ -27,6 +29,27 @@ class IFunds(ABC):
         pass
 
 
+class IFundsAsync(ABC):
+    """Abstract Interface for the async Funds component."""
+
+    @abstractmethod
+    async def search(self, symbol: str) -> VfObject:
+        """Funds Search. Search for a fund."""
+        pass
+
+    @abstractmethod
+    async def historical(
+        self, symbol: str, start_date: Any, end_date: Any
+    ) -> VfObject:
+        """Funds Historical price. Load historical NAV for a specific fund."""
+        pass
+
+    @abstractmethod
+    async def holdings(self, symbol: str) -> VfObject:
+        """Funds Holdings. Load the top 10 holdings for a specific fund."""
+        pass
+
+
 class IEquity(ABC):
     """Interface for Equity component."""
 
@@ -46,7 +69,12 @@ class IEquityPrice(ABC):
 
     @abstractmethod
     def historical(
-        self, symbol: str, start_date: Any, end_date: Any, interval: str
+        self,
+        symbol: str,
+        start_date: Any,
+        end_date: Any,
+        interval: str,
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
         """Equity Price Historical. Load historical price data for a specific ticker."""
         pass
@@ -56,6 +84,35 @@ class IEquityPrice(ABC):
         """Equity Price Quote. Load quote data for a specific ticker."""
         pass
 
+    def iter_quote(
+        self, symbol: str, limit: int, prefetch: int
+    ) -> Iterator[list[Any]]:
+        """Equity Price Quote, streamed page by page. Optional, not all providers implement it."""
+        raise NotImplementedError(
+            "equity.price.iter_quote() command is not implemented for this provider."
+        )
+
+
+class IEquityPriceAsync(ABC):
+    """Interface for the async Equity Price component."""
+
+    @abstractmethod
+    async def historical(
+        self,
+        symbol: str,
+        start_date: Any,
+        end_date: Any,
+        interval: str,
+        results_format: RESULTS_FORMATS = "models",
+    ) -> VfObject:
+        """Equity Price Historical. Load historical price data for a specific ticker."""
+        pass
+
+    @abstractmethod
+    async def quote(self, symbol: str, limit: int) -> VfObject:
+        """Equity Price Quote. Load quote data for a specific ticker."""
+        pass
+
 
 class IEquityOwnership(ABC):
     """Interface for Equity Ownership component."""
@@ -84,6 +141,22 @@ class IEquityOwnership(ABC):
         """Equity Ownership Proprietary trading. Load the trading data of proprietary trading firms for a specific ticker."""
         pass
 
+    def iter_foreign_trading(
+        self, symbol: str, start_date: Any, end_date: Any, prefetch: int
+    ) -> Iterator[list[Any]]:
+        """Equity Ownership Foreign Trading, streamed page by page. Optional, not all providers implement it."""
+        raise NotImplementedError(
+            "equity.ownership.iter_foreign_trading() command is not implemented for this provider."
+        )
+
+    def iter_prop_trading(
+        self, symbol: str, start_date: Any, end_date: Any, prefetch: int
+    ) -> Iterator[list[Any]]:
+        """Equity Ownership Proprietary trading, streamed page by page. Optional, not all providers implement it."""
+        raise NotImplementedError(
+            "equity.ownership.iter_prop_trading() command is not implemented for this provider."
+        )
+
 
 class IEquityCalendar(ABC):
     """Interface for Equity Calendar component."""
@@ -93,6 +166,14 @@ class IEquityCalendar(ABC):
         """Equity Calendar Events. Load Historical All-event-type Calendar data for a specific ticker."""
         pass
 
+    def iter_events(
+        self, symbol: str, limit: int, prefetch: int
+    ) -> Iterator[list[Any]]:
+        """Equity Calendar Events, streamed page by page. Optional, not all providers implement it."""
+        raise NotImplementedError(
+            "equity.calendar.iter_events() command is not implemented for this provider."
+        )
+
 
 class IEquityFundamental(ABC):
     """Interface for Equity Fundamental component."""
@@ -113,25 +194,56 @@ class IEquityFundamental(ABC):
         pass
 
     @abstractmethod
-    def income(self, symbol: str, period: Any) -> VfObject:
+    def income(
+        self, symbol: str, period: Any, results_format: RESULTS_FORMATS = "models"
+    ) -> VfObject:
         """Equity Fundamental Income. Load Historical income statement data for a specific ticker."""
         pass
 
     @abstractmethod
-    def balance(self, symbol: str, period: Any) -> VfObject:
+    def balance(
+        self, symbol: str, period: Any, results_format: RESULTS_FORMATS = "models"
+    ) -> VfObject:
         """Equity Fundamental Balance. Load Historical balance sheet statement data for a specific ticker."""
         pass
 
     @abstractmethod
-    def cash(self, symbol: str, period: Any) -> VfObject:
+    def cash(
+        self, symbol: str, period: Any, results_format: RESULTS_FORMATS = "models"
+    ) -> VfObject:
         """Equity Fundamental Cash. Load Historical cash flow statement data for a specific ticker."""
         pass
 
+    def statements(
+        self, symbol: str, period: Any, results_format: RESULTS_FORMATS = "models"
+    ) -> tuple[dict[str, VfObject], dict[str, Exception]]:
+        """Equity Fundamental Statements. Load the income, balance and cash flow statements concurrently.
+
+        Return the result of each statement, and the error of each statement that failed,
+        keyed by statement name. Override it to share the lookups of the three statements.
+        """
+        commands = {"income": self.income, "balance": self.balance, "cash": self.cash}
+        return run_concurrently(
+            lambda name: commands[name](
+                symbol=symbol, period=period, results_format=results_format
+            ),
+            commands,
+            max_workers=len(commands),
+        )
+
     @abstractmethod
     def multiples(self, symbol: str, period: Any) -> VfObject:
         """Equity Fundamental Multiples. Load Historical valuation multiples data for a specific ticker."""
         pass
 
+    def iter_dividends(
+        self, symbol: str, limit: int, prefetch: int
+    ) -> Iterator[list[Any]]:
+        """Equity Fundamental Dividends, streamed page by page. Optional, not all providers implement it."""
+        raise NotImplementedError(
+            "equity.fundamental.iter_dividends() command is not implemented for this provider."
+        )
+
 
 class IEquityDiscovery(ABC):
     """Interface for Equity Discovery component."""
@@ -171,6 +283,12 @@ class IDerivativesFutures(ABC):
         """Derivatives Futures Search. Search for a specific futures contract."""
         pass
 
+    def iter_quote(self, symbol: str, limit: int) -> Iterator[list[Any]]:
+        """Derivatives Futures Quote, streamed page by page. Optional, not all providers implement it."""
+        raise NotImplementedError(
+            "derivatives.futures.iter_quote() command is not implemented for this provider."
+        )
+
 
 class IDerivativesCoveredWarrant(ABC):
     """Interface for Derivatives Covered Warrant component."""
@@ -200,7 +318,12 @@ class IIndexPrice(ABC):
 
     @abstractmethod
     def historical(
-        self, symbol: str, start_date: Any, end_date: Any, interval: Any
+        self,
+        symbol: str,
+        start_date: Any,
+        end_date: Any,
+        interval: Any,
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
         """Index Price Historical. Load historical price data for a specific index."""
         pass
@@ -211,7 +334,12 @@ class IEtf(ABC):
 
     @abstractmethod
     def historical(
-        self, symbol: str, start_date: Any, end_date: Any, interval: Any
+        self,
+        symbol: str,
+        start_date: Any,
+        end_date: Any,
+        interval: Any,
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
         """Etf Price Historical. Load historical price data for a specific ETF ticker."""
         pass
@@ -229,3 +357,11 @@ class INews(ABC):
     def company(self, symbol: str, limit: int) -> VfObject:
         """News Company. Load company news data for a specific ticker."""
         pass
+
+    def iter_company(
+        self, symbol: str, limit: int, prefetch: int
+    ) -> Iterator[list[Any]]:
+        """News Company, streamed page by page. Optional, not all providers implement it."""
+        raise NotImplementedError(
+            "news.iter_company() command is not implemented for this provider."
+        )
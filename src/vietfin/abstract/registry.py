@@ -0,0 +1,240 @@
+"""Central registry of the providers of each component.
+
+A provider implementation is registered under a (component, provider) key, e.g.
+("equity_price", "tcbs"), either as a class or as its "module:Class" path.
+A path is only imported when the provider is first selected, then the same instance
+is reused, so selecting a provider is a single dict lookup.
+
+Third-party packages can plug in their own providers without editing vietfin,
+either by calling `register_provider()`, or by declaring an entry point in the
+"vietfin.providers" group, named "<component>.<provider>" with the "module:Class" path
+of the implementation as value, e.g. in pyproject.toml:
+
+    [tool.poetry.plugins."vietfin.providers"]
+    "equity_price.myprovider" = "my_package.provider:EquityPriceMyProvider"
+
+The entry points are only scanned when a provider is not found in the registry.
+"""
+
+import threading
+from importlib import import_module
+from typing import Any
+
+ENTRY_POINT_GROUP = "vietfin.providers"
+
+# Components of the registry, and the interface their providers implement
+COMPONENTS = {
+    "funds": "IFunds",
+    "funds_async": "IFundsAsync",
+    "equity": "IEquity",
+    "equity_price": "IEquityPrice",
+    "equity_price_async": "IEquityPriceAsync",
+    "equity_ownership": "IEquityOwnership",
+    "equity_calendar": "IEquityCalendar",
+    "equity_fundamental": "IEquityFundamental",
+    "equity_discovery": "IEquityDiscovery",
+    "derivatives_futures": "IDerivativesFutures",
+    "derivatives_covered_warrant": "IDerivativesCoveredWarrant",
+    "index": "IIndex",
+    "index_price": "IIndexPrice",
+    "etf": "IEtf",
+    "news": "INews",
+}
+
+# Implementation of each provider, as a class or a "module:Class" path
+_implementations: dict[tuple[str, str], type | str] = {}
+# Instance of each provider already selected
+_instances: dict[tuple[str, str], Any] = {}
+
+_lock = threading.Lock()
+_entry_points_loaded = False
+
+
+def register_provider(
+    component: str, provider: str, implementation: type | str
+) -> None:
+    """Register the implementation of a provider for a component.
+
+    A provider already registered under the same name is replaced.
+
+    Parameters
+    ----------
+    component : str
+        component name, one of the keys of `COMPONENTS`, e.g. "equity_price".
+    provider : str
+        provider name, e.g. "tcbs". Case insensitive.
+    implementation : type | str
+        the class implementing the interface of the component,
+        or its "module:Class" path to import it on first use.
+
+    Raises
+    ------
+    ValueError
+        if the component is unknown, or the path is not in "module:Class" format.
+    """
+    if component not in COMPONENTS:
+        raise ValueError(
+            f"Invalid component: {component}. Valid components: {', '.join(COMPONENTS)}."
+        )
+    if isinstance(implementation, str) and implementation.count(":") != 1:
+        raise ValueError(
+            f"Invalid implementation path: {implementation}. Expected format: 'module:Class'."
+        )
+
+    key = (component, provider.lower())
+    with _lock:
+        _implementations[key] = implementation
+        # drop the instance of the replaced implementation
+        _instances.pop(key, None)
+
+
+def _load_entry_points() -> None:
+    """Register the providers declared in the "vietfin.providers" entry points group.
+
+    The providers registered by vietfin itself or by `register_provider()` take precedence.
+    """
+    global _entry_points_loaded
+    from importlib.metadata import entry_points  # pylint: disable=import-outside-toplevel
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        component, _, provider = entry_point.name.partition(".")
+        if component in COMPONENTS and provider:
+            _implementations.setdefault(
+                (component, provider.lower()), entry_point.value
+            )
+    _entry_points_loaded = True
+
+
+def _create_provider(key: tuple[str, str]) -> Any:
+    """Instantiate the provider of a key, importing its class if needed."""
+    with _lock:
+        instance = _instances.get(key)
+        if instance is not None:
+            return instance
+
+        if key not in _implementations and not _entry_points_loaded:
+            _load_entry_points()
+        implementation = _implementations.get(key)
+        if implementation is None:
+            raise NotImplementedError(f"Provider {key[1]} is not implemented yet.")
+
+        if isinstance(implementation, str):
+            module_name, class_name = implementation.split(":")
+            implementation = getattr(import_module(module_name), class_name)
+
+        instance = _instances[key] = implementation()  # type: ignore[operator]
+        return instance
+
+
+def get_provider(component: str, provider: str) -> Any:
+    """Return the instance of a provider for a component.
+
+    Parameters
+    ----------
+    component : str
+        component name, e.g. "equity_price".
+    provider : str
+        provider name, e.g. "tcbs". Case insensitive.
+
+    Raises
+    ------
+    NotImplementedError
+        if the provider is not registered for the component
+    """
+    key = (component, provider.lower())
+    instance = _instances.get(key)
+    if instance is None:
+        instance = _create_provider(key)
+    return instance
+
+
+def get_implementations(component: str) -> dict[str, type | str]:
+    """Return the implementation of each provider of a component, including the entry points.
+
+    Parameters
+    ----------
+    component : str
+        component name, e.g. "equity_price".
+
+    Returns
+    -------
+    dict[str, type | str]
+        the class or "module:Class" path of each provider, keyed by provider name.
+    """
+    with _lock:
+        if not _entry_points_loaded:
+            _load_entry_points()
+        return {p: impl for (c, p), impl in _implementations.items() if c == component}
+
+
+def list_providers(component: str) -> list[str]:
+    """Return the sorted names of the providers of a component, including the entry points."""
+    return sorted(get_implementations(component))
+
+
+# Providers implemented by vietfin
+_BUILTIN_PROVIDERS = {
+    "funds": {
+        "fmarket": "vietfin.providers.fmarket.provider:FundsFmarket",
+    },
+    "funds_async": {
+        "fmarket": "vietfin.providers.fmarket.provider:FundsFmarketAsync",
+    },
+    "equity": {
+        "ssi": "vietfin.providers.ssi.provider:EquitySsi",
+        "wifeed": "vietfin.providers.wifeed.provider:EquityWifeed",
+        "tcbs": "vietfin.providers.tcbs.provider:EquityTcbs",
+    },
+    "equity_price": {
+        "dnse": "vietfin.providers.dnse.provider:EquityPriceDnse",
+        "tcbs": "vietfin.providers.tcbs.provider:EquityPriceTcbs",
+        "ssi": "vietfin.providers.ssi.provider:EquityPriceSsi",
+    },
+    "equity_price_async": {
+        "dnse": "vietfin.providers.dnse.provider:EquityPriceDnseAsync",
+        "tcbs": "vietfin.providers.tcbs.provider:EquityPriceTcbsAsync",
+        "ssi": "vietfin.providers.ssi.provider:EquityPriceSsiAsync",
+    },
+    "equity_ownership": {
+        "tcbs": "vietfin.providers.tcbs.provider:EquityOwnershipTcbs",
+        "cafef": "vietfin.providers.cafef.provider:EquityOwnershipCafef",
+    },
+    "equity_calendar": {
+        "tcbs": "vietfin.providers.tcbs.provider:EquityCalendarTcbs",
+    },
+    "equity_fundamental": {
+        "tcbs": "vietfin.providers.tcbs.provider:EquityFundamentalTcbs",
+        "ssi": "vietfin.providers.ssi.provider:EquityFundamentalSsi",
+    },
+    "equity_discovery": {
+        "ssi": "vietfin.providers.ssi.provider:EquityDiscoverySsi",
+        "vndirect": "vietfin.providers.vndirect.provider:EquityDiscoveryVndirect",
+    },
+    "derivatives_futures": {
+        "vdsc": "vietfin.providers.vdsc.provider:DerivativesFuturesVdsc",
+        "tcbs": "vietfin.providers.tcbs.provider:DerivativesFuturesTcbs",
+        "ssi": "vietfin.providers.ssi.provider:DerivativesFuturesSsi",
+    },
+    "derivatives_covered_warrant": {
+        "ssi": "vietfin.providers.ssi.provider:DerivativesCoveredWarrantSsi",
+    },
+    "index": {
+        "ssi": "vietfin.providers.ssi.provider:IndexSsi",
+    },
+    "index_price": {
+        "tcbs": "vietfin.providers.tcbs.provider:IndexPriceTcbs",
+        "dnse": "vietfin.providers.dnse.provider:IndexPriceDnse",
+    },
+    "etf": {
+        "dnse": "vietfin.providers.dnse.provider:EtfDnse",
+        "tcbs": "vietfin.providers.tcbs.provider:EtfTcbs",
+        "ssi": "vietfin.providers.ssi.provider:EtfSsi",
+    },
+    "news": {
+        "tcbs": "vietfin.providers.tcbs.provider:NewsTcbs",
+    },
+}
+
+for _component, _providers in _BUILTIN_PROVIDERS.items():
+    for _provider, _path in _providers.items():
+        register_provider(_component, _provider, _path)
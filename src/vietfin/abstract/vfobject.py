@@ -1,16 +1,19 @@
 """The VietFin Object."""
 
-from pydantic import BaseModel
+import sys
+from pydantic import BaseModel, PrivateAttr, field_validator
 from typing import Generic, TypeVar, Literal, Any, TYPE_CHECKING
-import pandas as pd
-from numpy import ndarray
 
 from vietfin.utils.errors import VietFinError
 from vietfin.utils.helpers import basemodel_to_df
+from vietfin.utils.raw_data import LazyRawData, apply_policy
 from vietfin.abstract.data import Data
 
 # Handles type hinting and conditionally imports DataFrame from polars library when to_polars() method is used.
 if TYPE_CHECKING:
+    import pandas as pd
+    from numpy import ndarray
+
     try:
         from polars import DataFrame as PolarsDataFrame  # type: ignore
     except ImportError:
@@ -19,6 +22,13 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
+def _is_dataframe(obj: Any) -> bool:
+    """Return True if obj is a pandas DataFrame, without importing pandas."""
+    # results are never a DataFrame before pandas is imported
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(obj, pd.DataFrame)
+
+
 class VfObject(BaseModel, Generic[T]):
     """VietFin Object.
 
@@ -40,12 +50,39 @@ class VfObject(BaseModel, Generic[T]):
     raw_data : dict | list[dict]
         Raw data returned by the API call.
         This is useful for users who want to parse the API response themselves.
+        What is kept depends on the raw data policy, see `vietfin.utils.raw_data`:
+        with the "lazy" policy, it is kept compressed and decoded on first access.
     """
 
     results: T | None
     provider: str | None
     extra: dict[str, Any] | None
-    raw_data: dict[Any, Any] | list[dict[Any, Any]] | None
+    raw_data: dict[Any, Any] | list[dict[Any, Any]] | LazyRawData | None
+
+    # DataFrames already built by to_df(), keyed by its (index, sort_by) arguments
+    _df_cache: dict[tuple[str | None, str | None], "pd.DataFrame"] = PrivateAttr(
+        default_factory=dict
+    )
+
+    @field_validator("raw_data", mode="before")
+    @classmethod
+    def apply_raw_data_policy(cls, v: Any) -> Any:
+        """Keep the raw data according to the raw data policy of the current context."""
+        return apply_policy(v)
+
+    def __getattribute__(self, name: str) -> Any:
+        """Decode the compressed raw data on first access."""
+        value = super().__getattribute__(name)
+        if name == "raw_data" and isinstance(value, LazyRawData):
+            value = value.load()
+            self.__dict__["raw_data"] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Drop the cached DataFrames when the results are replaced."""
+        if name == "results":
+            self._df_cache.clear()
+        super().__setattr__(name, value)
 
     def __repr__(self) -> str:
         """Human readable representation of the VietFin object."""
@@ -61,11 +98,22 @@ class VfObject(BaseModel, Generic[T]):
         Overloading the __len__() method to make the VietFin object behave like a list.
 
         """
+        res = self.results
+        if res is None:
+            return 0
+
+        # one row per element, no need to build the dataframe
+        if _is_dataframe(res) or (
+            isinstance(res, list)
+            and not (len(res) == 1 and isinstance(res[0], dict))
+        ):
+            return len(res)  # type: ignore  # a DataFrame, unknown to mypy without importing pandas
+
         return self.to_df().shape[0]  # number of rows in the dataframe
 
     def to_df(
         self, index: str | None = None, sort_by: str | None = None
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """Convert results field to pandas dataframe.
 
         Supports converting creating pandas DataFrames from the following
@@ -92,20 +140,37 @@ class VfObject(BaseModel, Generic[T]):
         -------
         pd.DataFrame
             Pandas dataframe.
+            The dataframe is built once, then cached until the results are replaced.
+            A copy of the cached dataframe is returned,
+            so altering the returned dataframe does not alter the cache.
 
         """
+        import pandas as pd  # pylint: disable=import-outside-toplevel
 
         def is_list_of_basemodel(items: list[T] | T) -> bool:
             return isinstance(items, list) and all(
                 isinstance(item, BaseModel) for item in items
             )
 
+        if isinstance(self.results, pd.DataFrame):
+            # A copy, as for the other results: the results are left unchanged
+            df = self.results.copy()
+            # Set index, if any
+            if index and index in df.columns:
+                df = df.set_index(index)
+            # Sort by specified column
+            if sort_by:
+                df = df.sort_values(by=sort_by)
+            return df
+
+        key = (index, sort_by)
+        cached = self._df_cache.get(key)
+        if cached is not None:
+            return cached.copy()
+
         if self.results is None or not self.results:
             raise VietFinError("Results not found.")
 
-        if isinstance(self.results, pd.DataFrame):
-            return self.results
-
         try:
             res = self.results
             df = pd.DataFrame()
@@ -173,9 +238,10 @@ class VfObject(BaseModel, Generic[T]):
         except Exception as ex:
             raise VietFinError(f"An unexpected error occurred: {ex}") from ex
 
-        return df
+        self._df_cache[key] = df
+        return df.copy()
 
-    def to_numpy(self) -> ndarray:
+    def to_numpy(self) -> "ndarray":
         """Convert results field to numpy array."""
         return self.to_df().reset_index().to_numpy()
 
@@ -206,8 +272,8 @@ class VfObject(BaseModel, Generic[T]):
             if not isinstance(self.results, dict):
                 transpose = False
             else:  # Only enter the loop if self.results is a dictionary
-                self.results: dict[str, Any] = self.results  # type: ignore
-                for _, value in self.results.items():
+                results: dict[str, Any] = self.results  # type: ignore
+                for _, value in results.items():
                     if not isinstance(value, dict):
                         transpose = False
                         break
@@ -0,0 +1,125 @@
+"""VietFin async group of commands.
+
+The commands mirror their sync counterparts of the same name, e.g.
+`await vf.aio.equity.price.historical(...)` is the async form of `vf.equity.price.historical(...)`.
+All commands of the async API share one pooled `httpx.AsyncClient` per provider host,
+so many symbols can be fetched concurrently on one event loop, e.g. with `asyncio.gather()`.
+"""
+
+from typing import Literal
+
+from vietfin.abstract.vfobject import VfObject
+from vietfin.abstract.registry import get_provider
+from vietfin.abstract.interface import IEquityPriceAsync, IFundsAsync
+from vietfin.utils.helpers import INTERVALS, RESULTS_FORMATS
+
+
+class AsyncEquityPrice:
+    """VietFin async Equity.Price-related group of commands.
+
+    This is the Client code in Factory Design Pattern.
+    """
+
+    # list of implemented providers
+    PROVIDERS = Literal["tcbs", "dnse", "ssi"]
+
+    @staticmethod
+    def _get_provider(provider: PROVIDERS) -> IEquityPriceAsync:
+        provider_name = provider.lower()
+        return get_provider("equity_price_async", provider_name)
+
+    async def historical(
+        self,
+        symbol: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        interval: INTERVALS = "1d",
+        provider: PROVIDERS = "tcbs",
+        results_format: RESULTS_FORMATS = "models",
+    ) -> VfObject:
+        """Equity Historical price. Load stock historical price data for a specific ticker."""
+
+        provider_instance = self._get_provider(provider)
+        return await provider_instance.historical(
+            symbol=symbol,
+            start_date=start_date,  # type: ignore
+            end_date=end_date,  # type: ignore
+            interval=interval,
+            results_format=results_format,
+        )
+
+    async def quote(
+        self, symbol: str, limit: int = 100, provider: PROVIDERS = "tcbs"
+    ) -> VfObject:
+        """Equity Quote. Load quote data for a specific ticker."""
+
+        provider_instance = self._get_provider(provider)
+        return await provider_instance.quote(
+            symbol=symbol,
+            limit=limit,
+        )
+
+
+class AsyncEquity:
+    """VietFin async Equity-related group of commands."""
+
+    def __init__(self) -> None:
+        self.price = AsyncEquityPrice()
+
+
+class AsyncFunds:
+    """VietFin async Funds-related group of commands.
+
+    This is the Client code in Factory Design Pattern.
+    """
+
+    # list of implemented providers
+    PROVIDERS = Literal["fmarket"]
+
+    @staticmethod
+    def _get_provider(provider: PROVIDERS) -> IFundsAsync:
+        provider_name = provider.lower()
+        return get_provider("funds_async", provider_name)
+
+    async def search(
+        self, symbol: str = "", provider: PROVIDERS = "fmarket"
+    ) -> VfObject:
+        """Funds Search. Search for a fund.
+
+        An empty query (by default) returns the list of all funds from selected provider.
+        """
+
+        provider_instance = self._get_provider(provider)
+        return await provider_instance.search(symbol=symbol)
+
+    async def historical(
+        self,
+        symbol: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        provider: PROVIDERS = "fmarket",
+    ) -> VfObject:
+        """Funds Historical price. Load historical NAV for a specific fund."""
+
+        provider_instance = self._get_provider(provider)
+        return await provider_instance.historical(
+            symbol=symbol,
+            start_date=start_date,  # type: ignore
+            end_date=end_date,  # type: ignore
+        )
+
+    async def holdings(
+        self, symbol: str, provider: PROVIDERS = "fmarket"
+    ) -> VfObject:
+        """Funds Holdings. Load the top 10 holdings for a specific fund."""
+
+        provider_instance = self._get_provider(provider)
+        return await provider_instance.holdings(symbol=symbol)
+
+
+class Aio:
+    """VietFin async group of commands, accessed as `vf.aio`."""
+
+    def __init__(self) -> None:
+        self.equity = AsyncEquity()
+        self.funds = AsyncFunds()
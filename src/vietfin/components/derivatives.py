@@ -1,12 +1,9 @@
 """VietFin Derivatives class."""
 
-from typing import Literal
+from typing import Iterator, Literal
 
 from vietfin.abstract.vfobject import VfObject
-from vietfin.abstract.factory import (
-    DerivativesFuturesFactory,
-    DerivativesCoveredWarrantFactory,
-)
+from vietfin.abstract.registry import get_provider
 from vietfin.abstract.interface import (
     IDerivativesFutures,
     IDerivativesCoveredWarrant,
@@ -30,7 +27,7 @@ class DerivativesFutures:
     @staticmethod
     def _get_provider(provider: PROVIDERS) -> IDerivativesFutures:
         provider_name = provider.lower()
-        return DerivativesFuturesFactory().get_provider(provider_name)
+        return get_provider("derivatives_futures", provider_name)
 
     def historical(
         self,
@@ -62,6 +59,21 @@ class DerivativesFutures:
             limit=limit,
         )
 
+    def iter_quote(
+        self,
+        symbol: str,
+        limit: int = 0,
+        provider: PROVIDERS = "ssi",
+    ) -> Iterator[list]:
+        """Futures Quote, streamed page by page.
+
+        Yield the quotes of each page as soon as it is fetched. The next page is only fetched
+        when the previous one is consumed. `limit=0` streams all the quotes of the day.
+        """
+
+        provider_instance = self._get_provider(provider)
+        return provider_instance.iter_quote(symbol=symbol, limit=limit)
+
     def search(self, symbol: str = "", provider: PROVIDERS = "ssi") -> VfObject:
         """Derivatives Futures Search. Search for a specific futures contract."""
 
@@ -78,7 +90,7 @@ class DerivativesCoveredWarrant:
     @staticmethod
     def _get_provider(provider: PROVIDERS) -> IDerivativesCoveredWarrant:
         provider_name = provider.lower()
-        return DerivativesCoveredWarrantFactory().get_provider(provider_name)
+        return get_provider("derivatives_covered_warrant", provider_name)
 
     def search(self, symbol: str = "", provider: PROVIDERS = "ssi") -> VfObject:
         """Derivatives Covered Warrant Search. Search for a specific covered warrant."""
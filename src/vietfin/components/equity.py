@@ -3,7 +3,7 @@
 from typing import Literal
 
 from vietfin.abstract.vfobject import VfObject
-from vietfin.abstract.factory import EquityFactory
+from vietfin.abstract.registry import get_provider
 from vietfin.abstract.interface import IEquity
 from vietfin.components.equity_price import EquityPrice
 from vietfin.components.equity_ownership import EquityOwnership
@@ -32,7 +32,7 @@ class Equity:
     @staticmethod
     def _get_provider(provider: PROVIDERS_S | PROVIDERS_P) -> IEquity:
         provider_name = provider.lower()
-        return EquityFactory().get_provider(provider_name)
+        return get_provider("equity", provider_name)
 
     def search(
         self, symbol: str = "", provider: PROVIDERS_S = "ssi"
@@ -1,9 +1,10 @@
 """VietFin Equity.Calendar class."""
 
-from typing import Literal
+from typing import Iterator, Literal
 
 from vietfin.abstract.vfobject import VfObject
-from vietfin.abstract.factory import EquityCalendarFactory
+from vietfin.abstract.registry import get_provider
+from vietfin.utils.pagination import DEFAULT_PREFETCH_WINDOW
 
 
 class EquityCalendar:
@@ -18,5 +19,23 @@ class EquityCalendar:
     ) -> VfObject:
         """Equity Calendar Events. Load Historical All-event-type Calendar data for a specific ticker."""
         provider_name = provider.lower()
-        provider_instance = EquityCalendarFactory().get_provider(provider_name)
+        provider_instance = get_provider("equity_calendar", provider_name)
         return provider_instance.events(symbol=symbol, limit=limit)
+
+    @staticmethod
+    def iter_events(
+        symbol: str,
+        limit: int = 0,
+        prefetch: int = DEFAULT_PREFETCH_WINDOW,
+        provider: PROVIDERS = "tcbs",
+    ) -> Iterator[list]:
+        """Equity Calendar Events, streamed page by page.
+
+        Yield the events of each page as soon as it is fetched, with at most `prefetch` pages
+        fetched ahead. `limit=0` streams all the events.
+        """
+        provider_name = provider.lower()
+        provider_instance = get_provider("equity_calendar", provider_name)
+        return provider_instance.iter_events(
+            symbol=symbol, limit=limit, prefetch=prefetch
+        )
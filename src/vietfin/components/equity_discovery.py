@@ -3,7 +3,7 @@
 from typing import Literal
 
 from vietfin.abstract.vfobject import VfObject
-from vietfin.abstract.factory import EquityDiscoveryFactory
+from vietfin.abstract.registry import get_provider
 from vietfin.abstract.interface import IEquityDiscovery
 from vietfin.utils.helpers import EXCHANGE_NAMES
 
@@ -17,7 +17,7 @@ class EquityDiscovery:
     @staticmethod
     def _get_provider(provider: PROVIDERS) -> IEquityDiscovery:
         provider_name = provider.lower()
-        return EquityDiscoveryFactory().get_provider(provider_name)
+        return get_provider("equity_discovery", provider_name)
 
     def active(
         self, exchange: EXCHANGE_NAMES = "hose", provider: PROVIDERS = "vndirect"
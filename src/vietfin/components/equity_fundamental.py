@@ -1,11 +1,18 @@
 """VietFin Equity.Fundamental class."""
 
-from typing import Literal
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Literal, Sequence
 
 from vietfin.abstract.vfobject import VfObject
-from vietfin.abstract.factory import EquityFundamentalFactory
+from vietfin.abstract.registry import get_provider
 from vietfin.abstract.interface import IEquityFundamental
-from vietfin.utils.helpers import PERIODS
+from vietfin.utils.errors import EmptyDataError
+from vietfin.utils.pagination import DEFAULT_PREFETCH_WINDOW
+from vietfin.utils.helpers import PERIODS, RESULTS_FORMATS, generate_extra_metadata
+from vietfin.utils.raw_data import raw_data_policy
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class EquityFundamental:
@@ -20,7 +27,7 @@ class EquityFundamental:
     @staticmethod
     def _get_provider(provider: PROVIDERS) -> IEquityFundamental:
         provider_name = provider.lower()
-        return EquityFundamentalFactory().get_provider(provider_name)
+        return get_provider("equity_fundamental", provider_name)
 
     def management(self, symbol: str, provider: PROVIDERS = "tcbs") -> VfObject:
         """Equity Fundamental Management. Load Key executives data for a specific ticker."""
@@ -47,35 +54,284 @@ class EquityFundamental:
         provider_instance = self._get_provider(provider)
         return provider_instance.dividends(symbol=symbol, limit=limit)
 
+    def iter_dividends(
+        self,
+        symbol: str,
+        limit: int = 0,
+        prefetch: int = DEFAULT_PREFETCH_WINDOW,
+        provider: PROVIDERS = "tcbs",
+    ) -> Iterator[list]:
+        """Equity Fundamental Dividends, streamed page by page.
+
+        Yield the dividends of each page as soon as it is fetched, with at most `prefetch` pages
+        fetched ahead. `limit=0` streams all the dividends.
+        """
+        provider_instance = self._get_provider(provider)
+        return provider_instance.iter_dividends(
+            symbol=symbol, limit=limit, prefetch=prefetch
+        )
+
     def income(
         self,
         symbol: str,
         period: PERIODS = "annual",
         provider: PROVIDERS = "tcbs",
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
-        """Equity Fundamental Income. Load Historical income statement data for a specific ticker."""
+        """Equity Fundamental Income. Load Historical income statement data for a specific ticker.
+
+        With `results_format="columns"`, the results are a long pandas DataFrame,
+        one row per line item and fiscal period, instead of one data model per row.
+        Faster for large results.
+        """
 
         provider_instance = self._get_provider(provider)
-        return provider_instance.income(symbol=symbol, period=period)
+        return provider_instance.income(
+            symbol=symbol, period=period, results_format=results_format
+        )
 
     def balance(
         self,
         symbol: str,
         period: PERIODS = "annual",
         provider: PROVIDERS = "tcbs",
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
-        """Equity Fundamental Balance. Load Historical balance sheet statement data for a specific ticker."""
+        """Equity Fundamental Balance. Load Historical balance sheet statement data for a specific ticker.
+
+        See income() for `results_format`.
+        """
 
         provider_instance = self._get_provider(provider)
-        return provider_instance.balance(symbol=symbol, period=period)
+        return provider_instance.balance(
+            symbol=symbol, period=period, results_format=results_format
+        )
 
     def cash(
         self,
         symbol: str,
         period: PERIODS = "annual",
         provider: PROVIDERS = "tcbs",
+        results_format: RESULTS_FORMATS = "models",
+    ) -> VfObject:
+        """Equity Fundamental Cash. Load Historical cash flow statement data for a specific ticker.
+
+        See income() for `results_format`.
+        """
+
+        provider_instance = self._get_provider(provider)
+        return provider_instance.cash(
+            symbol=symbol, period=period, results_format=results_format
+        )
+
+    def statements(
+        self,
+        symbol: str,
+        period: PERIODS = "annual",
+        provider: PROVIDERS = "tcbs",
+    ) -> VfObject:
+        """Equity Fundamental Statements. Load the income, balance sheet and cash flow statements of a ticker at once.
+
+        The three statements are fetched concurrently, and the lookups they share are done once,
+        e.g. the organization code of the ticker for `ssi`.
+        A statement that fails (e.g. no data) does not stop the others, its error is reported in `extra["errors"]`.
+
+        Returns
+        -------
+        VfObject
+            results : pd.DataFrame
+                long-format data of the statements, with a column `statement` ("income", "balance" or "cash"),
+                then the columns of `results_format="columns"` of income(), balance() and cash().
+            provider : str
+                provider name
+            extra : dict
+                extra metadata about the command run, including:
+                statements : list[str]
+                    the statements retrieved.
+                errors : dict[str, str]
+                    the error message of each statement that failed.
+            raw_data : dict
+                raw data of each statement, keyed by statement name.
+        """
+
+        provider_name = provider.lower()
+        provider_instance = self._get_provider(provider)
+        symbol = symbol.upper()
+
+        # the statements are stacked into a dataframe, no need for data models
+        results, errors = provider_instance.statements(
+            symbol=symbol, period=period, results_format="columns"
+        )
+
+        if not results:
+            raise EmptyDataError(
+                f"No data found for any financial statement of {symbol}. Errors: {errors}"
+            )
+
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        # Stack the results of all statements into a single long-format dataframe
+        frames = []
+        for name, result in results.items():
+            df = result.to_df().reset_index(drop=True)
+            df.insert(0, "statement", name)
+            frames.append(df)
+        df = pd.concat(frames, ignore_index=True)
+
+        # Additional metadata about the command run
+        extra = generate_extra_metadata(
+            symbol=symbol,
+            result=df,  # type: ignore
+            api_url=[
+                (result.extra or {}).get("api_url", "") for result in results.values()
+            ],
+        )
+        extra["statements"] = list(results)
+        extra["errors"] = {
+            name: f"{type(ex).__name__}: {ex}" for name, ex in errors.items()
+        }
+
+        print(
+            f"Retrieved {extra.get('records_count',[])} data point for {len(results)} financial statements of stock ticker {symbol}, {len(errors)} statements failed."
+        )
+
+        return VfObject(
+            results=df,
+            provider=provider_name,
+            extra=extra,
+            raw_data={name: result.raw_data for name, result in results.items()},
+        )
+
+    def panel(
+        self,
+        path: str | Path,
+        symbols: list[str] | None = None,
+        period: PERIODS = "annual",
+        provider: PROVIDERS = "tcbs",
+        datasets: Sequence[str] | None = None,
+        max_workers: int = 8,
+        partition_size: int = 50,
+        search_provider: Literal["ssi", "wifeed"] = "ssi",
     ) -> VfObject:
-        """Equity Fundamental Cash. Load Historical cash flow statement data for a specific ticker."""
+        """Equity Fundamental Panel. Build a dataset of the ratios and financial statements of many tickers.
+
+        The dataset is a single long-format table with columns: symbol, dataset, period,
+        fiscal_period, item, value, written to the directory `path` a partition of
+        `partition_size` tickers at a time, see `vietfin.utils.fundamentals_panel`.
+        The tickers are fetched concurrently by a pool of `max_workers` threads, within the
+        rate limits of the provider hosts, and without keeping their raw data.
 
+        The tickers already written to `path` are skipped, so a rerun resumes an interrupted build.
+        A ticker without data, or not found by the provider, is written without rows.
+        A ticker that fails (e.g. a network error) is not written, and is fetched again by the next run.
+        Read the dataset with `vietfin.utils.fundamentals_panel.read_panel(path)`.
+
+        Parameters
+        ----------
+        path : str | Path
+            directory of the dataset.
+        symbols : list[str] | None
+            tickers of the panel. Default to all the listed companies, from `equity.search()`.
+        datasets : Sequence[str] | None
+            any of "ratios", "income", "balance", "cash". Default to all of them.
+            A dataset not supported by the provider, e.g. "ratios" from ssi, raises NotImplementedError.
+        search_provider : Literal["ssi", "wifeed"]
+            provider of `equity.search()` listing the companies, if symbols is None. Default "ssi".
+
+        Returns
+        -------
+        VfObject
+            results : pd.DataFrame
+                status of each ticker, with columns: symbol, status ("written", "skipped" or "failed"),
+                partition and errors.
+            provider : str
+                provider name
+            extra : dict
+                extra metadata about the command run, including:
+                path : str
+                    directory of the dataset.
+                errors : dict[str, dict[str, str]]
+                    the error messages of each ticker that failed, keyed by dataset.
+            raw_data : None
+        """
+
+        # the panel builder loads pandas and NumPy, only when used
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        from vietfin.utils.fundamentals_panel import (  # pylint: disable=import-outside-toplevel
+            PANEL_COLUMNS,
+            PANEL_DATASETS,
+            build_panel,
+            ratios_to_panel,
+            statement_to_panel,
+        )
+
+        provider_name = provider.lower()
         provider_instance = self._get_provider(provider)
-        return provider_instance.cash(symbol=symbol, period=period)
+        datasets = PANEL_DATASETS if datasets is None else datasets
+        unknown = set(datasets) - set(PANEL_DATASETS)
+        if unknown:
+            raise ValueError(
+                f"Invalid datasets: {sorted(unknown)}. Valid datasets: {', '.join(PANEL_DATASETS)}."
+            )
+        statements = [d for d in datasets if d != "ratios"]
+
+        if symbols is None:
+            listed = get_provider("equity", search_provider.lower()).search(symbol="")
+            symbols = [r.symbol for r in listed.results]
+
+        def fetch(symbol: str) -> tuple["pd.DataFrame", dict[str, Exception]]:
+            frames, errors = [], {}
+            if "ratios" in datasets:
+                try:
+                    result = provider_instance.ratios(symbol=symbol, period=period)
+                    df = pd.DataFrame([r.model_dump() for r in result.results or []])
+                    frames.append(ratios_to_panel(df, symbol))
+                except Exception as ex:
+                    errors["ratios"] = ex
+            if statements:
+                try:
+                    results, failures = provider_instance.statements(
+                        symbol=symbol, period=period, results_format="columns"
+                    )
+                except Exception as ex:
+                    # a lookup shared by the statements failed, e.g. the ticker is not found
+                    results, failures = {}, {name: ex for name in statements}
+                for name in statements:
+                    if name in results:
+                        df = results[name].to_df()
+                        frames.append(statement_to_panel(df, symbol, name))
+                    else:
+                        errors[name] = failures[name]
+            df = pd.concat(frames) if frames else pd.DataFrame(columns=PANEL_COLUMNS)
+            return df, errors
+
+        # the panel rows are written to disk, the raw data of the calls is not needed
+        # no provider concurrency cap on the tickers: statements() may hold slots of it
+        with raw_data_policy("none"):
+            status = build_panel(
+                path,
+                symbols,
+                fetch,
+                params={
+                    "period": period,
+                    "provider": provider_name,
+                    "datasets": list(datasets),
+                },
+                max_workers=max_workers,
+                partition_size=partition_size,
+            )
+
+        # Additional metadata about the command run
+        extra = generate_extra_metadata(result=status)  # type: ignore
+        extra["path"] = str(path)
+        failed = status[status["status"] == "failed"]
+        extra["errors"] = dict(zip(failed["symbol"], failed["errors"]))
+
+        print(
+            f"Fundamentals panel in {path}: {(status['status'] != 'failed').sum()} symbols done, {len(failed)} symbols failed."
+        )
+
+        return VfObject(
+            results=status, provider=provider_name, extra=extra, raw_data=None
+        )
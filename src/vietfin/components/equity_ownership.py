@@ -1,10 +1,11 @@
 """VietFin Equity.Ownership class."""
 
-from typing import Literal
+from typing import Iterator, Literal
 
 from vietfin.abstract.vfobject import VfObject
-from vietfin.abstract.factory import EquityOwnershipFactory
+from vietfin.abstract.registry import get_provider
 from vietfin.abstract.interface import IEquityOwnership
+from vietfin.utils.pagination import DEFAULT_PREFETCH_WINDOW
 
 
 class EquityOwnership:
@@ -19,7 +20,7 @@ class EquityOwnership:
     @staticmethod
     def _get_provider(provider: PROVIDERS) -> IEquityOwnership:
         provider_name = provider.lower()
-        return EquityOwnershipFactory().get_provider(provider_name)
+        return get_provider("equity_ownership", provider_name)
 
     def insider_trading(
         self, symbol: str, limit: int = 100, provider: PROVIDERS = "tcbs"
@@ -60,3 +61,45 @@ class EquityOwnership:
         return provider_instance.prop_trading(
             symbol=symbol, start_date=start_date, end_date=end_date
         )
+
+    def iter_foreign_trading(
+        self,
+        symbol: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        prefetch: int = DEFAULT_PREFETCH_WINDOW,
+        provider: PROVIDERS = "cafef",
+    ) -> Iterator[list]:
+        """Equity Ownership Foreign Trading, streamed page by page.
+
+        Yield the trading data of each page as soon as it is fetched, with at most `prefetch` pages
+        fetched ahead.
+        """
+        provider_instance = self._get_provider(provider)
+        return provider_instance.iter_foreign_trading(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            prefetch=prefetch,
+        )
+
+    def iter_prop_trading(
+        self,
+        symbol: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        prefetch: int = DEFAULT_PREFETCH_WINDOW,
+        provider: PROVIDERS = "cafef",
+    ) -> Iterator[list]:
+        """Equity Ownership Proprietary trading, streamed page by page.
+
+        Yield the trading data of each page as soon as it is fetched, with at most `prefetch` pages
+        fetched ahead.
+        """
+        provider_instance = self._get_provider(provider)
+        return provider_instance.iter_prop_trading(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            prefetch=prefetch,
+        )
@@ -1,11 +1,19 @@
 """VietFin Equity.Price class."""
 
-from typing import Literal
+import contextlib
+import io
+from typing import Iterator, Literal
 
 from vietfin.abstract.vfobject import VfObject
-from vietfin.abstract.factory import EquityPriceFactory
+from vietfin.abstract.registry import get_provider
 from vietfin.abstract.interface import IEquityPrice
-from vietfin.utils.helpers import INTERVALS
+from vietfin.utils.errors import EmptyDataError
+from vietfin.utils.pagination import DEFAULT_PREFETCH_WINDOW
+from vietfin.utils.helpers import (
+    INTERVALS,
+    RESULTS_FORMATS,
+    generate_extra_metadata,
+)
 
 
 class EquityPrice:
@@ -20,7 +28,7 @@ class EquityPrice:
     @staticmethod
     def _get_provider(provider: PROVIDERS) -> IEquityPrice:
         provider_name = provider.lower()
-        return EquityPriceFactory().get_provider(provider_name)
+        return get_provider("equity_price", provider_name)
 
     def historical(
         self,
@@ -29,15 +37,144 @@ class EquityPrice:
         end_date: str | None = None,
         interval: INTERVALS = "1d",
         provider: PROVIDERS = "tcbs",
+        cache: bool = False,
+        results_format: RESULTS_FORMATS | None = None,
     ) -> VfObject:
-        """Equity Historical price. Load stock historical price data for a specific ticker."""
+        """Equity Historical price. Load stock historical price data for a specific ticker.
+
+        With `cache=True`, the daily bars are kept in a local store, and only the bars
+        missing from the store are fetched from the provider, see `vietfin.utils.bar_store`.
+        The results are then a pandas DataFrame indexed by date, so `results_format` must be "columns".
+
+        With `results_format="columns"`, the results are a pandas DataFrame indexed by date,
+        validated column by column instead of one data model per row. Faster for large results.
+        Default to "models", or "columns" with `cache=True`.
+        """
 
         provider_instance = self._get_provider(provider)
+
+        if cache:
+            if results_format not in (None, "columns"):
+                raise ValueError(
+                    f'Invalid results_format: {results_format}. The cache only supports results_format: "columns".'
+                )
+
+            # the local store loads sqlite3 and pandas, only when used
+            from vietfin.utils.bar_store import cached_historical  # pylint: disable=import-outside-toplevel
+
+            return cached_historical(
+                lambda start, end: provider_instance.historical(
+                    symbol=symbol,
+                    start_date=start,
+                    end_date=end,
+                    interval=interval,
+                    results_format="columns",
+                ),
+                provider=provider,
+                asset_type="equity",
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                interval=interval,
+            )
+
         return provider_instance.historical(
             symbol=symbol,
             start_date=start_date,  # type: ignore
             end_date=end_date,  # type: ignore
             interval=interval,
+            results_format=results_format or "models",
+        )
+
+    def historical_many(
+        self,
+        symbols: list[str],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        interval: INTERVALS = "1d",
+        provider: PROVIDERS = "tcbs",
+        max_workers: int = 8,
+        cache: bool = False,
+    ) -> VfObject:
+        """Equity Historical price of many tickers. Load stock historical price data for a list of tickers.
+
+        The tickers are fetched concurrently by a pool of `max_workers` threads,
+        while the number of requests in flight to the provider stays within the `max_concurrency` of its host,
+        see `vietfin.utils.ratelimit.set_host_limit()`.
+        A ticker that fails (e.g. no data) does not stop the others, its error is reported in `extra["errors"]`.
+        Only a summary of the batch is printed, not the message of each ticker.
+        With `cache=True`, each ticker is loaded through the local bar store, see `historical()`.
+
+        Returns
+        -------
+        VfObject
+            results : pd.DataFrame
+                long-format historical price data, with columns: symbol, date, open, high, low, close, volume.
+            provider : str
+                provider name
+            extra : dict
+                extra metadata about the command run, including:
+                errors : dict[str, str]
+                    the error message of each ticker that failed.
+            raw_data : None
+
+        Raises
+        ------
+        EmptyDataError
+            if every ticker failed, with the exception of each ticker in its `errors` attribute.
+        """
+
+        provider_name = provider.lower()
+        self._get_provider(provider)  # fail fast on an unknown provider
+        symbols = [s.upper() for s in symbols]
+
+        def fetch(symbol: str) -> VfObject:
+            return self.historical(
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                interval=interval,
+                provider=provider,
+                cache=cache,
+                # the results are stacked into a dataframe, no need for data models
+                results_format="columns",
+            )
+
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        from vietfin.utils.concurrency import run_concurrently  # pylint: disable=import-outside-toplevel
+
+        # silence the message printed by the command of each ticker, the batch prints its own summary
+        with contextlib.redirect_stdout(io.StringIO()):
+            results, errors = run_concurrently(fetch, symbols, max_workers=max_workers)
+
+        if not results:
+            raise EmptyDataError(
+                f"No data found for any of the {len(symbols)} symbols. Errors: {errors}",
+                errors=errors,
+            )
+
+        # Stack the results of all tickers into a single long-format dataframe
+        frames = []
+        for symbol, result in results.items():
+            df = result.to_df().reset_index()
+            df.insert(0, "symbol", symbol)
+            frames.append(df)
+        df = pd.concat(frames, ignore_index=True)
+
+        # Additional metadata about the command run
+        extra = generate_extra_metadata(result=df)  # type: ignore
+        extra["symbols"] = list(results)
+        extra["errors"] = {
+            symbol: f"{type(ex).__name__}: {ex}" for symbol, ex in errors.items()
+        }
+
+        print(
+            f"Retrieved {extra.get('records_count',[])} historical price data point for {len(results)} symbols, {len(errors)} symbols failed."
+        )
+
+        return VfObject(
+            results=df, provider=provider_name, extra=extra, raw_data=None
         )
 
     def quote(
@@ -50,3 +187,21 @@ class EquityPrice:
             symbol=symbol,
             limit=limit,
         )
+
+    def iter_quote(
+        self,
+        symbol: str,
+        limit: int = 0,
+        prefetch: int = DEFAULT_PREFETCH_WINDOW,
+        provider: PROVIDERS = "tcbs",
+    ) -> Iterator[list]:
+        """Equity Quote, streamed page by page.
+
+        Yield the quotes of each page as soon as it is fetched, with at most `prefetch` pages
+        fetched ahead. `limit=0` streams all the quotes of the day.
+        """
+
+        provider_instance = self._get_provider(provider)
+        return provider_instance.iter_quote(
+            symbol=symbol, limit=limit, prefetch=prefetch
+        )
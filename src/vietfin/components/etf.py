@@ -3,9 +3,9 @@
 from typing import Literal
 
 from vietfin.abstract.vfobject import VfObject
-from vietfin.abstract.factory import EtfFactory
+from vietfin.abstract.registry import get_provider
 from vietfin.abstract.interface import IEtf
-from vietfin.utils.helpers import INTERVALS
+from vietfin.utils.helpers import INTERVALS, RESULTS_FORMATS
 
 
 class Etf:
@@ -17,7 +17,7 @@ class Etf:
     @staticmethod
     def _get_provider(provider: PROVIDERS) -> IEtf:
         provider_name = provider.lower()
-        return EtfFactory().get_provider(provider_name)
+        return get_provider("etf", provider_name)
 
     def historical(
         self,
@@ -26,15 +26,53 @@ class Etf:
         end_date: str | None = None,
         interval: INTERVALS = "1d",
         provider: PROVIDERS = "ssi",
+        cache: bool = False,
+        results_format: RESULTS_FORMATS | None = None,
     ) -> VfObject:
-        """ETF Historical price. Load historical price data of a specific ETF ticker."""
+        """ETF Historical price. Load historical price data of a specific ETF ticker.
+
+        With `cache=True`, the daily bars are kept in a local store, and only the bars
+        missing from the store are fetched from the provider, see `vietfin.utils.bar_store`.
+        The results are then a pandas DataFrame indexed by date, so `results_format` must be "columns".
+
+        With `results_format="columns"`, the results are a pandas DataFrame indexed by date,
+        validated column by column instead of one data model per row. Faster for large results.
+        Default to "models", or "columns" with `cache=True`.
+        """
 
         provider_instance = self._get_provider(provider)
+
+        if cache:
+            if results_format not in (None, "columns"):
+                raise ValueError(
+                    f'Invalid results_format: {results_format}. The cache only supports results_format: "columns".'
+                )
+
+            # the local store loads sqlite3 and pandas, only when used
+            from vietfin.utils.bar_store import cached_historical  # pylint: disable=import-outside-toplevel
+
+            return cached_historical(
+                lambda start, end: provider_instance.historical(
+                    symbol=symbol,
+                    start_date=start,
+                    end_date=end,
+                    interval=interval,
+                    results_format="columns",
+                ),
+                provider=provider,
+                asset_type="etf",
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                interval=interval,
+            )
+
         return provider_instance.historical(
             symbol=symbol,
             start_date=start_date,  # type: ignore
             end_date=end_date,  # type: ignore
             interval=interval,
+            results_format=results_format or "models",
         )
 
     def search(
@@ -3,7 +3,7 @@
 from typing import Literal
 
 from vietfin.abstract.vfobject import VfObject
-from vietfin.abstract.factory import FundsFactory
+from vietfin.abstract.registry import get_provider
 from vietfin.abstract.interface import IFunds
 
 
@@ -19,7 +19,7 @@ class Funds:
     @staticmethod
     def _get_provider(provider: PROVIDERS) -> IFunds:
         provider_name = provider.lower()
-        return FundsFactory().get_provider(provider_name)
+        return get_provider("funds", provider_name)
 
     def search(
         self, symbol: str = "", provider: PROVIDERS = "fmarket"
@@ -3,9 +3,9 @@
 from typing import Literal
 
 from vietfin.abstract.vfobject import VfObject
-from vietfin.abstract.factory import IndexFactory, IndexPriceFactory
+from vietfin.abstract.registry import get_provider
 from vietfin.abstract.interface import IIndex, IIndexPrice
-from vietfin.utils.helpers import INTERVALS
+from vietfin.utils.helpers import INTERVALS, RESULTS_FORMATS
 
 
 class IndexPrice:
@@ -17,7 +17,7 @@ class IndexPrice:
     @staticmethod
     def _get_provider(provider: PROVIDERS) -> IIndexPrice:
         provider_name = provider.lower()
-        return IndexPriceFactory().get_provider(provider_name)
+        return get_provider("index_price", provider_name)
 
     def historical(
         self,
@@ -26,15 +26,53 @@ class IndexPrice:
         end_date: str | None = None,
         interval: INTERVALS = "1d",
         provider: PROVIDERS = "tcbs",
+        cache: bool = False,
+        results_format: RESULTS_FORMATS | None = None,
     ) -> VfObject:
-        """Index Historical price. Load historical price data for a specific index."""
+        """Index Historical price. Load historical price data for a specific index.
+
+        With `cache=True`, the daily bars are kept in a local store, and only the bars
+        missing from the store are fetched from the provider, see `vietfin.utils.bar_store`.
+        The results are then a pandas DataFrame indexed by date, so `results_format` must be "columns".
+
+        With `results_format="columns"`, the results are a pandas DataFrame indexed by date,
+        validated column by column instead of one data model per row. Faster for large results.
+        Default to "models", or "columns" with `cache=True`.
+        """
 
         provider_instance = self._get_provider(provider)
+
+        if cache:
+            if results_format not in (None, "columns"):
+                raise ValueError(
+                    f'Invalid results_format: {results_format}. The cache only supports results_format: "columns".'
+                )
+
+            # the local store loads sqlite3 and pandas, only when used
+            from vietfin.utils.bar_store import cached_historical  # pylint: disable=import-outside-toplevel
+
+            return cached_historical(
+                lambda start, end: provider_instance.historical(
+                    symbol=symbol,
+                    start_date=start,
+                    end_date=end,
+                    interval=interval,
+                    results_format="columns",
+                ),
+                provider=provider,
+                asset_type="index",
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                interval=interval,
+            )
+
         return provider_instance.historical(
             symbol=symbol,
             start_date=start_date,  # type: ignore
             end_date=end_date,  # type: ignore
             interval=interval,
+            results_format=results_format or "models",
         )
 
 
@@ -53,7 +91,7 @@ class Index:
     @staticmethod
     def _get_provider(provider: PROVIDERS) -> IIndex:
         provider_name = provider.lower()
-        return IndexFactory().get_provider(provider_name)
+        return get_provider("index", provider_name)
 
     def search(self, symbol: str = "", provider: PROVIDERS = "ssi") -> VfObject:
         """Index Search. Search for an index.
@@ -1,10 +1,11 @@
 """VietFin News class."""
 
-from typing import Literal
+from typing import Iterator, Literal
 
 from vietfin.abstract.vfobject import VfObject
-from vietfin.abstract.factory import NewsFactory
+from vietfin.abstract.registry import get_provider
 from vietfin.abstract.interface import INews
+from vietfin.utils.pagination import DEFAULT_PREFETCH_WINDOW
 
 
 class News:
@@ -19,7 +20,7 @@ class News:
     @staticmethod
     def _get_provider(provider: PROVIDERS) -> INews:
         provider_name = provider.lower()
-        return NewsFactory().get_provider(provider_name)
+        return get_provider("news", provider_name)
 
     def company(
         self, symbol: str, limit: int = 100, provider: PROVIDERS = "tcbs"
@@ -28,3 +29,21 @@ class News:
 
         provider_instance = self._get_provider(provider)
         return provider_instance.company(symbol=symbol, limit=limit)
+
+    def iter_company(
+        self,
+        symbol: str,
+        limit: int = 0,
+        prefetch: int = DEFAULT_PREFETCH_WINDOW,
+        provider: PROVIDERS = "tcbs",
+    ) -> Iterator[list]:
+        """News Company, streamed page by page.
+
+        Yield the news of each page as soon as it is fetched, with at most `prefetch` pages
+        fetched ahead. `limit=0` streams all the news.
+        """
+
+        provider_instance = self._get_provider(provider)
+        return provider_instance.iter_company(
+            symbol=symbol, limit=limit, prefetch=prefetch
+        )
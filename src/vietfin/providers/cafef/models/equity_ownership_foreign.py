@@ -46,7 +46,8 @@ class CafefEquityOwnershipForeignTradingData(Data):
         """
 
         if isinstance(data, dict):
-            data["Ngay"] = datetime.strptime(data["Ngay"], "%d/%m/%Y").date()
+            # a new dict, the raw data of the caller is left unchanged
+            data = {**data, "Ngay": datetime.strptime(data["Ngay"], "%d/%m/%Y").date()}
 
             # Use regular expressions to extract close_price, percent_change and add them as two new keys to the data dict.
             match = re.match(r'([\d.]+)\(([-\d.]+) %\)', data["ThayDoi"])
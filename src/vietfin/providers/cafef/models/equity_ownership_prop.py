@@ -36,6 +36,7 @@ class CafefEquityOwnershipPropTradingData(Data):
         """
 
         if isinstance(data, dict):
-            data["Date"] = datetime.strptime(data["Date"], "%d/%m/%Y").date()
+            # a new dict, the raw data of the caller is left unchanged
+            data = {**data, "Date": datetime.strptime(data["Date"], "%d/%m/%Y").date()}
 
         return data
@@ -1,11 +1,16 @@
 """Cafef provider concrete class."""
 
+from typing import Iterator
+
 from vietfin.abstract.interface import (
     IEquityOwnership,
 )
 from vietfin.abstract.vfobject import VfObject
-from vietfin.providers.cafef.utils.equity_ownership_foreign import foreign
-from vietfin.providers.cafef.utils.equity_ownership_prop import prop
+from vietfin.providers.cafef.utils.equity_ownership_foreign import (
+    foreign,
+    iter_foreign,
+)
+from vietfin.providers.cafef.utils.equity_ownership_prop import prop, iter_prop
 
 
 class EquityOwnershipCafef(IEquityOwnership):
@@ -34,3 +39,25 @@ class EquityOwnershipCafef(IEquityOwnership):
     ) -> VfObject:
         """Equity Ownership Proprietary trading. Load the trading data of proprietary trading firms for a specific ticker."""
         return prop(symbol=symbol, start_date=start_date, end_date=end_date)
+
+    def iter_foreign_trading(
+        self, symbol: str, start_date: str, end_date: str, prefetch: int
+    ) -> Iterator[list]:
+        """Equity Ownership Foreign Trading, streamed page by page."""
+        return iter_foreign(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            prefetch=prefetch,
+        )
+
+    def iter_prop_trading(
+        self, symbol: str, start_date: str, end_date: str, prefetch: int
+    ) -> Iterator[list]:
+        """Equity Ownership Proprietary trading, streamed page by page."""
+        return iter_prop(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            prefetch=prefetch,
+        )
@@ -1,7 +1,9 @@
 # """Cafef Equity Ownership Foreign Trading command."""
 
-import httpx as requests
+from typing import Iterator
 
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.cafef.utils.helpers import cafef_headers
 from vietfin.providers.cafef.models.equity_ownership_foreign import (
     CafefEquityOwnershipForeignTradingData,
@@ -14,6 +16,34 @@ from vietfin.utils.helpers import (
     BaseOtherParams,
 )
 from vietfin.utils.errors import EmptyDataError
+from vietfin.utils.pagination import (
+    DEFAULT_PREFETCH_WINDOW,
+    fetch_pages,
+    iter_pages,
+)
+
+
+# API logic: number of records per page
+PAGE_SIZE = 20
+
+
+def _get_rows(data_chunk: dict) -> list[dict]:
+    """Return the records of a page."""
+    return data_chunk.get("Data", {}).get("Data", [])
+
+
+def _page_fetcher(symbol: str, start_date: str, end_date: str):
+    """Return the function fetching a page of records, the 1st page being page 0."""
+    page_size = PAGE_SIZE
+
+    def fetch_page(page: int) -> tuple[str, dict]:
+        # API logic: the 1st page is PageIndex=1
+        url = f"https://s.cafef.vn/Ajax/PageNew/DataHistory/GDKhoiNgoai.ashx?Symbol={symbol}&StartDate={start_date}&EndDate={end_date}&PageIndex={page + 1}&PageSize={page_size}"
+        response = http.get(url, headers=cafef_headers)
+        check_response_error(response)
+        return url, response_json(response)
+
+    return fetch_page
 
 
 def foreign(
@@ -60,39 +90,21 @@ def foreign(
         start_date=start_date,
         end_date=end_date,
     )
-    start_date = params.start_date  # type: ignore
-    end_date = params.end_date  # type: ignore
+    # the validators always set both dates
+    start_date, end_date = str(params.start_date), str(params.end_date)
 
     other_params = BaseOtherParams(symbol=symbol)
     symbol = other_params.symbol
 
-    # API call
-    page_index = 1
-    page_size = 20
-    trading_data = []
-    url_list = []
-    data = []
-
-    while True:
-        url = f"https://s.cafef.vn/Ajax/PageNew/DataHistory/GDKhoiNgoai.ashx?Symbol={symbol}&StartDate={start_date}&EndDate={end_date}&PageIndex={page_index}&PageSize={page_size}"
-        response = requests.get(url, headers=cafef_headers)
-        check_response_error(response)
-        data_chunk = response.json()
-        rows = data_chunk.get("Data", {}).get("Data", [])
-
-        if not rows:
-            break  # stop if no more data
-
-        url_list.append(url)
-        data.append(data_chunk)
-
-        # Unpack dictionary to data model and return the results
-        trading_data.extend(
-            [CafefEquityOwnershipForeignTradingData(**r) for r in rows]
-        )
+    # API call: the pages after the 1st one are fetched concurrently
+    url_list, data, rows = fetch_pages(
+        _page_fetcher(symbol, start_date, end_date),
+        _get_rows,
+        page_size=PAGE_SIZE,
+    )
 
-        # increment page_index to continue fetching until no more data
-        page_index += 1
+    # Unpack dictionary to data model and return the results
+    trading_data = CafefEquityOwnershipForeignTradingData.validate_many(rows)
 
     if not trading_data:
         raise EmptyDataError
@@ -114,3 +126,53 @@ def foreign(
         extra=extra,
         raw_data=data,
     )
+
+
+def iter_foreign(
+    symbol: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    prefetch: int = DEFAULT_PREFETCH_WINDOW,
+) -> Iterator[list[CafefEquityOwnershipForeignTradingData]]:
+    """Stream Equity Ownership Foreign Trading data of a specific ticker from CafeF provider, page by page.
+
+    Unlike foreign(), the pages are not accumulated in memory: each page is parsed and yielded
+    as soon as it arrives, and no more than `prefetch` pages are fetched ahead of the consumer.
+    Stopping the iteration (e.g. `break`) stops fetching pages.
+
+    Paramaters
+    ----------
+    symbol : str
+        stock/index ticker
+    start_date : str
+        start date string in YYYY-MM-DD format
+    end_date : str
+        end date string in YYYY-MM-DD format
+    prefetch : int
+        maximum number of pages fetched ahead of the consumer. Default 4.
+
+    Yields
+    ------
+    list[CafefEquityOwnershipForeignTradingData]
+        foreign trading data of each page, in order. Nothing is yielded if there is no data.
+
+    Raises
+    ------
+    HttpError
+        if an API call failed
+    ValidationError
+        if the input param are invalid
+    """
+    # Validate input param
+    params = BaseDateParams(start_date=start_date, end_date=end_date)
+    symbol = BaseOtherParams(symbol=symbol).symbol
+
+    pages = iter_pages(
+        _page_fetcher(symbol, str(params.start_date), str(params.end_date)),
+        _get_rows,
+        page_size=PAGE_SIZE,
+        window=prefetch,
+    )
+    return (
+        CafefEquityOwnershipForeignTradingData.validate_many(rows) for _, _, rows in pages
+    )
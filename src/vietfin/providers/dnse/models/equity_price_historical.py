@@ -32,7 +32,8 @@ class DnseEquityHistoricalPriceData(Data):
     def parse_unix_timestamp(cls, data: Any) -> Any:
         """Before model validators are applied, parse the raw input, convert the value of `t` key from unix timestamp to date."""
         if isinstance(data, dict):
-            data["t"] = datetime.fromtimestamp(data["t"], tz=timezone.utc).date()
+            # a new dict, the raw data of the caller is left unchanged
+            data = {**data, "t": datetime.fromtimestamp(data["t"], tz=timezone.utc).date()}
         return data
 
     @field_validator("open", "high", "low", "close")
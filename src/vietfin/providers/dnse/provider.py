@@ -1,15 +1,29 @@
 """Dnse provider concrete class."""
 
-from vietfin.abstract.interface import IEquityPrice, IEtf, IIndexPrice
+from vietfin.abstract.interface import (
+    IEquityPrice,
+    IEquityPriceAsync,
+    IEtf,
+    IIndexPrice,
+)
 from vietfin.abstract.vfobject import VfObject
-from vietfin.providers.dnse.utils.equity_price_historical import historical
+from vietfin.utils.helpers import RESULTS_FORMATS
+from vietfin.providers.dnse.utils.equity_price_historical import (
+    historical,
+    historical_async,
+)
 
 
 class EquityPriceDnse(IEquityPrice):
     """The concrete implementation of Equity.Price component with Dnse as provider."""
 
     def historical(
-        self, symbol: str, start_date: str, end_date: str, interval: str
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: str,
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
         """Equity Historical price. Load stock historical price data for a specific ticker."""
 
@@ -19,6 +33,7 @@ class EquityPriceDnse(IEquityPrice):
             end_date=end_date,
             interval=interval,
             query_param="stock",
+            results_format=results_format,
         )
 
     def quote(self, symbol: str, limit: int) -> VfObject:
@@ -29,11 +44,46 @@ class EquityPriceDnse(IEquityPrice):
         )
 
 
+class EquityPriceDnseAsync(IEquityPriceAsync):
+    """The concrete implementation of the async Equity.Price component with Dnse as provider."""
+
+    async def historical(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: str,
+        results_format: RESULTS_FORMATS = "models",
+    ) -> VfObject:
+        """Equity Historical price. Load stock historical price data for a specific ticker."""
+
+        return await historical_async(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            interval=interval,
+            query_param="stock",
+            results_format=results_format,
+        )
+
+    async def quote(self, symbol: str, limit: int) -> VfObject:
+        """Equity Quote. Load quote data for a specific ticker."""
+
+        raise NotImplementedError(
+            "equity.price.quote() command is not implemented for Dnse provider."
+        )
+
+
 class EtfDnse(IEtf):
     """The concrete implementation of Etf component with Dnse as provider."""
 
     def historical(
-        self, symbol: str, start_date: str, end_date: str, interval: str
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: str,
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
         """ETF Historical price. Load historical price data of a specific ETF ticker.
 
@@ -46,6 +96,7 @@ class EtfDnse(IEtf):
             end_date=end_date,
             interval=interval,
             query_param="stock",
+            results_format=results_format,
         )
 
     def search(self, symbol: str) -> VfObject:
@@ -58,7 +109,12 @@ class IndexPriceDnse(IIndexPrice):
     """The concrete implementation of Index.Price component with Dnse as provider."""
 
     def historical(
-        self, symbol: str, start_date: str, end_date: str, interval: str
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: str,
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
         """Index Historical price. Load historical price data of a specific ticker.
 
@@ -70,4 +126,5 @@ class IndexPriceDnse(IIndexPrice):
             end_date=end_date,
             interval=interval,
             query_param="index",
+            results_format=results_format,
         )
@@ -3,9 +3,10 @@
 from datetime import datetime, timedelta
 from typing import Literal
 
-import httpx as requests
 from pydantic import field_validator, model_validator
 
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.dnse.utils.helpers import dnse_headers
 from vietfin.providers.dnse.models.equity_price_historical import (
     DnseEquityHistoricalPriceData,
@@ -16,8 +17,10 @@ from vietfin.utils.helpers import (
     check_response_error,
     BaseDateParams,
     BaseOtherParams,
-    convert_dictlists_to_listdicts,
+    parse_ohlcv_columns,
+    RESULTS_FORMATS,
 )
+from vietfin.utils.column_table import ColumnTable
 from vietfin.utils.errors import EmptyDataError
 
 
@@ -126,12 +129,89 @@ QueryParams = Literal["stock", "index"]
 # MAIN
 
 
+def _prepare_request(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    interval: str,
+    query_param: QueryParams,
+    results_format: RESULTS_FORMATS = "models",
+) -> tuple[str, str]:
+    """Validate the input params and build the API url of historical().
+
+    Returns
+    -------
+    tuple[str, str]
+        the validated symbol and the API url.
+    """
+    # Validate input param
+    params = HistoricalParams(
+        start_date=start_date,
+        end_date=end_date,
+        interval=interval,
+    )
+    interval = params.interval
+    start_date = params.start_date  # type: ignore
+    end_date = params.end_date  # type: ignore
+
+    other_params = BaseOtherParams(symbol=symbol, results_format=results_format)
+    symbol = other_params.symbol
+
+    start_timestamp = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
+    end_timestamp = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp())
+
+    url = f"https://services.entrade.com.vn/chart-api/v2/ohlcs/{query_param}?from={start_timestamp}&to={end_timestamp}&symbol={symbol}&resolution={interval}"
+
+    return symbol, url
+
+
+def _parse_response(
+    symbol: str, url: str, data: dict, results_format: RESULTS_FORMATS = "models"
+) -> VfObject:
+    """Unpack the API response of historical() into a VfObject."""
+
+    if results_format == "columns":
+        # The payload is already a dict-of-lists: convert the timestamps and the prices
+        # a whole column at a time, without transposing it into rows to validate
+        equity_price_historical = parse_ohlcv_columns(data).sort_index(
+            axis=0, kind="stable"
+        )
+    else:
+        # Read the rows straight from the columns, one dict at a time
+        rows = ColumnTable.from_dict(data).rows()
+
+        # Unpack json to data model
+        equity_price_historical = DnseEquityHistoricalPriceData.validate_many(rows)
+
+    if len(equity_price_historical) == 0:
+        raise EmptyDataError
+
+    # Additional metadata about the command run
+    extra = generate_extra_metadata(
+        symbol=symbol,
+        result=equity_price_historical,
+        api_url=url,
+    )
+
+    print(
+        f"Retrieved {extra.get('records_count',[])} historical price data point for symbol {symbol}."
+    )
+
+    return VfObject(
+        results=equity_price_historical,
+        provider="dnse",
+        extra=extra,
+        raw_data=data,
+    )
+
+
 def historical(
     symbol: str,
     start_date: str,
     end_date: str,
     interval: str = "1D",
     query_param: QueryParams = "stock",
+    results_format: RESULTS_FORMATS = "models",
 ) -> VfObject:
     """Retrieve Equity Historical price of a specific ticker from DNSE provider.
 
@@ -150,11 +230,14 @@ def historical(
         end date string in YYYY-MM-DD format
     query_param : QueryParams
         type of query params of API url. Options: "stock" (default) or "index"
+    results_format : RESULTS_FORMATS
+        "models" (default) for a list of data models,
+        "columns" for a DataFrame validated column by column, faster for large results.
 
     Returns
     -------
     VfObject
-        results : list[DnseEquityHistoricalPriceData]
+        results : list[DnseEquityHistoricalPriceData] | pd.DataFrame
             equity historical price data
         provider : str
             provider name "dnse"
@@ -172,54 +255,39 @@ def historical(
     ValidationError
         if the input param are invalid
     """
-    # Validate input param
-    params = HistoricalParams(
-        start_date=start_date,
-        end_date=end_date,
-        interval=interval,
+    symbol, url = _prepare_request(
+        symbol, start_date, end_date, interval, query_param, results_format
     )
-    interval = params.interval
-    start_date = params.start_date  # type: ignore
-    end_date = params.end_date  # type: ignore
-
-    other_params = BaseOtherParams(symbol=symbol)
-    symbol = other_params.symbol
-
-    start_timestamp = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
-    end_timestamp = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp())
 
     # API call
-    url = f"https://services.entrade.com.vn/chart-api/v2/ohlcs/{query_param}?from={start_timestamp}&to={end_timestamp}&symbol={symbol}&resolution={interval}"
-    response = requests.get(url, headers=dnse_headers)
-
+    response = http.get(url, headers=dnse_headers)
     check_response_error(response)
 
     # The structure of this json `data` is a dict-of-lists where the values are lists of equal length
-    data = response.json()
+    data = response_json(response)
 
-    # Transpose the dict-of-lists structure into a list-of-dicts structure
-    rows = convert_dictlists_to_listdicts(data)
+    return _parse_response(symbol, url, data, results_format)
 
-    if not rows:
-        raise EmptyDataError
 
-    # Unpack json to data model
-    equity_price_historical = [DnseEquityHistoricalPriceData(**r) for r in rows]
+async def historical_async(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    interval: str = "1D",
+    query_param: QueryParams = "stock",
+    results_format: RESULTS_FORMATS = "models",
+) -> VfObject:
+    """Async version of historical(), sending the request with the pooled async client.
 
-    # Additional metadata about the command run
-    extra = generate_extra_metadata(
-        symbol=symbol,
-        result=equity_price_historical,
-        api_url=url,
+    See historical() for the description of the parameters and the returned VfObject.
+    """
+    symbol, url = _prepare_request(
+        symbol, start_date, end_date, interval, query_param, results_format
     )
 
-    print(
-        f"Retrieved {extra.get('records_count',[])} historical price data point for symbol {symbol}."
-    )
+    # API call
+    response = await http.aget(url, headers=dnse_headers)
+    check_response_error(response)
+    data = response_json(response)
 
-    return VfObject(
-        results=equity_price_historical,
-        provider="dnse",
-        extra=extra,
-        raw_data=data,
-    )
+    return _parse_response(symbol, url, data, results_format)
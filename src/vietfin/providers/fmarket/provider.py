@@ -1,10 +1,16 @@
 """Fmarket provider concrete class."""
 
-from vietfin.abstract.interface import IFunds
+from vietfin.abstract.interface import IFunds, IFundsAsync
 from vietfin.abstract.vfobject import VfObject
-from vietfin.providers.fmarket.utils.funds_search import search
-from vietfin.providers.fmarket.utils.funds_historical import historical
-from vietfin.providers.fmarket.utils.funds_holdings import holdings
+from vietfin.providers.fmarket.utils.funds_search import search, search_async
+from vietfin.providers.fmarket.utils.funds_historical import (
+    historical,
+    historical_async,
+)
+from vietfin.providers.fmarket.utils.funds_holdings import (
+    holdings,
+    holdings_async,
+)
 
 
 class FundsFmarket(IFunds):
@@ -28,3 +34,26 @@ class FundsFmarket(IFunds):
         """Funds Holdings. Load the top 10 holdings for a specific fund."""
 
         return holdings(symbol=symbol)
+
+
+class FundsFmarketAsync(IFundsAsync):
+    """The concrete implementation of the async Funds component with Fmarket as provider."""
+
+    async def search(self, symbol: str) -> VfObject:
+        """Funds Search. Search for a fund."""
+
+        return await search_async(symbol=symbol)
+
+    async def historical(
+        self, symbol: str, start_date: str, end_date: str
+    ) -> VfObject:
+        """Funds Historical price. Load historical NAV for a specific fund."""
+
+        return await historical_async(
+            symbol=symbol, start_date=start_date, end_date=end_date
+        )
+
+    async def holdings(self, symbol: str) -> VfObject:
+        """Funds Holdings. Load the top 10 holdings for a specific fund."""
+
+        return await holdings_async(symbol=symbol)
@@ -1,10 +1,15 @@
 """Fmarket Funds Historical function."""
 
 from datetime import datetime
-import httpx as requests
 from pydantic import model_validator
 
-from vietfin.providers.fmarket.utils.helpers import fmarket_headers, get_fund_id
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
+from vietfin.providers.fmarket.utils.helpers import (
+    fmarket_headers,
+    get_fund_id,
+    get_fund_id_async,
+)
 from vietfin.providers.fmarket.models.fund_historical_nav import (
     FmarketFundHistoricalNavData,
 )
@@ -49,6 +54,62 @@ class HistoricalParams(BaseDateParams):
         return self
 
 
+_NAV_HISTORY_URL = "https://api.fmarket.vn/res/product/get-nav-history"
+
+
+def _nav_history_payload(fund_id: int, params: HistoricalParams) -> dict:
+    """Build the payload of the NAV history request."""
+    return {
+        "isAllData": 1,
+        "productId": fund_id,
+        "fromDate": params.start_date,
+        "toDate": params.end_date,
+    }
+
+
+def _parse_response(
+    symbol: str, params: HistoricalParams, data: dict
+) -> VfObject:
+    """Unpack the API response of historical() into a VfObject."""
+
+    url = _NAV_HISTORY_URL
+    rows = data["data"]
+    if not rows:
+        raise EmptyDataError
+
+    # Unpack json to data model
+    fund_nav = FmarketFundHistoricalNavData.validate_many(rows)
+
+    # NOTE: Fmarket API does not accept an arbitrary start_date.
+    # It takes only the [3mo, 6mo, 12mo, 36mo] counting back from the current date.
+    # Any start_date other than these dynamically pre-defined values will be ignored by Fmarket,
+    #     and considered as None.
+
+    # A workaround to filter out the data that is not within the input date range
+    start = datetime.strptime(params.start_date, "%Y%m%d").date()  # type: ignore
+    end = datetime.strptime(params.end_date, "%Y%m%d").date()  # type: ignore
+
+    fund_nav = [
+        item
+        for item in fund_nav
+        if start <= item.date_nav <= end
+    ]
+
+    # Additional metadata about the command run
+    extra = generate_extra_metadata(symbol=symbol, result=fund_nav, api_url=url)
+
+    print(
+        f"Retrieved {extra.get('records_count',[])} daily NAV data point for fund {symbol}."
+    )
+
+    return VfObject(
+        results=fund_nav,
+        provider="fmarket",
+        extra=extra,
+        raw_data=data,
+    )
+
+
 def historical(
     symbol: str, start_date: str | None = None, end_date: str | None = None
 ) -> VfObject:
@@ -91,8 +152,6 @@ def historical(
     params = HistoricalParams(
         start_date=start_date, end_date=end_date
     )
-    start_date = params.start_date
-    end_date = params.end_date
 
     other_params = BaseOtherParams(symbol=symbol)
     symbol = other_params.symbol
@@ -101,49 +160,41 @@ def historical(
     fund_id = get_fund_id(symbol)
 
     # API call
-    url = "https://api.fmarket.vn/res/product/get-nav-history"
-    payload = {
-        "isAllData": 1,
-        "productId": fund_id,
-        "fromDate": start_date,
-        "toDate": end_date,
-    }
-    response = requests.post(url, json=payload, headers=fmarket_headers)
+    payload = _nav_history_payload(fund_id, params)
+    response = http.post(
+        _NAV_HISTORY_URL, json=payload, headers=fmarket_headers, retry=True
+    )
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
 
-    rows = data["data"]
-    if not rows:
-        raise EmptyDataError
+    return _parse_response(symbol, params, data)
 
-    # Unpack json to data model
-    fund_nav = [FmarketFundHistoricalNavData(**r) for r in rows]
 
-    # NOTE: Fmarket API does not accept an arbitrary start_date.
-    # It takes only the [3mo, 6mo, 12mo, 36mo] counting back from the current date.
-    # Any start_date other than these dynamically pre-defined values will be ignored by Fmarket,
-    #     and considered as None.
+async def historical_async(
+    symbol: str, start_date: str | None = None, end_date: str | None = None
+) -> VfObject:
+    """Async version of historical(), sending the requests with the pooled async client.
 
-    # A workaround to filter out the data that is not within the input date range
-    start = datetime.strptime(params.start_date, "%Y%m%d").date()  # type: ignore
-    end = datetime.strptime(params.end_date, "%Y%m%d").date()  # type: ignore
+    See historical() for the description of the parameters and the returned VfObject.
+    """
 
-    fund_nav = [
-        item
-        for item in fund_nav
-        if start <= item.date_nav <= end
-    ]
+    # Validate input
+    params = HistoricalParams(
+        start_date=start_date, end_date=end_date
+    )
 
-    # Additional metadata about the command run
-    extra = generate_extra_metadata(symbol=symbol, result=fund_nav, api_url=url)
+    other_params = BaseOtherParams(symbol=symbol)
+    symbol = other_params.symbol
 
-    print(
-        f"Retrieved {extra.get('records_count',[])} daily NAV data point for fund {symbol}."
-    )
+    # Retrieve fund_id matching given symbol
+    fund_id = await get_fund_id_async(symbol)
 
-    return VfObject(
-        results=fund_nav,
-        provider="fmarket",
-        extra=extra,
-        raw_data=data,
+    # API call
+    payload = _nav_history_payload(fund_id, params)
+    response = await http.apost(
+        _NAV_HISTORY_URL, json=payload, headers=fmarket_headers, retry=True
     )
+    check_response_error(response)
+    data = response_json(response)
+
+    return _parse_response(symbol, params, data)
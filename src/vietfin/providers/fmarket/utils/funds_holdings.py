@@ -1,9 +1,13 @@
 """Fmarket Funds Top Holdings function."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.abstract.vfobject import VfObject
-from vietfin.providers.fmarket.utils.helpers import fmarket_headers, get_fund_id
+from vietfin.providers.fmarket.utils.helpers import (
+    fmarket_headers,
+    get_fund_id,
+    get_fund_id_async,
+)
 from vietfin.providers.fmarket.models.fund_holdings import (
     FmarketFundHoldingsData,
 )
@@ -11,6 +15,36 @@ from vietfin.utils.helpers import generate_extra_metadata, check_response_error,
 from vietfin.utils.errors import EmptyDataError
 
 
+def _parse_response(symbol: str, url: str, data: dict) -> VfObject:
+    """Unpack the API response of holdings() into a VfObject."""
+
+    # NOTE: API logic. Funds can allocate to either equities or fixed income securities, or both
+    list_of_holdings = []
+
+    # Extract top holdings in equity
+    rows = data["data"]["productTopHoldingList"]
+    fund_top_holdings_stock = [FmarketFundHoldingsData(**r) for r in rows]
+
+    # Extract top holdings in fixed income securities
+    rows = data["data"]["productTopHoldingBondList"]
+    fund_top_holdings_bond = [FmarketFundHoldingsData(**r) for r in rows]
+
+    # Output the merged list
+    list_of_holdings = fund_top_holdings_stock + fund_top_holdings_bond
+
+    if len(list_of_holdings) == 0:
+        raise EmptyDataError
+
+    # Additional metadata about the command run
+    extra = generate_extra_metadata(
+        symbol=symbol, result=list_of_holdings, api_url=url
+    )
+
+    return VfObject(
+        results=list_of_holdings, provider="fmarket", extra=extra, raw_data=data
+    )
+
+
 def holdings(symbol: str) -> VfObject:
     """Retrieve a list of the current top 10 holdings of the specified fund from the Fmarket provider.
 
@@ -48,32 +82,30 @@ def holdings(symbol: str) -> VfObject:
 
     # API call
     url = f"https://api.fmarket.vn/res/products/{fund_id}"
-    response = requests.get(url, headers=fmarket_headers, cookies=None)
+    response = http.get(url, headers=fmarket_headers, cookies=None)
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
 
-    # NOTE: API logic. Funds can allocate to either equities or fixed income securities, or both
-    list_of_holdings = []
+    return _parse_response(symbol, url, data)
 
-    # Extract top holdings in equity
-    rows = data["data"]["productTopHoldingList"]
-    fund_top_holdings_stock = [FmarketFundHoldingsData(**r) for r in rows]
 
-    # Extract top holdings in fixed income securities
-    rows = data["data"]["productTopHoldingBondList"]
-    fund_top_holdings_bond = [FmarketFundHoldingsData(**r) for r in rows]
+async def holdings_async(symbol: str) -> VfObject:
+    """Async version of holdings(), sending the requests with the pooled async client.
 
-    # Output the merged list
-    list_of_holdings = fund_top_holdings_stock + fund_top_holdings_bond
+    See holdings() for the description of the parameters and the returned VfObject.
+    """
 
-    if len(list_of_holdings) == 0:
-        raise EmptyDataError
+    # Validate input params
+    params = BaseOtherParams(symbol=symbol)
+    symbol = params.symbol
 
-    # Additional metadata about the command run
-    extra = generate_extra_metadata(
-        symbol=symbol, result=list_of_holdings, api_url=url
-    )
+    # Retrieve fund_id matching the given symbol
+    fund_id = await get_fund_id_async(symbol)
 
-    return VfObject(
-        results=list_of_holdings, provider="fmarket", extra=extra, raw_data=data
-    )
+    # API call
+    url = f"https://api.fmarket.vn/res/products/{fund_id}"
+    response = await http.aget(url, headers=fmarket_headers)
+    check_response_error(response)
+    data = response_json(response)
+
+    return _parse_response(symbol, url, data)
@@ -1,8 +1,9 @@
 """Fmarket Funds Search function."""
 
-import httpx as requests
 from pydantic import BaseModel, ConfigDict, field_validator
 
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import generate_extra_metadata, check_response_error
 from vietfin.providers.fmarket.models.fund_search import FmarketFundInfoData
@@ -32,41 +33,18 @@ class SearchParams(BaseModel):
         return v.upper()
 
 
-def search(
-    symbol: str | None = "",
-    fund_type: str | None = "",
-) -> VfObject:
-    """Search for mutual funds from Fmarket provider.
+_FUND_FILTER_URL = "https://api.fmarket.vn/res/products/filter"
 
-    An empty query (by default) returns the full list of available mutual funds.
 
-    Parameters
-    ----------
-    symbol : str, Optional
-        fund short name. Options: "" (default)
-    fund_type : str, Optional
-        available fund types. Options: "" (default), "BALANCED", "BOND", "STOCK"
+def _prepare_request(
+    symbol: str | None, fund_type: str | None
+) -> tuple[str | None, dict]:
+    """Validate the input params and build the payload of search().
 
     Returns
     -------
-    VfObject
-        results : list[FmarketFundInfoData]
-            Info of mutual fund listed on Fmarket.
-        provider : str
-            Provider name: "fmarket"
-        extra : dict
-            Extra metadata about the command run, including the timestamp, the symbol.
-        raw_data : dict
-            raw data from the API call
-
-    Raises
-    ------
-    ValidationError
-        if the input param are invalid
-    HttpError
-        if the API call failed
-    EmptyDataError
-        if the API response is empty
+    tuple[str | None, dict]
+        the validated symbol and the request payload.
     """
 
     # Validate input param
@@ -74,7 +52,6 @@ def search(
     symbol = params.symbol
     fund_type = params.fund_type
 
-    # API call
     # Formatting fundAssetTypes or return default value as an empty list
     fundAssetTypes = {
         None: [],
@@ -99,10 +76,11 @@ def search(
         "thirdAppIds": [],
     }
 
-    url = "https://api.fmarket.vn/res/products/filter"
-    response = requests.post(url, json=payload, headers=fmarket_headers)
-    check_response_error(response)
-    data = response.json()
+    return symbol, payload
+
+
+def _parse_response(symbol: str | None, data: dict) -> VfObject:
+    """Unpack the API response of search() into a VfObject."""
 
     rows = data["data"]["rows"]
     if not rows:
@@ -115,7 +93,7 @@ def search(
 
     # Additional metadata about the command run
     extra = generate_extra_metadata(
-        symbol=symbol, result=fund_details, api_url=url
+        symbol=symbol, result=fund_details, api_url=_FUND_FILTER_URL
     )
 
     print(f"Retrieved {extra.get('records_count',[])} record(s) from Fmarket.")
@@ -123,3 +101,72 @@ def search(
     return VfObject(
         results=fund_details, provider="fmarket", extra=extra, raw_data=data
     )
+
+
+def search(
+    symbol: str | None = "",
+    fund_type: str | None = "",
+) -> VfObject:
+    """Search for mutual funds from Fmarket provider.
+
+    An empty query (by default) returns the full list of available mutual funds.
+
+    Parameters
+    ----------
+    symbol : str, Optional
+        fund short name. Options: "" (default)
+    fund_type : str, Optional
+        available fund types. Options: "" (default), "BALANCED", "BOND", "STOCK"
+
+    Returns
+    -------
+    VfObject
+        results : list[FmarketFundInfoData]
+            Info of mutual fund listed on Fmarket.
+        provider : str
+            Provider name: "fmarket"
+        extra : dict
+            Extra metadata about the command run, including the timestamp, the symbol.
+        raw_data : dict
+            raw data from the API call
+
+    Raises
+    ------
+    ValidationError
+        if the input param are invalid
+    HttpError
+        if the API call failed
+    EmptyDataError
+        if the API response is empty
+    """
+
+    symbol, payload = _prepare_request(symbol, fund_type)
+
+    # API call
+    response = http.post(
+        _FUND_FILTER_URL, json=payload, headers=fmarket_headers, retry=True
+    )
+    check_response_error(response)
+    data = response_json(response)
+
+    return _parse_response(symbol, data)
+
+
+async def search_async(
+    symbol: str | None = "",
+    fund_type: str | None = "",
+) -> VfObject:
+    """Async version of search(), sending the request with the pooled async client.
+
+    See search() for the description of the parameters and the returned VfObject.
+    """
+    symbol, payload = _prepare_request(symbol, fund_type)
+
+    # API call
+    response = await http.apost(
+        _FUND_FILTER_URL, json=payload, headers=fmarket_headers, retry=True
+    )
+    check_response_error(response)
+    data = response_json(response)
+
+    return _parse_response(symbol, data)
@@ -1,8 +1,14 @@
 """Fmarket utils."""
 
-import httpx as requests
+import asyncio
+import time
 
-from vietfin.utils.errors import VietFinError
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
+from vietfin.utils.cache import TTLCache
+from vietfin.utils.singleflight import coalesced
+from vietfin.utils.helpers import check_response_error
+from vietfin.utils.errors import EmptyDataError, VietFinError
 
 
 # Requests headers
@@ -24,36 +30,103 @@ fmarket_headers = {
 # Helpers
 
 
-def get_fund_id(symbol: str) -> int:
-    """Lookup FundID based on Fund short name from Fmarket provider.
+_FUND_FILTER_URL = "https://api.fmarket.vn/res/products/filter"
 
-    Parameters
-    ----------
-    symbol : str
-        Fund short name.
+# The fund directory is reloaded every 12 hours
+FUND_DIRECTORY_TTL = 12 * 60 * 60
 
-    Returns
-    -------
-    fund_id : int
-        FundID matching the given symbol.
-        
+# After a failed load, the fund directory is skipped for 5 minutes
+FUND_DIRECTORY_RETRY_AFTER = 5 * 60
+
+
+def _load_funds() -> list[dict]:
+    """Download the records of all funds, page by page."""
+
+    funds: list[dict] = []
+    page = 1  # API logic: the 1st page is page 1
+
+    while True:
+        payload = {
+            "types": ["NEW_FUND", "TRADING_FUND"],
+            "page": page,
+            "pageSize": 100,
+            "searchField": "",
+        }
+        response = http.post(
+            _FUND_FILTER_URL, headers=fmarket_headers, json=payload, retry=True
+        )
+        check_response_error(response)
+        data = response_json(response)["data"]
+        rows = data.get("rows") or []
+        funds.extend(rows)
+
+        if not rows or len(funds) >= data.get("total", 0):
+            break  # stop if no more data
+
+        page += 1
+
+    # never cache an empty list
+    if not funds:
+        raise EmptyDataError("No data found for the list of funds.")
+
+    return funds
+
+
+def _index_funds(funds: list[dict]) -> dict[str, dict]:
+    """Index the records of the funds by uppercase short name."""
+    return {f["shortName"].upper(): f for f in funds if f.get("shortName")}
+
+
+# Fund directory: short name -> raw record of the fund (id, name, shortName, ...)
+fund_directory: TTLCache[dict[str, dict]] = TTLCache(
+    name="fmarket_fund_directory",
+    loader=_load_funds,
+    ttl=FUND_DIRECTORY_TTL,
+    parse=_index_funds,
+)
+
+
+# Time (time.monotonic()) of the last failed load of the fund directory
+_directory_failed_at: float | None = None
+
+
+def _find_in_directory(symbol: str) -> dict | None:
+    """Return the record of the fund in the fund directory, or None if not found.
+
+    If the fund directory fails to load, None is returned as well, so the fund is
+    searched with the API, and the directory is not reloaded for
+    `FUND_DIRECTORY_RETRY_AFTER` seconds.
     """
+    global _directory_failed_at  # pylint: disable=global-statement
+
+    if (
+        _directory_failed_at is not None
+        and time.monotonic() - _directory_failed_at < FUND_DIRECTORY_RETRY_AFTER
+    ):
+        return None
 
-    payload = {
+    try:
+        directory = fund_directory.get()
+    except Exception as e:  # pylint: disable=broad-except
+        _directory_failed_at = time.monotonic()
+        print(f"Fund directory unavailable ({e}), searching the fund {symbol} instead.")
+        return None
+
+    _directory_failed_at = None
+    return directory.get(symbol.upper())
+
+
+def _fund_filter_payload(symbol: str) -> dict:
+    """Build the payload of the request looking up a fund by its short name."""
+    return {
         "searchField": symbol,
         "types": ["NEW_FUND", "TRADING_FUND"],
         "pageSize": 100,
     }
 
-    url = "https://api.fmarket.vn/res/products/filter"
-    response = requests.post(url, headers=fmarket_headers, json=payload)
-
-    if response.status_code != 200:
-        raise requests.HTTPError(
-            f"Error in API response: {response.status_code} - {response.text}"
-        )
 
-    data = response.json()
+def _parse_fund_id(symbol: str, data: dict) -> int:
+    """Extract the FundID from the response of the fund lookup request."""
 
     # This logic is handcrafted for the data structure of response from the API
     if data["data"]["total"] == 0:
@@ -66,3 +139,54 @@ def get_fund_id(symbol: str) -> int:
         fund_id = int(data["data"]["rows"][0]["id"])
 
     return fund_id
+
+
+@coalesced
+def get_fund_id(symbol: str) -> int:
+    """Lookup FundID based on Fund short name from Fmarket provider.
+
+    Parameters
+    ----------
+    symbol : str
+        Fund short name.
+
+    Returns
+    -------
+    fund_id : int
+        FundID matching the given symbol.
+
+    Concurrent lookups of the same symbol share a single lookup.
+    """
+
+    # Lookup the fund directory first, then search the funds with the API
+    # e.g. if the fund was listed after the directory was loaded, or if the
+    # directory failed to load
+    fund = _find_in_directory(symbol)
+    if fund is not None:
+        return int(fund["id"])
+
+    payload = _fund_filter_payload(symbol)
+    response = http.post(
+        _FUND_FILTER_URL, headers=fmarket_headers, json=payload, retry=True
+    )
+    check_response_error(response)
+
+    return _parse_fund_id(symbol, response_json(response))
+
+
+@coalesced
+async def get_fund_id_async(symbol: str) -> int:
+    """Async version of get_fund_id(), sending the request with the pooled async client."""
+
+    # the fund directory is loaded in a thread, so the event loop is not blocked
+    fund = await asyncio.to_thread(_find_in_directory, symbol)
+    if fund is not None:
+        return int(fund["id"])
+
+    payload = _fund_filter_payload(symbol)
+    response = await http.apost(
+        _FUND_FILTER_URL, headers=fmarket_headers, json=payload, retry=True
+    )
+    check_response_error(response)
+
+    return _parse_fund_id(symbol, response_json(response))
@@ -46,7 +46,11 @@ class SsiDerivativesCoveredwarrantSearchData(Data):
         """
 
         if isinstance(data, dict):
-            data["md"] = datetime.strptime(data["md"], "%Y%m%d").date()
-            data["ltd"] = datetime.strptime(data["ltd"], "%Y%m%d").date()
+            # a new dict, the raw data of the caller is left unchanged
+            data = {
+                **data,
+                "md": datetime.strptime(data["md"], "%Y%m%d").date(),
+                "ltd": datetime.strptime(data["ltd"], "%Y%m%d").date(),
+            }
 
         return data
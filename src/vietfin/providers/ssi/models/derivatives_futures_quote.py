@@ -46,6 +46,8 @@ class SsiDerivativesFuturesQuoteData(Data):
         - xxxxxxxx is the Unix timestamp in milliseconds of the quote execution.
         """
         if isinstance(data, dict):
+            # a new dict, the raw data of the caller is left unchanged
+            data = dict(data)
             # ignore the first six characters of the value of `_id` key
             id_substring = data["_id"][6:]
             try:
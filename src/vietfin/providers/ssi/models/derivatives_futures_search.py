@@ -36,7 +36,11 @@ class SsiDerivativesFuturesSearchData(Data):
         """
 
         if isinstance(data, dict):
-            data["md"] = datetime.strptime(data["md"], "%d/%m/%Y").date()
-            data["ltd"] = datetime.strptime(data["ltd"], "%d/%m/%Y").date()
+            # a new dict, the raw data of the caller is left unchanged
+            data = {
+                **data,
+                "md": datetime.strptime(data["md"], "%d/%m/%Y").date(),
+                "ltd": datetime.strptime(data["ltd"], "%d/%m/%Y").date(),
+            }
 
         return data
@@ -32,7 +32,8 @@ class SsiEtfHistoricalData(Data):
     def parse_unix_timestamp(cls, data: Any) -> Any:
         """Before model validators are applied, parse the raw input, convert the value of `t` key from unix timestamp to date."""
         if isinstance(data, dict):
-            data["t"] = datetime.fromtimestamp(data["t"], tz=timezone.utc).date()
+            # a new dict, the raw data of the caller is left unchanged
+            data = {**data, "t": datetime.fromtimestamp(data["t"], tz=timezone.utc).date()}
         return data
 
     @field_validator("open", "high", "low", "close")
@@ -40,4 +41,3 @@ class SsiEtfHistoricalData(Data):
     def multiply_1k(cls, value: float) -> float:
         """Multiply the price value by 1000."""
         return value * 1000
-    
\ No newline at end of file
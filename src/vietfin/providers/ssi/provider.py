@@ -1,6 +1,6 @@
 """Ssi provider concrete class."""
 
-from typing import Any
+from typing import Any, Iterator
 from vietfin.abstract.interface import (
     IEquity,
     IIndex,
@@ -8,27 +8,33 @@ from vietfin.abstract.interface import (
     IEquityFundamental,
     IEtf,
     IEquityPrice,
+    IEquityPriceAsync,
     IDerivativesFutures,
     IDerivativesCoveredWarrant,
 )
 from vietfin.abstract.vfobject import VfObject
-from vietfin.utils.helpers import PERIODS, EXCHANGE_NAMES
+from vietfin.utils.helpers import PERIODS, EXCHANGE_NAMES, RESULTS_FORMATS
 from vietfin.providers.ssi.utils.equity_search import search as equity_search
 from vietfin.providers.ssi.utils.index_search import search as index_search
 from vietfin.providers.ssi.utils.equity_discovery import (
     get_top_movers,
 )
 from vietfin.providers.ssi.utils.etf_search import search as etf_search
-from vietfin.providers.ssi.utils.etf_historical import historical
+from vietfin.providers.ssi.utils.etf_historical import (
+    historical,
+    historical_async,
+)
 from vietfin.providers.ssi.utils.index_constituents import constituents
 from vietfin.providers.ssi.utils.equity_fundamental_income import (
     get_financial_report,
+    get_financial_reports,
 )
 from vietfin.providers.ssi.utils.derivatives_futures_search import (
     search as futures_search,
 )
 from vietfin.providers.ssi.utils.derivatives_futures_quote import (
     quote as futures_quote,
+    iter_quote as futures_iter_quote,
 )
 from vietfin.providers.ssi.utils.derivatives_coveredwarrant_search import (
     search as cw_search,
@@ -60,7 +66,12 @@ class EquityPriceSsi(IEquityPrice):
         )
 
     def historical(
-        self, symbol: str, start_date: str, end_date: str, interval: Any
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: Any,
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
         """Equity Historical price. Load stock historical price data for a specific ticker.
 
@@ -71,6 +82,36 @@ class EquityPriceSsi(IEquityPrice):
             start_date=start_date,
             end_date=end_date,
             interval=interval,
+            results_format=results_format,
+        )
+
+
+class EquityPriceSsiAsync(IEquityPriceAsync):
+    """The concrete implementation of the async Equity.Price component with Ssi as provider."""
+
+    async def quote(self, symbol: str, limit: int) -> VfObject:
+        raise NotImplementedError(
+            "equity.price.quote() command is not implemented for SSI provider."
+        )
+
+    async def historical(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: Any,
+        results_format: RESULTS_FORMATS = "models",
+    ) -> VfObject:
+        """Equity Historical price. Load stock historical price data for a specific ticker.
+
+        Use the same historical_async() function from module etf_historical.
+        """
+        return await historical_async(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            interval=interval,
+            results_format=results_format,
         )
 
 
@@ -111,19 +152,37 @@ class EquityFundamentalSsi(IEquityFundamental):
             "equity.fundamental.dividends() command is not implemented for SSI provider."
         )
 
-    def income(self, symbol: str, period: PERIODS) -> VfObject:
+    def income(
+        self, symbol: str, period: PERIODS, results_format: RESULTS_FORMATS = "models"
+    ) -> VfObject:
         """Equity Fundamental Income. Load Historical income statement data for a specific ticker."""
-        return get_financial_report(symbol=symbol, period=period, name="income")
+        return get_financial_report(
+            symbol=symbol, period=period, name="income", results_format=results_format
+        )
 
-    def balance(self, symbol: str, period: PERIODS) -> VfObject:
+    def balance(
+        self, symbol: str, period: PERIODS, results_format: RESULTS_FORMATS = "models"
+    ) -> VfObject:
         """Equity Fundamental Balance. Load Historical balance sheet statement data for a specific ticker."""
         return get_financial_report(
-            symbol=symbol, period=period, name="balance"
+            symbol=symbol, period=period, name="balance", results_format=results_format
         )
 
-    def cash(self, symbol: str, period: PERIODS) -> VfObject:
+    def cash(
+        self, symbol: str, period: PERIODS, results_format: RESULTS_FORMATS = "models"
+    ) -> VfObject:
         """Equity Fundamental Cash. Load Historical cash flow statement data for a specific ticker."""
-        return get_financial_report(symbol=symbol, period=period, name="cash")
+        return get_financial_report(
+            symbol=symbol, period=period, name="cash", results_format=results_format
+        )
+
+    def statements(
+        self, symbol: str, period: PERIODS, results_format: RESULTS_FORMATS = "models"
+    ) -> tuple[dict[str, VfObject], dict[str, Exception]]:
+        """Equity Fundamental Statements, with the organization code of the ticker looked up once."""
+        return get_financial_reports(
+            symbol=symbol, period=period, results_format=results_format
+        )
 
     def multiples(self, symbol: str, period: PERIODS) -> VfObject:
         """Equity Fundamental Multiples. Load Historical valuation multiples data for a specific ticker."""
@@ -153,13 +212,19 @@ class EtfSsi(IEtf):
         return etf_search(symbol=symbol)
 
     def historical(
-        self, symbol: str, start_date: str, end_date: str, interval: Any
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: Any,
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
         return historical(
             symbol=symbol,
             start_date=start_date,
             end_date=end_date,
             interval=interval,
+            results_format=results_format,
         )
 
 
@@ -180,6 +245,11 @@ class DerivativesFuturesSsi(IDerivativesFutures):
 
         return futures_quote(symbol=symbol, limit=limit)
 
+    def iter_quote(self, symbol: str, limit: int) -> Iterator[list]:
+        """Derivatives Futures Quote, streamed page by page."""
+
+        return futures_iter_quote(symbol=symbol, limit=limit)
+
     def search(self, symbol: str) -> VfObject:
         """Derivatives Futures Search. Search for a specific futures contract."""
 
@@ -1,9 +1,10 @@
 """SSI Derivatives Futures Quote command."""
 
 from datetime import datetime
+from typing import Iterator
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.ssi.utils.helpers import ssi_headers
 from vietfin.providers.ssi.models.derivatives_futures_quote import (
     SsiDerivativesFuturesQuoteData,
@@ -16,6 +17,42 @@ from vietfin.utils.helpers import (
 )
 from vietfin.utils.errors import EmptyDataError
 
+# API logic: number of records per page
+PAGE_SIZE = 50
+
+
+def _iter_pages(symbol: str, limit: int) -> Iterator[tuple[str, dict, list[dict]]]:
+    """Fetch the pages of records one by one, yield the url, the json data and the records of each page.
+
+    The next page starts after the `_id` of the last record of the previous one, so the pages
+    can only be fetched in order. The records beyond `limit` (0 means no limit) are dropped.
+    """
+    count = 0
+    url = f"https://iboard-query.ssi.com.vn/le-table?stockSymbol={symbol}&pageSize={PAGE_SIZE}"
+
+    while True:
+        response = http.get(url, headers=ssi_headers)
+        check_response_error(response)
+        data = response_json(response)
+        data_chunk = data["data"]["items"]
+        if limit:
+            data_chunk = data_chunk[: limit - count]
+        if data_chunk:
+            yield url, data, data_chunk
+
+        # Break loop if "count" reaches "limit"
+        count += len(data_chunk)
+        if limit and count >= limit:
+            break
+
+        # Break loop if less than a full page returned, since there are no more records to retrieve
+        if len(data_chunk) < PAGE_SIZE:
+            break
+
+        # Update URL to retrieve the next batch of records
+        last_id = data_chunk[-1]["_id"]
+        url = f"https://iboard-query.ssi.com.vn/le-table?stockSymbol={symbol}&pageSize={PAGE_SIZE}&lastId={last_id}"
+
 
 def quote(symbol: str, limit: int) -> VfObject:
     """Retrieve Derivatives Futures Quote data of a specific contract symbol.
@@ -61,44 +98,21 @@ def quote(symbol: str, limit: int) -> VfObject:
     current_date_string = current_date.strftime("%Y-%m-%d")
 
     # API call
-    rows = []
-    count = 0
-    if limit == 0:
-        limit = 1_000_000  # arbitrary large number to retrieve all records
-    url = f"https://iboard-query.ssi.com.vn/le-table?stockSymbol={symbol}&pageSize=50"
-
-    while True:
-        response = requests.get(url, headers=ssi_headers)
-        check_response_error(response)
-        data = response.json()
-        data_chunk = data["data"]["items"]
+    url = ""
+    data: dict = {}
+    rows: list[dict] = []
+    for url, data, data_chunk in _iter_pages(symbol, limit):
         rows.extend(data_chunk)
 
-        # Break loop if "count" exceeds "limit"
-        count += len(data_chunk)
-        if count >= limit:
-            break
-
-        # Break loop if less than 50 records returned, since there are no more records to retrieve
-        if len(data_chunk) < 50:
-            break
-
-        # Update URL to retrieve the next batch of 50 records
-        last_id = data_chunk[-1]["_id"]
-        url = f"https://iboard-query.ssi.com.vn/le-table?stockSymbol={symbol}&pageSize=50&lastId={last_id}"
-
     if not rows:
         raise EmptyDataError(
             f"No data found for the given futures contract {symbol} on {current_date_string}."
         )
 
-    # Return only the number of records specified by `limit`
-    limited_rows = rows[:limit]
-
     # Unpack json data into data model
-    derivatives_futures_quote: list[SsiDerivativesFuturesQuoteData] = [
-        SsiDerivativesFuturesQuoteData(**r) for r in limited_rows
-    ]
+    derivatives_futures_quote: list[SsiDerivativesFuturesQuoteData] = (
+        SsiDerivativesFuturesQuoteData.validate_many(rows)
+    )
 
     # Generate extra metadata
     extra = generate_extra_metadata(
@@ -115,3 +129,42 @@ def quote(symbol: str, limit: int) -> VfObject:
         extra=extra,
         raw_data=data,
     )
+
+
+def iter_quote(
+    symbol: str, limit: int = 0
+) -> Iterator[list[SsiDerivativesFuturesQuoteData]]:
+    """Stream Derivatives Futures Quote data of a specific contract symbol, page by page.
+
+    Unlike quote(), the pages are not accumulated in memory: each page is parsed and yielded
+    as soon as it arrives. The next page is only fetched when the consumer asks for it,
+    so stopping the iteration (e.g. `break`) stops fetching pages.
+
+    Parameters
+    ----------
+    symbol : str
+        Futures contract symbol
+    limit : int
+        limit of number of records to be retrieved.
+        0 will return all records. Default 0.
+
+    Yields
+    ------
+    list[SsiDerivativesFuturesQuoteData]
+        derivatives futures quote data of each page, in order. Nothing is yielded if there is no data.
+
+    Raises
+    ------
+    ValidationError
+        if the input param are invalid
+    HttpError
+        if an API call failed
+    """
+
+    # Validate input param
+    params = BaseOtherParams(symbol=symbol, limit=limit)
+
+    pages = _iter_pages(params.symbol, params.limit)
+    return (
+        SsiDerivativesFuturesQuoteData.validate_many(rows) for _, _, rows in pages
+    )
@@ -1,7 +1,7 @@
 """SSI Derivatives Futures Search command."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.ssi.utils.helpers import ssi_headers
 from vietfin.providers.ssi.models.derivatives_futures_search import (
     SsiDerivativesFuturesSearchData,
@@ -44,9 +44,9 @@ def search(symbol: str = "") -> VfObject:
 
     # API call
     url = "https://iboard-query.ssi.com.vn/v2/stock/exchange/fu?hasVN30=true&hasVN100=true"
-    response = requests.get(url, headers=ssi_headers)
+    response = http.get(url, headers=ssi_headers)
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
 
     rows = data["data"]
 
@@ -1,7 +1,7 @@
 """SSI Equity Discovery group of functions."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import (
     generate_extra_metadata,
@@ -71,9 +71,9 @@ def get_top_movers(
 
     # API call
     url = f"https://fiin-market.ssi.com.vn/TopMover/GetTop{name_api}?language=vi&ComGroupCode={exchange_api}"
-    response = requests.get(url, headers=ssi_headers)
+    response = http.get(url, headers=ssi_headers)
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
     rows = data.get("items", [])
 
     if not rows:
@@ -1,29 +1,87 @@
 """SSI Equity Fundamental Income command."""
 
 from datetime import datetime
-from io import BytesIO
 import re
+from typing import TYPE_CHECKING, get_args
 
-import httpx as requests
-import pandas as pd
-
+from vietfin.utils import excel, http
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import (
     check_response_error,
     generate_extra_metadata,
     PERIODS,
     FINANCIAL_STATEMENTS,
+    BaseOtherParams,
+    RESULTS_FORMATS,
 )
+from vietfin.utils.concurrency import run_concurrently
+from vietfin.utils.raw_data import get_raw_data_policy
 from vietfin.providers.ssi.utils.helpers import ssi_headers
 from vietfin.providers.ssi.models.equity_fundamental_income import (
     SsiEquityFundamentalIncomeData,
 )
-from vietfin.providers.ssi.utils.equity_search import search
+from vietfin.providers.ssi.utils.symbol_master import get_organ_code
 from vietfin.utils.errors import EmptyDataError
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# This regex match any string that starts with 'Q' followed by 1 or 2 digits and a space then ends with 4 digits (for quarters, e.g. Q01 2023)
+# or just 4 digits (for years, e.g. 2023)
+year_quarter_regex = re.compile(r"^(Q\d{1,2}\s)?\d{4}$")
+
+
+def _melt_statement(df: "pd.DataFrame", period: str) -> "pd.DataFrame":
+    """Unpivot the sheet of a financial statement into a typed long DataFrame.
+
+    Vectorized equivalent of `pd.melt()` of the period columns, then of validating one
+    SsiEquityFundamentalIncomeData per cell: the values of all the periods are converted
+    to floats at once, then laid out period after period, as `pd.melt()` does.
+
+    Returns
+    -------
+    pd.DataFrame
+        one column per field of SsiEquityFundamentalIncomeData:
+        fiscal_period, period, items (str) and values (float64).
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    # Identify column labels that represent years or quarters
+    period_columns = [
+        col
+        for col in df.columns
+        if isinstance(col, str) and year_quarter_regex.match(col)
+    ]
+
+    items = df["ITEMS"]
+    if items.isna().any():
+        raise ValueError("Null values found for required field: items")
+
+    try:
+        values = df[period_columns].apply(pd.to_numeric).to_numpy(dtype="float64")
+    except (TypeError, ValueError) as ex:
+        raise ValueError(f"Invalid values for field values: {ex}") from ex
+
+    n_rows = len(df)
+    return pd.DataFrame(
+        {
+            "fiscal_period": np.repeat(np.asarray(period_columns, dtype=object), n_rows),
+            "period": period,
+            "items": np.tile(items.to_numpy(dtype=object), len(period_columns)),
+            # column after column, i.e. period after period
+            "values": values.ravel(order="F"),
+        }
+    )
+
 
 def get_financial_report(
-    symbol: str, name: FINANCIAL_STATEMENTS = "income", period: PERIODS = "annual"
+    symbol: str,
+    name: FINANCIAL_STATEMENTS = "income",
+    period: PERIODS = "annual",
+    results_format: RESULTS_FORMATS = "models",
+    organ_code: str | None = None,
 ) -> VfObject:
     """Retrieve Equity Fundamental financial statement data of the given ticker.
 
@@ -37,11 +95,16 @@ def get_financial_report(
         financial statement name
     period : str
         time period of the data to return
+    results_format : RESULTS_FORMATS
+        "models" (default) for a list of data models,
+        "columns" for a long DataFrame unpivoted column by column, faster for large results.
+    organ_code : str | None
+        organization code of the ticker in SSI database, looked up if not given.
 
     Returns
     -------
     VfObject
-        results : list[SsiEquityFundamentalIncomeData]
+        results : list[SsiEquityFundamentalIncomeData] | pd.DataFrame
             historical income/balance/cashflow data of the given ticker
         provider : str
             provider name 'ssi'
@@ -61,7 +124,13 @@ def get_financial_report(
     """
 
     # Validate input param
-    symbol = symbol.upper()
+    params = BaseOtherParams(
+        symbol=symbol,
+        financial_statement=name,
+        period=period,
+        results_format=results_format,
+    )
+    symbol = params.symbol
 
     # Map user friendly string to API value
     period_mapping = {
@@ -77,21 +146,22 @@ def get_financial_report(
     }
     name_api = name_mapping.get(name)  # type: ignore
 
-    # Lookup organ_code matching ticker symbol
-    # if symbol not valid, "search" function will raise error
-    lookup_dict = search(symbol).to_dict()
-    organ_code = lookup_dict.get("organ_code")[0]  # type: ignore
+    # Lookup organ_code matching ticker symbol in the cached symbol master
+    # if symbol not valid, "get_organ_code" function will raise error
+    if organ_code is None:
+        organ_code = get_organ_code(symbol)
 
     # API call
     number_periods = 100  # i.e. retrieve 100 years or 100 quarters of data
     current_year = str(datetime.now().year)
 
     url = f"https://fiin-fundamental.ssi.com.vn/FinancialStatement/Download{name_api}?language=en&OrganCode={organ_code}&Skip=0&Frequency={period_api}&numberOfPeriod={number_periods}&latestYear={current_year}"
-    response = requests.get(url, headers=ssi_headers)
+    response = http.get(url, headers=ssi_headers)
     check_response_error(response)
 
     # Parse API response then remove the first 7 rows and the last 3 rows
-    df = pd.read_excel(BytesIO(response.content), skiprows=7)
+    # with the fastest Excel engine installed, see vietfin.utils.excel
+    df = excel.read_sheet(response.content, skiprows=7)
     df = df.iloc[:-3]
 
     if df.empty:
@@ -101,35 +171,16 @@ def get_financial_report(
     if name == "cash":
         df = df.rename(columns={"Unnamed: 0": "ITEMS"})
 
-    # Prepare raw_data for VfObject
-    raw = df.to_dict(orient="list")
-
-    # Add 'period' column
-    df["period"] = period
+    # Prepare raw_data for VfObject, unless the raw data policy drops it
+    raw = None if get_raw_data_policy() == "none" else df.to_dict(orient="list")
 
-
-    # This regex match any string that starts with 'Q' followed by 1 or 2 digits and a space then ends with 4 digits (for quarters, e.g. Q01 2023)
-    # or just 4 digits (for years, e.g. 2023)
-    year_quarter_regex = re.compile(r"^(Q\d{1,2}\s)?\d{4}$")
-
-    # Identify column labels that represent years or quarters
-    period_columns = [
-        col for col in df.columns if year_quarter_regex.match(col)
-    ]
-
-    # Unpivot the DataFrame
-    df = pd.melt(
-        df,
-        id_vars=["ITEMS", "period"],
-        value_vars=period_columns,
-        var_name="fiscal_period",
-        value_name="values",
-    )
-
-    # Convert df to a list of dicts where each dict represents a row in the DataFrame
-    # This format is convenient to process the data row-wise, i.e. unpacking the dict to a pydantic model
-    rows = df.to_dict(orient="records")
-    output = [SsiEquityFundamentalIncomeData(**r) for r in rows]  # type: ignore
+    # Unpivot the DataFrame, all the periods at once
+    output: list[SsiEquityFundamentalIncomeData] | pd.DataFrame
+    output = _melt_statement(df, period)
+    if results_format == "models":
+        # One data model per line item and period
+        rows = output.to_dict(orient="records")
+        output = SsiEquityFundamentalIncomeData.validate_many(rows)
 
     # Additional metadata about the command run
     extra = generate_extra_metadata(symbol=symbol, result=output, api_url=url)
@@ -139,3 +190,38 @@ def get_financial_report(
     )
 
     return VfObject(results=output, provider="ssi", extra=extra, raw_data=raw)
+
+
+def get_financial_reports(
+    symbol: str, period: PERIODS = "annual", results_format: RESULTS_FORMATS = "models"
+) -> tuple[dict[str, VfObject], dict[str, Exception]]:
+    """Retrieve the income, balance sheet and cash flow statements of the given ticker concurrently.
+
+    The organization code of the ticker is looked up once, for the three statements.
+
+    Returns
+    -------
+    tuple[dict, dict]
+        results : dict[str, VfObject]
+            the result of get_financial_report() of each statement, keyed by statement name.
+        errors : dict[str, Exception]
+            the exception raised by each statement that failed, keyed by statement name.
+
+    Raises
+    ------
+    ValueError
+        if the ticker is not found
+    """
+    symbol = symbol.upper()
+    organ_code = get_organ_code(symbol)
+
+    def fetch(name: FINANCIAL_STATEMENTS) -> VfObject:
+        return get_financial_report(
+            symbol=symbol,
+            name=name,
+            period=period,
+            results_format=results_format,
+            organ_code=organ_code,
+        )
+
+    return run_concurrently(fetch, get_args(FINANCIAL_STATEMENTS), max_workers=3)
@@ -1,12 +1,15 @@
 """SSI Equity Search function."""
 
-import httpx as requests
+import copy
 
-from vietfin.providers.ssi.utils.helpers import ssi_headers
 from vietfin.abstract.vfobject import VfObject
 from vietfin.providers.ssi.models.equity_search import SsiEquitySearchData
-from vietfin.utils.helpers import generate_extra_metadata, check_response_error
-from vietfin.utils.errors import EmptyDataError
+from vietfin.providers.ssi.utils.symbol_master import (
+    ORGANIZATION_LIST_URL,
+    lookup,
+    symbol_master,
+)
+from vietfin.utils.helpers import generate_extra_metadata
 
 
 def search(symbol: str = "") -> VfObject:
@@ -36,28 +39,21 @@ def search(symbol: str = "") -> VfObject:
         if the API call failed
     EmptyDataError
         if the API response is empty
+    ValueError
+        if the symbol is not found
     """
 
     symbol = symbol.upper()
 
-    # API call
-    url = "https://fiin-core.ssi.com.vn/Master/GetListOrganization?language=vi"
-    response = requests.get(url, headers=ssi_headers)
-    check_response_error(response)
-    data = response.json()
-
-    rows = data["items"]
-    if not rows:
-        raise EmptyDataError(f"No data found for stock symbol: {symbol}")
+    # API call, the list of all organizations is cached, see symbol_master.py
+    master = symbol_master.get()
+    url = ORGANIZATION_LIST_URL
+    # a copy, so the caller cannot alter the cached list
+    data = copy.deepcopy(master.raw_data)
 
     # Filter results based on the provided symbol if it's not an empty string
-    if symbol:
-        rows = [
-            r for r in rows if r.get("ticker", "").upper() == symbol.upper()
-        ]
-
-        if not rows:
-            raise ValueError(f"No data found for stock symbol: {symbol}")
+    # if symbol not valid, "lookup" function will raise error
+    rows = [lookup(symbol)] if symbol else data["items"]
 
     # Unpack json to data model
     ticker_info: list[SsiEquitySearchData] = [
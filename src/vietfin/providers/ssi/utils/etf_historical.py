@@ -1,10 +1,12 @@
 """SSI Etf Historical function."""
 
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
-import httpx as requests
 from pydantic import field_validator, model_validator
 
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.ssi.utils.helpers import ssi_headers
 from vietfin.abstract.vfobject import VfObject
 from vietfin.providers.ssi.models.etf_historical import SsiEtfHistoricalData
@@ -12,11 +14,16 @@ from vietfin.utils.helpers import (
     generate_extra_metadata,
     check_response_error,
     BaseDateParams,
-    convert_dictlists_to_listdicts,
+    parse_ohlcv_columns,
     BaseOtherParams,
+    RESULTS_FORMATS,
 )
+from vietfin.utils.column_table import ColumnTable
 from vietfin.utils.errors import EmptyDataError
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class HistoricalParams(BaseDateParams):
     """Class to validate params of historical() function.
@@ -109,8 +116,83 @@ class HistoricalParams(BaseDateParams):
         return self
 
 
+def _prepare_request(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    interval: str,
+    results_format: RESULTS_FORMATS = "models",
+) -> tuple[str, str]:
+    """Validate the input params and build the API url of historical().
+
+    Returns
+    -------
+    tuple[str, str]
+        the validated symbol and the API url.
+    """
+    # Validate params
+    other_params = BaseOtherParams(symbol=symbol, results_format=results_format)
+    symbol = other_params.symbol
+
+    params = HistoricalParams(
+        start_date=start_date,
+        end_date=end_date,
+        interval=interval,
+    )
+    interval = params.interval
+    start_date = params.start_date  # type: ignore
+    end_date = params.end_date  # type: ignore
+
+    # convert date string into timestamp
+    start = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
+    end = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp())
+
+    url = f"https://iboard.ssi.com.vn/dchart/api/history?resolution={interval}&symbol={symbol}&from={start}&to={end}"
+
+    return symbol, url
+
+
+def _parse_response(
+    symbol: str, url: str, data: dict, results_format: RESULTS_FORMATS = "models"
+) -> VfObject:
+    """Unpack the API response of historical() into a VfObject."""
+
+    etf_list: list[SsiEtfHistoricalData] | pd.DataFrame
+    if results_format == "columns":
+        # The payload is already a dict-of-lists: convert the timestamps and the prices
+        # a whole column at a time, without transposing it into rows to validate
+        etf_list = parse_ohlcv_columns(data).sort_index(axis=0, kind="stable")
+    else:
+        # Read the rows straight from the columns, one dict at a time
+        rows = ColumnTable.from_dict(data).rows()
+
+        # Unpack json dict to data model
+        etf_list = SsiEtfHistoricalData.validate_many(rows)
+
+    if len(etf_list) == 0:
+        raise EmptyDataError
+
+    # Additional metadata about the command run
+    extra = generate_extra_metadata(symbol=symbol, result=etf_list, api_url=url)
+
+    print(
+        f"Retrieved {extra.get('records_count',[])} historical price data for symbol {symbol}."
+    )
+
+    return VfObject(
+        results=etf_list,
+        provider="ssi",
+        extra=extra,
+        raw_data=data,
+    )
+
+
 def historical(
-    symbol: str, start_date: str, end_date: str, interval: str
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    interval: str,
+    results_format: RESULTS_FORMATS = "models",
 ) -> VfObject:
     """Etf Historical. Retrieve historical price data of an ETF from SSI provider.
 
@@ -118,11 +200,14 @@ def historical(
     ----------
     symbol : str
         The ticker symbol of the Etf/stock to search for.
+    results_format : RESULTS_FORMATS
+        "models" (default) for a list of data models,
+        "columns" for a DataFrame validated column by column, faster for large results.
 
     Returns
     -------
     VfObject
-        results : list[SsiEtfHistoricalData]
+        results : list[SsiEtfHistoricalData] | pd.DataFrame
             historical price of an ETF/stock provided by SSI.
         provider : str
             Provider name: "ssi"
@@ -138,49 +223,36 @@ def historical(
     EmptyDataError
         if the API response is empty
     """
-
-    # Validate params
-    other_params = BaseOtherParams(symbol=symbol)
-    symbol = other_params.symbol
-    
-    params = HistoricalParams(
-        start_date=start_date,
-        end_date=end_date,
-        interval=interval,
+    symbol, url = _prepare_request(
+        symbol, start_date, end_date, interval, results_format
     )
-    interval = params.interval
-    start_date = params.start_date  # type: ignore
-    end_date = params.end_date  # type: ignore
-
-    # convert date string into timestamp
-    start = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
-    end = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp())
 
     # API call
-    url = f"https://iboard.ssi.com.vn/dchart/api/history?resolution={interval}&symbol={symbol}&from={start}&to={end}"
-    response = requests.get(url, headers=ssi_headers)
+    response = http.get(url, headers=ssi_headers)
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
 
-    rows = convert_dictlists_to_listdicts(data)
-    if not rows:
-        raise EmptyDataError
+    return _parse_response(symbol, url, data, results_format)
 
-    # Unpack json dict to data model
-    etf_list: list[SsiEtfHistoricalData] = [
-        SsiEtfHistoricalData(**r) for r in rows
-    ]
 
-    # Additional metadata about the command run
-    extra = generate_extra_metadata(symbol=symbol, result=etf_list, api_url=url)
+async def historical_async(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    interval: str,
+    results_format: RESULTS_FORMATS = "models",
+) -> VfObject:
+    """Async version of historical(), sending the request with the pooled async client.
 
-    print(
-        f"Retrieved {extra.get('records_count',[])} historical price data for symbol {symbol}."
+    See historical() for the description of the parameters and the returned VfObject.
+    """
+    symbol, url = _prepare_request(
+        symbol, start_date, end_date, interval, results_format
     )
 
-    return VfObject(
-        results=etf_list,
-        provider="ssi",
-        extra=extra,
-        raw_data=data,
-    )
+    # API call
+    response = await http.aget(url, headers=ssi_headers)
+    check_response_error(response)
+    data = response_json(response)
+
+    return _parse_response(symbol, url, data, results_format)
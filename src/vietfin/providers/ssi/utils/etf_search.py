@@ -1,7 +1,7 @@
 """SSI Etf Search function."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.ssi.utils.helpers import ssi_headers
 from vietfin.abstract.vfobject import VfObject
 from vietfin.providers.ssi.models.etf_search import SsiEtfSearchData
@@ -42,9 +42,9 @@ def search(symbol: str = "") -> VfObject:
 
     # API call
     url = "https://iboard-query.ssi.com.vn/v2/stock/type/e/hose"
-    response = requests.get(url, headers=ssi_headers)
+    response = http.get(url, headers=ssi_headers)
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
     rows = data["data"]
 
     if not rows:
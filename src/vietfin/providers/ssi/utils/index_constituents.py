@@ -1,7 +1,7 @@
 """SSI Index Constituents function."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.ssi.utils.helpers import ssi_headers
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import generate_extra_metadata, check_response_error
@@ -9,11 +9,15 @@ from vietfin.providers.ssi.models.index_constituents import (
     SsiIndexConstituentsData,
 )
 from vietfin.utils.errors import EmptyDataError
+from vietfin.utils.singleflight import coalesced
 
 
+@coalesced
 def constituents(symbol: str) -> VfObject:
     """Index Constituents. Load the constituents for a specific index from SSI provider.
 
+    Concurrent calls for the same index share a single call and its VfObject.
+
     Parameters
     ----------
     symbol : str
@@ -43,9 +47,9 @@ def constituents(symbol: str) -> VfObject:
 
     # API call
     url = f"https://iboard-query.ssi.com.vn/v2/stock/group/{symbol}"
-    response = requests.get(url, headers=ssi_headers)
+    response = http.get(url, headers=ssi_headers)
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
 
     rows = data["data"]
     if not rows:
@@ -1,7 +1,7 @@
 """SSI Index Search function."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.ssi.utils.helpers import ssi_headers
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import generate_extra_metadata, check_response_error
@@ -43,9 +43,9 @@ def search(symbol: str = "") -> VfObject:
 
     # API call
     url = "https://fiin-core.ssi.com.vn/Master/GetAllCompanyGroup?language=vi"
-    response = requests.get(url, headers=ssi_headers)
+    response = http.get(url, headers=ssi_headers)
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
 
     rows = data["items"]
     if not rows:
@@ -0,0 +1,83 @@
+"""SSI symbol master, the cached list of all listed organizations."""
+
+from typing import NamedTuple
+
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
+from vietfin.providers.ssi.utils.helpers import ssi_headers
+from vietfin.utils.cache import TTLCache
+from vietfin.utils.errors import EmptyDataError, SymbolNotFoundError
+from vietfin.utils.helpers import check_response_error
+
+ORGANIZATION_LIST_URL = (
+    "https://fiin-core.ssi.com.vn/Master/GetListOrganization?language=vi"
+)
+
+# The list of organizations is reloaded once a day
+SYMBOL_MASTER_TTL = 24 * 60 * 60
+
+
+class SymbolMaster(NamedTuple):
+    """List of all organizations listed on SSI, indexed by ticker."""
+
+    raw_data: dict  # raw data from the API call
+    by_ticker: dict[str, dict]  # raw record of each organization, keyed by uppercase ticker
+
+
+def _load_organizations() -> dict:
+    """Download the list of all organizations."""
+    response = http.get(ORGANIZATION_LIST_URL, headers=ssi_headers)
+    check_response_error(response)
+    data = response_json(response)
+
+    # never cache an empty list
+    if not data.get("items"):
+        raise EmptyDataError("No data found for the list of organizations.")
+
+    return data
+
+
+def _index_organizations(data: dict) -> SymbolMaster:
+    """Index the records of the organizations by ticker."""
+    by_ticker = {
+        r.get("ticker", "").upper(): r for r in data.get("items") or []
+    }
+    return SymbolMaster(raw_data=data, by_ticker=by_ticker)
+
+
+symbol_master: TTLCache[SymbolMaster] = TTLCache(
+    name="ssi_symbol_master",
+    loader=_load_organizations,
+    ttl=SYMBOL_MASTER_TTL,
+    parse=_index_organizations,
+)
+
+
+def lookup(symbol: str) -> dict:
+    """Return the raw record of the organization of a ticker.
+
+    Parameters
+    ----------
+    symbol : str
+        stock ticker
+
+    Returns
+    -------
+    dict
+        raw record of the organization, with keys like ticker, organName, organCode.
+
+    Raises
+    ------
+    SymbolNotFoundError
+        if the ticker is not found, a ValueError
+    """
+    # if the list of organizations is empty, "symbol_master" will raise EmptyDataError
+    record = symbol_master.get().by_ticker.get(symbol.upper())
+    if record is None:
+        raise SymbolNotFoundError(f"No data found for stock symbol: {symbol.upper()}")
+    return record
+
+
+def get_organ_code(symbol: str) -> str:
+    """Return the organization code of a ticker in SSI database."""
+    return lookup(symbol)["organCode"]
@@ -1,9 +1,33 @@
 """TCBS Equity Fundamental Income Model."""
 
+from typing import TYPE_CHECKING
+
 from pydantic import field_validator
 
 from vietfin.abstract.data import Data
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Mapping of the line items of the API to user-friendly strings
+ITEMS_MAP = {
+    # Income statement:
+    "grossProfit": "gross profit",
+    "operationIncome": "total operating income",
+    "operationExpense": "total operating expenses",
+    "interestExpense": "total interest expense",
+    # Balance sheet:
+    "cash": "cash and cash equivalents",
+    "asset": "total assets",
+    "equity": "total equity",
+    "debt": "total debt",
+    # Cashflow statement:
+    "fromSale": "net cash from operating activities",
+    "fromInvest": "net cash from investing activities",
+    "fromFinancial": "net cash from financing activities",
+    "freeCashFlow": "free cash flow",
+}
+
 
 class TcbsEquityFundamentalIncomeData(Data):
     """TCBS Equity Fundamental Income statement Data."""
@@ -32,22 +56,11 @@ class TcbsEquityFundamentalIncomeData(Data):
         This string mapping is based on my own experiences.
         """
 
-        str_map = {
-            # Income statement:
-            "grossProfit": "gross profit",
-            "operationIncome": "total operating income",
-            "operationExpense": "total operating expenses",
-            "interestExpense": "total interest expense",
-            # Balance sheet:
-            "cash": "cash and cash equivalents",
-            "asset": "total assets",
-            "equity": "total equity",
-            "debt": "total debt",
-            # Cashflow statement:
-            "fromSale": "net cash from operating activities",
-            "fromInvest": "net cash from investing activities",
-            "fromFinancial": "net cash from financing activities",
-            "freeCashFlow": "free cash flow",
-        }
-
-        return str_map.get(v, v)
+        return ITEMS_MAP.get(v, v)
+
+    @classmethod
+    def _transform_columns(cls, df: "pd.DataFrame") -> "pd.DataFrame":
+        """Vectorized version of parse_txt()."""
+        if "items" in df.columns:
+            df["items"] = df["items"].replace(ITEMS_MAP)
+        return df
@@ -1,8 +1,11 @@
 """Tcbs provider concrete class."""
 
+from typing import Iterator
+
 from vietfin.abstract.interface import (
     IEquity,
     IEquityPrice,
+    IEquityPriceAsync,
     IEquityOwnership,
     IEquityCalendar,
     IEquityFundamental,
@@ -12,9 +15,16 @@ from vietfin.abstract.interface import (
     IIndexPrice,
 )
 from vietfin.abstract.vfobject import VfObject
-from vietfin.utils.helpers import PERIODS
-from vietfin.providers.tcbs.utils.equity_price_historical import historical
-from vietfin.providers.tcbs.utils.equity_price_quote import quote
+from vietfin.utils.helpers import PERIODS, RESULTS_FORMATS
+from vietfin.providers.tcbs.utils.equity_price_historical import (
+    historical,
+    historical_async,
+)
+from vietfin.providers.tcbs.utils.equity_price_quote import (
+    quote,
+    quote_async,
+    iter_quote,
+)
 from vietfin.providers.tcbs.utils.equity_profile import profile
 from vietfin.providers.tcbs.utils.equity_ownership_insider_trading import (
     insider_trading,
@@ -22,13 +32,19 @@ from vietfin.providers.tcbs.utils.equity_ownership_insider_trading import (
 from vietfin.providers.tcbs.utils.equity_ownership_major_holders import (
     major_holders,
 )
-from vietfin.providers.tcbs.utils.equity_calendar_events import events
-from vietfin.providers.tcbs.utils.news_company import company
+from vietfin.providers.tcbs.utils.equity_calendar_events import (
+    events,
+    iter_events,
+)
+from vietfin.providers.tcbs.utils.news_company import company, iter_company
 from vietfin.providers.tcbs.utils.equity_fundamental_management import (
     management,
 )
 from vietfin.providers.tcbs.utils.equity_fundamental_ratios import ratios
-from vietfin.providers.tcbs.utils.equity_fundamental_dividends import dividends
+from vietfin.providers.tcbs.utils.equity_fundamental_dividends import (
+    dividends,
+    iter_dividends,
+)
 from vietfin.providers.tcbs.utils.equity_fundamental_income import (
     get_financial_report,
 )
@@ -52,7 +68,12 @@ class EquityPriceTcbs(IEquityPrice):
     """The concrete implementation of Equity.Price component with Tcbs as provider."""
 
     def historical(
-        self, symbol: str, start_date: str, end_date: str, interval: str
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: str,
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
         """Equity Historical price. Load stock historical price data of a specific ticker."""
         return historical(
@@ -62,12 +83,46 @@ class EquityPriceTcbs(IEquityPrice):
             interval=interval,
             api_endpoint="stock",
             query_param="stock",
+            results_format=results_format,
         )
 
     def quote(self, symbol: str, limit: int) -> VfObject:
         """Equity Quote. Load quote data of a specific ticker."""
         return quote(symbol=symbol, limit=limit)
 
+    def iter_quote(
+        self, symbol: str, limit: int, prefetch: int
+    ) -> Iterator[list]:
+        """Equity Quote, streamed page by page."""
+        return iter_quote(symbol=symbol, limit=limit, prefetch=prefetch)
+
+
+class EquityPriceTcbsAsync(IEquityPriceAsync):
+    """The concrete implementation of the async Equity.Price component with Tcbs as provider."""
+
+    async def historical(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: str,
+        results_format: RESULTS_FORMATS = "models",
+    ) -> VfObject:
+        """Equity Historical price. Load stock historical price data of a specific ticker."""
+        return await historical_async(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            interval=interval,
+            api_endpoint="stock",
+            query_param="stock",
+            results_format=results_format,
+        )
+
+    async def quote(self, symbol: str, limit: int) -> VfObject:
+        """Equity Quote. Load quote data of a specific ticker."""
+        return await quote_async(symbol=symbol, limit=limit)
+
 
 class EquityOwnershipTcbs(IEquityOwnership):
     """The concrete implementation of Equity.Ownership component with Tcbs as provider."""
@@ -100,6 +155,12 @@ class EquityCalendarTcbs(IEquityCalendar):
         """Equity Calendar Events. Load Historical All-event-type Calendar data for a specific ticker."""
         return events(symbol=symbol, limit=limit)
 
+    def iter_events(
+        self, symbol: str, limit: int, prefetch: int
+    ) -> Iterator[list]:
+        """Equity Calendar Events, streamed page by page."""
+        return iter_events(symbol=symbol, limit=limit, prefetch=prefetch)
+
 
 class EquityFundamentalTcbs(IEquityFundamental):
     """The concrete implementation of Equity.Fundamental component with Tcbs as provider."""
@@ -116,19 +177,35 @@ class EquityFundamentalTcbs(IEquityFundamental):
         """Equity Fundamental Dividends. Load Historical dividends data for a specific ticker."""
         return dividends(symbol=symbol, limit=limit)
 
-    def income(self, symbol: str, period: PERIODS) -> VfObject:
+    def iter_dividends(
+        self, symbol: str, limit: int, prefetch: int
+    ) -> Iterator[list]:
+        """Equity Fundamental Dividends, streamed page by page."""
+        return iter_dividends(symbol=symbol, limit=limit, prefetch=prefetch)
+
+    def income(
+        self, symbol: str, period: PERIODS, results_format: RESULTS_FORMATS = "models"
+    ) -> VfObject:
         """Equity Fundamental Income. Load Historical income statement data for a specific ticker."""
-        return get_financial_report(symbol=symbol, period=period, name="income")
+        return get_financial_report(
+            symbol=symbol, period=period, name="income", results_format=results_format
+        )
 
-    def balance(self, symbol: str, period: PERIODS) -> VfObject:
+    def balance(
+        self, symbol: str, period: PERIODS, results_format: RESULTS_FORMATS = "models"
+    ) -> VfObject:
         """Equity Fundamental Balance. Load Historical balance sheet statement data for a specific ticker."""
         return get_financial_report(
-            symbol=symbol, period=period, name="balance"
+            symbol=symbol, period=period, name="balance", results_format=results_format
         )
 
-    def cash(self, symbol: str, period: PERIODS) -> VfObject:
+    def cash(
+        self, symbol: str, period: PERIODS, results_format: RESULTS_FORMATS = "models"
+    ) -> VfObject:
         """Equity Fundamental Cash. Load Historical cash flow statement data for a specific ticker."""
-        return get_financial_report(symbol=symbol, period=period, name="cash")
+        return get_financial_report(
+            symbol=symbol, period=period, name="cash", results_format=results_format
+        )
 
     def multiples(self, symbol: str, period: PERIODS) -> VfObject:
         """Equity Fundamental Multiples. Load Historical valuation multiples data for a specific ticker."""
@@ -173,7 +250,12 @@ class EtfTcbs(IEtf):
     """The concrete implementation of ETF component with Tcbs as provider."""
 
     def historical(
-        self, symbol: str, start_date: str, end_date: str, interval: str
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: str,
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
         """ETF Historical price. Load historical price data of a specific ticker.
 
@@ -186,6 +268,7 @@ class EtfTcbs(IEtf):
             interval=interval,
             api_endpoint="stock",
             query_param="stock",
+            results_format=results_format,
         )
 
     def search(self, symbol: str) -> VfObject:
@@ -201,12 +284,23 @@ class NewsTcbs(INews):
         """News Company. Load company news data of a specific ticker."""
         return company(symbol=symbol, limit=limit)
 
+    def iter_company(
+        self, symbol: str, limit: int, prefetch: int
+    ) -> Iterator[list]:
+        """News Company, streamed page by page."""
+        return iter_company(symbol=symbol, limit=limit, prefetch=prefetch)
+
 
 class IndexPriceTcbs(IIndexPrice):
     """The concrete implementation of Index.Price component with Tcbs as provider."""
 
     def historical(
-        self, symbol: str, start_date: str, end_date: str, interval: str
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: str,
+        results_format: RESULTS_FORMATS = "models",
     ) -> VfObject:
         """Index Historical price. Load historical price data of a specific ticker.
 
@@ -219,4 +313,5 @@ class IndexPriceTcbs(IIndexPrice):
             interval=interval,
             api_endpoint="stock",
             query_param="index",
+            results_format=results_format,
         )
@@ -1,7 +1,9 @@
 """TCBS Equity Calendar dividend() command."""
 
-import httpx as requests
+from typing import Iterator
 
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.tcbs.utils.helpers import tcbs_headers
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import (
@@ -13,6 +15,28 @@ from vietfin.providers.tcbs.models.equity_calendar_events import (
     TcbsEquityCalendarEventsData,
 )
 from vietfin.utils.errors import EmptyDataError
+from vietfin.utils.pagination import (
+    DEFAULT_PREFETCH_WINDOW,
+    fetch_pages,
+    iter_pages,
+)
+
+
+def _get_rows(data_chunk: dict) -> list[dict]:
+    """Return the records of a page."""
+    return data_chunk.get("listEventNews", [])
+
+
+def _page_fetcher(symbol: str, page_size: int):
+    """Return the function fetching a page of records."""
+
+    def fetch_page(page: int) -> tuple[str, dict]:
+        url = f"https://apipubaws.tcbs.com.vn/tcanalysis/v1/ticker/{symbol}/events-news?page={page}&size={page_size}"
+        response = http.get(url, headers=tcbs_headers)
+        check_response_error(response)
+        return url, response_json(response)
+
+    return fetch_page
 
 
 def events(symbol: str, limit: int = 100) -> VfObject:
@@ -60,34 +84,18 @@ def events(symbol: str, limit: int = 100) -> VfObject:
 
     # API logic: paginated returns up to 100 records per page per single API call
     page_size = 100 if (limit == 0 or limit > 100) else limit
-    page = 0  # start from the 1st page
-    events_list = []
-    url_list = []
-    data = []
 
-    # API call
-    while True:
-        url = f"https://apipubaws.tcbs.com.vn/tcanalysis/v1/ticker/{symbol}/events-news?page={page}&size={page_size}"
-        response = requests.get(url, headers=tcbs_headers)
-        check_response_error(response)
-        data_chunk = response.json()
-        rows = data_chunk.get("listEventNews", [])
-        
-        if not rows:
-            break  # stop if no more data
-
-        url_list.append(url)
-        data.append(data_chunk)
-
-        # Unpack json to data model and return the results
-        events_list.extend([TcbsEquityCalendarEventsData(**r) for r in rows])
-
-        if 0 < limit <= len(events_list):
-            events_list = events_list[:limit]
-            break  # stop if limit reached
+    # API call: the pages after the 1st one are fetched concurrently
+    url_list, data, rows = fetch_pages(
+        _page_fetcher(symbol, page_size),
+        _get_rows,
+        limit=limit,
+        page_size=page_size,
+        total_key="total",
+    )
 
-        # increment page number to continue fetching until no more data
-        page += 1
+    # Unpack json to data model and return the results
+    events_list = [TcbsEquityCalendarEventsData(**r) for r in rows]
 
     if not events_list:
         raise EmptyDataError
@@ -104,3 +112,51 @@ def events(symbol: str, limit: int = 100) -> VfObject:
     return VfObject(
         results=events_list, provider="tcbs", extra=extra, raw_data=data
     )
+
+
+def iter_events(
+    symbol: str, limit: int = 0, prefetch: int = DEFAULT_PREFETCH_WINDOW
+) -> Iterator[list[TcbsEquityCalendarEventsData]]:
+    """Stream Equity Calendar Events data of the given ticker, page by page.
+
+    See equity_price_quote.iter_quote() for the streaming behavior.
+
+    Parameters
+    ----------
+    symbol : str
+        stock ticker
+    limit : int
+        limit of number of records to be retrieved
+        0 will return all records
+        Default 0
+    prefetch : int
+        maximum number of pages fetched ahead of the consumer. Default 4.
+
+    Yields
+    ------
+    list[TcbsEquityCalendarEventsData]
+        calendar events data of each page, in order. Nothing is yielded if there is no data.
+
+    Raises
+    ------
+    ValidationError
+        if the input param are invalid
+    HttpError
+        if an API call failed
+    """
+
+    # Validate input param
+    params = BaseOtherParams(symbol=symbol, limit=limit)
+    symbol = params.symbol
+    limit = params.limit
+    page_size = 100 if (limit == 0 or limit > 100) else limit
+
+    pages = iter_pages(
+        _page_fetcher(symbol, page_size),
+        _get_rows,
+        limit=limit,
+        page_size=page_size,
+        window=prefetch,
+        total_key="total",
+    )
+    return ([TcbsEquityCalendarEventsData(**r) for r in rows] for _, _, rows in pages)
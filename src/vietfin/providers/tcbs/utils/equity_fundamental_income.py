@@ -1,8 +1,7 @@
 """TCBS Equity Fundamental Income command."""
 
-import httpx as requests
-import pandas as pd
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import (
     check_response_error,
@@ -10,6 +9,7 @@ from vietfin.utils.helpers import (
     FINANCIAL_STATEMENTS,
     BaseOtherParams,
     PERIODS,
+    RESULTS_FORMATS,
 )
 from vietfin.providers.tcbs.utils.helpers import tcbs_headers
 from vietfin.providers.tcbs.models.equity_fundamental_income import (
@@ -19,7 +19,10 @@ from vietfin.utils.errors import EmptyDataError
 
 
 def get_financial_report(
-    symbol: str, name: FINANCIAL_STATEMENTS, period: PERIODS = "annual"
+    symbol: str,
+    name: FINANCIAL_STATEMENTS,
+    period: PERIODS = "annual",
+    results_format: RESULTS_FORMATS = "models",
 ) -> VfObject:
     """Retrieve Equity Fundamental financial statement data of the given ticker.
 
@@ -33,11 +36,14 @@ def get_financial_report(
         financial statement name
     period : str
         time period of the data to return
+    results_format : RESULTS_FORMATS
+        "models" (default) for a list of data models,
+        "columns" for a long DataFrame validated column by column, faster for large results.
 
     Returns
     -------
     VfObject
-        results : list[TcbsEquityFundamentalIncomeData]
+        results : list[TcbsEquityFundamentalIncomeData] | pd.DataFrame
             historical income/balance/cashflow data of the given ticker
         provider : str
             provider name 'tcbs'
@@ -58,7 +64,10 @@ def get_financial_report(
 
     # Validate input param
     params = BaseOtherParams(
-        symbol=symbol, financial_statement=name, period=period
+        symbol=symbol,
+        financial_statement=name,
+        period=period,
+        results_format=results_format,
     )
     symbol = params.symbol
     name = params.financial_statement
@@ -81,9 +90,9 @@ def get_financial_report(
     # API call
     url = f"https://apipubaws.tcbs.com.vn/tcanalysis/v1/finance/{symbol}/{name_api}"
     query_params = {"yearly": is_annual, "isAll": True}
-    response = requests.get(url, params=query_params, headers=tcbs_headers)
+    response = http.get(url, params=query_params, headers=tcbs_headers)
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
     rows = data
 
     if not rows:
@@ -93,6 +102,8 @@ def get_financial_report(
     for r in rows:
         r["period"] = period
 
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     # Unpivot the rows dict
     df = pd.DataFrame(rows)
     df = pd.melt(
@@ -102,10 +113,17 @@ def get_financial_report(
         value_name="values",
     )
 
-    # Convert df to a list of dicts where each dictionary represents a row in the DataFrame
-    # This format is convenient to process the data row-wise, i.e. unpacking the dict to a pydantic model
-    rows = df.to_dict(orient="records")
-    output = [TcbsEquityFundamentalIncomeData(**r) for r in rows]
+    output: list[TcbsEquityFundamentalIncomeData] | pd.DataFrame
+    if results_format == "columns":
+        # Validate the long DataFrame column by column, without a model per row
+        output = TcbsEquityFundamentalIncomeData.validate_columns(
+            df.to_dict(orient="list")
+        )
+    else:
+        # Convert df to a list of dicts where each dictionary represents a row in the DataFrame
+        # This format is convenient to process the data row-wise, i.e. unpacking the dict to a pydantic model
+        rows = df.to_dict(orient="records")
+        output = [TcbsEquityFundamentalIncomeData(**r) for r in rows]
 
     # Additional metadata about the command run
     extra = generate_extra_metadata(symbol=symbol, result=output, api_url=url)
@@ -1,7 +1,7 @@
 """TCBS Equity Fundamental Management command."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import (
     check_response_error,
@@ -61,9 +61,9 @@ def management(symbol: str) -> VfObject:
     # API call
     while True:
         url = f"https://apipubaws.tcbs.com.vn/tcanalysis/v1/company/{symbol}/key-officers?page={page}&size={page_size}"
-        response = requests.get(url, headers=tcbs_headers)
+        response = http.get(url, headers=tcbs_headers)
         check_response_error(response)
-        data_chunk = response.json()
+        data_chunk = response_json(response)
         rows = data_chunk.get("listKeyOfficer",[])
 
         if not rows:
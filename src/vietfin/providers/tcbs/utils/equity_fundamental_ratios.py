@@ -1,7 +1,7 @@
 """TCBS Equity Fundamental Ratios command."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import (
     check_response_error,
@@ -66,9 +66,9 @@ def ratios(symbol: str, period: PERIODS = "annual") -> VfObject:
 
     # API call
     url = f"https://apipubaws.tcbs.com.vn/tcanalysis/v1/finance/{symbol}/financialratio?yearly={is_annual}&isAll=true"
-    response = requests.get(url, headers=tcbs_headers)
+    response = http.get(url, headers=tcbs_headers)
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
     rows = data
 
     if not rows:
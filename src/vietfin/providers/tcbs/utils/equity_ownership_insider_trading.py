@@ -1,7 +1,7 @@
 """TCBS Equity Ownership insider_trading() command."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.tcbs.utils.helpers import tcbs_headers
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import (
@@ -68,9 +68,9 @@ def insider_trading(symbol: str, limit: int = 100) -> VfObject:
     # API call
     while True:
         url = f"https://apipubaws.tcbs.com.vn/tcanalysis/v1/company/{symbol}/insider-dealing?page={page}&size={page_size}"
-        response = requests.get(url, headers=tcbs_headers)
+        response = http.get(url, headers=tcbs_headers)
         check_response_error(response)
-        data_chunk = response.json()
+        data_chunk = response_json(response)
         rows = data_chunk.get("listInsiderDealing", [])
 
         if not rows:
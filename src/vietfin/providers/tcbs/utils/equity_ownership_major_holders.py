@@ -1,7 +1,7 @@
 """TCBS Equity Ownership major_holders() command."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.tcbs.utils.helpers import tcbs_headers
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import (
@@ -53,9 +53,9 @@ def major_holders(symbol: str) -> VfObject:
 
     # API call
     url = f"https://apipubaws.tcbs.com.vn/tcanalysis/v1/company/{symbol}/large-share-holders"
-    response = requests.get(url, headers=tcbs_headers)
+    response = http.get(url, headers=tcbs_headers)
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
     rows = data.get("listShareHolder", [])
 
     if not rows:
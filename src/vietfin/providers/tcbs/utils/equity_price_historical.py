@@ -1,11 +1,15 @@
 """TCBS Equity Price Historical command."""
 
-from datetime import timedelta, datetime
-from typing import Literal
+import asyncio
+from datetime import date, timedelta, datetime
+from typing import TYPE_CHECKING, Literal
 
-import httpx as requests
-from pydantic import field_validator
+import httpx
+from pydantic import BaseModel, field_validator
 
+from vietfin.utils import http
+from vietfin.utils.jsonlib import decode_records, response_json
+from vietfin.utils.raw_data import get_raw_data_policy
 from vietfin.providers.tcbs.utils.helpers import tcbs_headers
 from vietfin.providers.tcbs.models.equity_price_historical import (
     TcbsEquityHistoricalPriceData,
@@ -16,9 +20,14 @@ from vietfin.utils.helpers import (
     check_response_error,
     BaseDateParams,
     BaseOtherParams,
+    RESULTS_FORMATS,
 )
+from vietfin.utils.concurrency import map_concurrently
 from vietfin.utils.errors import EmptyDataError
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 # UTLIS
 
@@ -47,10 +56,190 @@ class HistoricalParams(BaseOtherParams):
 QueryParams = Literal["stock", "index", "derivative"]
 ApiEndpoint = Literal["stock", "futures"]
 
+# Maximum number of chunks of a single query fetched at the same time
+MAX_CHUNK_WORKERS = 8
+
+
+class _HistoricalRequest(BaseModel):
+    """Validated params of historical(), shared by its sync and async versions."""
+
+    symbol: str
+    interval: str
+    start_date: date
+    end_date: date
+    api_endpoint: str
+    query_param: str
+    results_format: RESULTS_FORMATS = "models"
+
+    def chunk_url(self, chunk_start: datetime, chunk_end: datetime) -> str:
+        """Build the API url of the chunk of data points from chunk_start to chunk_end."""
+
+        # API logic: returns n daily price data points (max 365, operating days) counting back from the end_date timestamp
+        chunk_days = (chunk_end - chunk_start).days
+        chunk_end_timestamp = int(chunk_end.timestamp())
+
+        return f"https://apipubaws.tcbs.com.vn/{self.api_endpoint}-insight/v2/stock/bars-long-term?ticker={self.symbol}&type={self.query_param}&resolution={self.interval}&to={chunk_end_timestamp}&countBack={chunk_days}"
+
 
 # MAIN
 
 
+def _prepare_request(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    interval: str,
+    api_endpoint: ApiEndpoint,
+    query_param: QueryParams,
+    results_format: RESULTS_FORMATS = "models",
+) -> _HistoricalRequest:
+    """Validate the input params of historical()."""
+
+    # Validate input param
+    date_params = BaseDateParams(
+        start_date=start_date,
+        end_date=end_date,
+    )
+    params = HistoricalParams(
+        symbol=symbol,
+        interval=interval,  # type: ignore
+    )
+
+    # convert str to date object
+    return _HistoricalRequest(
+        symbol=params.symbol,
+        interval=params.interval,
+        start_date=datetime.strptime(date_params.start_date, "%Y-%m-%d").date(),  # type: ignore
+        end_date=datetime.strptime(date_params.end_date, "%Y-%m-%d").date(),  # type: ignore
+        api_endpoint=api_endpoint,
+        query_param=query_param,
+        results_format=results_format,
+    )
+
+
+def _chunk_plan(req: _HistoricalRequest) -> list[tuple[datetime, datetime]]:
+    """Split the requested date range into chunks of up to 365 days.
+
+    The chunk boundaries only depend on the requested date range,
+    so all chunks are known before the first API call.
+
+    Returns
+    -------
+    list[tuple[datetime, datetime]]
+        the start and end datetime of each chunk, in chronological order.
+    """
+
+    # convert date to datetime object
+    start_dt = datetime.combine(req.start_date, datetime.min.time())
+    end_dt = datetime.combine(req.end_date, datetime.min.time())
+
+    chunks = []
+    while start_dt < end_dt:
+        # Calculate the number of days for the current chunk (up to 365 days)
+        delta_days = (end_dt - start_dt).days
+        chunk_days = min(delta_days, 365)
+
+        # Calculate end datetime for the current chunk
+        chunk_end = start_dt + timedelta(days=chunk_days)
+        chunks.append((start_dt, chunk_end))
+
+        # Update start_dt to the next chunk's start date
+        start_dt = chunk_end
+
+    return chunks
+
+
+def _parse_response(
+    req: _HistoricalRequest,
+    rows: list[dict],
+    url_list: list[str],
+    data: list[dict],
+) -> VfObject:
+    """Unpack the data points of all chunks into a VfObject."""
+
+    symbol = req.symbol
+
+    equity_price_historical: "list[TcbsEquityHistoricalPriceData] | pd.DataFrame"
+    if req.results_format == "columns":
+        # Validate the rows column by column, without a model per row
+        df = TcbsEquityHistoricalPriceData.validate_columns(rows)
+
+        if df.empty:
+            raise EmptyDataError(f"No data found for this {symbol} ticker.")
+
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        # Same as below: de-duplicate by date, filter the date range, sort by date
+        df = df[~df.index.duplicated(keep="last")]
+        equity_price_historical = df.loc[
+            pd.Timestamp(req.start_date) : pd.Timestamp(req.end_date)
+        ]
+    else:
+        # Add each element of rows data to the output list
+        equity_price_historical = TcbsEquityHistoricalPriceData.validate_many(rows)
+
+        if not equity_price_historical:
+            raise EmptyDataError(f"No data found for this {symbol} ticker.")
+
+        # Consecutive chunks overlap, since countBack counts operating days.
+        # De-duplicate the data points by date, then sort them in chronological order.
+        # Filter out the data that is not within the input date range
+        unique_dates = {
+            item.date: item
+            for item in equity_price_historical
+            if req.start_date <= item.date <= req.end_date
+        }
+        equity_price_historical = [unique_dates[d] for d in sorted(unique_dates)]
+
+    # Generate extra metadata
+    extra = generate_extra_metadata(
+        symbol=symbol, result=equity_price_historical, api_url=url_list
+    )
+
+    print(
+        f"Retrieved {extra.get('records_count',[])} historical price data point for symbol {symbol}."
+    )
+
+    return VfObject(
+        results=equity_price_historical,
+        provider="tcbs",
+        extra=extra,
+        raw_data=data,
+    )
+
+
+def _decode_chunk(response: httpx.Response, keep_raw: bool) -> dict:
+    """Decode the data points of a chunk, only the fields of the model if the raw data is not kept."""
+    if keep_raw:
+        return response_json(response)  # data type : list-of-dicts
+    return {
+        "data": decode_records(
+            response.content, TcbsEquityHistoricalPriceData, ("data",)
+        )
+    }
+
+
+def _merge_chunks(
+    req: _HistoricalRequest, responses: list[tuple[str, dict]]
+) -> VfObject:
+    """Merge the API responses of all chunks, skipping the chunks without data."""
+
+    url_list = []
+    data = []
+    rows: list[dict] = []
+
+    for url, data_chunk in responses:
+        chunk_rows = data_chunk.get("data", [])
+        if not chunk_rows:
+            continue  # skip if no data in this chunk, e.g. before the listing date
+
+        url_list.append(url)
+        data.append(data_chunk)
+        rows.extend(chunk_rows)
+
+    return _parse_response(req, rows, url_list, data)
+
+
 def historical(
     symbol: str,
     start_date: str,
@@ -58,6 +247,7 @@ def historical(
     interval: str = "D",
     api_endpoint: ApiEndpoint = "stock",
     query_param: QueryParams = "stock",
+    results_format: RESULTS_FORMATS = "models",
 ) -> VfObject:
     """Retrieve Historical price data of a specific ticker.
 
@@ -73,11 +263,14 @@ def historical(
         start date string in YYYY-MM-DD format
     end_date : str
         end date string in YYYY-MM-DD format
+    results_format : RESULTS_FORMATS
+        "models" (default) for a list of data models,
+        "columns" for a DataFrame validated column by column, faster for large results.
 
     Returns
     -------
     VfObject
-        results : list[TcbsEquityHistoricalPriceData]
+        results : list[TcbsEquityHistoricalPriceData] | pd.DataFrame
             equity historical price data of the given ticker
         provider : str
             provider name 'tcbs'
@@ -95,87 +288,66 @@ def historical(
     EmptyDataError
         if the API response is empty
     """
-
-    # Validate input param
-    date_params = BaseDateParams(
-        start_date=start_date,
-        end_date=end_date,
-    )
-    start_date = date_params.start_date  # type: ignore
-    end_date = date_params.end_date  # type: ignore
-    params = HistoricalParams(
-        symbol=symbol,
-        interval=interval,  # type: ignore
+    req = _prepare_request(
+        symbol,
+        start_date,
+        end_date,
+        interval,
+        api_endpoint,
+        query_param,
+        results_format,
     )
-    symbol = params.symbol
-    interval = params.interval
-
-    # convert str to date object
-    input_start_date = datetime.strptime(start_date, "%Y-%m-%d").date()  # type: ignore
-    input_end_date = datetime.strptime(end_date, "%Y-%m-%d").date()  # type: ignore
-
-    # API logic: returns n daily price data points (max 365, operating days) counting back from the end_date timestamp
-    # convert str to datetime object
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")  # type: ignore
-    end_dt = datetime.strptime(end_date, "%Y-%m-%d")  # type: ignore
-
-    # Loop until all data within the date range is fetched
-    url_list = []
-    data = []
-    equity_price_historical: list[TcbsEquityHistoricalPriceData] = []
 
-    while start_dt < end_dt:
-        # Calculate the number of days for the current chunk (up to 365 days)
-        delta_days = (end_dt - start_dt).days
-        chunk_days = min(delta_days, 365)
-
-        # Calculate end timestamp for the current chunk
-        current_end_dt = start_dt + timedelta(days=chunk_days)
-        current_end_timestamp = int(current_end_dt.timestamp())
+    keep_raw = get_raw_data_policy() != "none"
 
-        # API call
-        url = f"https://apipubaws.tcbs.com.vn/{api_endpoint}-insight/v2/stock/bars-long-term?ticker={symbol}&type={query_param}&resolution={interval}&to={current_end_timestamp}&countBack={chunk_days}"
-        response = requests.get(url, headers=tcbs_headers)
+    def fetch_chunk(chunk: tuple[datetime, datetime]) -> tuple[str, dict]:
+        url = req.chunk_url(*chunk)
+        response = http.get(url, headers=tcbs_headers)
         check_response_error(response)
-        data_chunk = response.json()  # data type : list-of-dicts
-        rows = data_chunk.get("data", [])
+        return url, _decode_chunk(response, keep_raw)
 
-        if not rows:
-            break  # stop if no more data
+    # API call: all chunks are fetched concurrently
+    responses = map_concurrently(
+        fetch_chunk, _chunk_plan(req), max_workers=MAX_CHUNK_WORKERS
+    )
 
-        url_list.append(url)
-        data.append(data_chunk)
+    return _merge_chunks(req, responses)
 
-        # Add each element of rows data to the output list
-        equity_price_historical.extend(
-            [TcbsEquityHistoricalPriceData(**r) for r in rows]
-        )
 
-        # Update start_dt to the next chunk's start date
-        start_dt = current_end_dt
+async def historical_async(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    interval: str = "D",
+    api_endpoint: ApiEndpoint = "stock",
+    query_param: QueryParams = "stock",
+    results_format: RESULTS_FORMATS = "models",
+) -> VfObject:
+    """Async version of historical(), sending the requests with the pooled async client.
 
-    if not equity_price_historical:
-        raise EmptyDataError(f"No data found for this {symbol} ticker.")
+    See historical() for the description of the parameters and the returned VfObject.
+    """
+    req = _prepare_request(
+        symbol,
+        start_date,
+        end_date,
+        interval,
+        api_endpoint,
+        query_param,
+        results_format,
+    )
 
-    # Filter out the data that is not within the input date range
-    equity_price_historical = [
-        item
-        for item in equity_price_historical
-        if input_start_date <= item.date <= input_end_date
-    ]
+    keep_raw = get_raw_data_policy() != "none"
 
-    # Generate extra metadata
-    extra = generate_extra_metadata(
-        symbol=symbol, result=equity_price_historical, api_url=url_list
-    )
+    async def fetch_chunk(chunk: tuple[datetime, datetime]) -> tuple[str, dict]:
+        url = req.chunk_url(*chunk)
+        response = await http.aget(url, headers=tcbs_headers)
+        check_response_error(response)
+        return url, _decode_chunk(response, keep_raw)
 
-    print(
-        f"Retrieved {extra.get('records_count',[])} historical price data point for symbol {symbol}."
+    # API call: all chunks are fetched concurrently
+    responses = await asyncio.gather(
+        *[fetch_chunk(chunk) for chunk in _chunk_plan(req)]
     )
 
-    return VfObject(
-        results=equity_price_historical,
-        provider="tcbs",
-        extra=extra,
-        raw_data=data,
-    )
+    return _merge_chunks(req, list(responses))
@@ -1,7 +1,9 @@
 """TCBS Equity Price Quote command."""
 
-import httpx as requests
+from typing import Iterator
 
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import (
     check_response_error,
@@ -13,6 +15,64 @@ from vietfin.providers.tcbs.models.equity_price_quote import (
     TcbsEquityPriceQuoteData,
 )
 from vietfin.utils.errors import EmptyDataError
+from vietfin.utils.pagination import (
+    DEFAULT_PREFETCH_WINDOW,
+    afetch_pages,
+    fetch_pages,
+    iter_pages,
+)
+
+
+def _page_url(symbol: str, page: int, page_size: int) -> str:
+    """Build the API url of a page of intraday quotes."""
+    return f"https://apipubaws.tcbs.com.vn/stock-insight/v1/intraday/{symbol}/investor/his/paging?page={page}&size={page_size}&headIndex=-1"
+
+
+def _get_rows(data_chunk: dict) -> list[dict]:
+    """Return the quotes of a page."""
+    return data_chunk.get("data", [])
+
+
+def _page_size(limit: int) -> int:
+    """API logic: paginated returns up to 100 records per page per single API call."""
+    return 100 if (limit == 0 or limit > 100) else limit
+
+
+def _page_fetcher(symbol: str, page_size: int):
+    """Return the function fetching a page of intraday quotes."""
+
+    def fetch_page(page: int) -> tuple[str, dict]:
+        url = _page_url(symbol, page, page_size)
+        response = http.get(url, headers=tcbs_headers)
+        check_response_error(response)
+        return url, response_json(response)
+
+    return fetch_page
+
+
+def _parse_response(
+    symbol: str,
+    price_quotes: list[TcbsEquityPriceQuoteData],
+    url_list: list[str],
+    data: list[dict],
+) -> VfObject:
+    """Wrap the quotes of all pages into a VfObject."""
+
+    if not price_quotes:
+        raise EmptyDataError(f"No data found for this {symbol} ticker.")
+
+    # Additional metadata about the command run
+    extra = generate_extra_metadata(
+        symbol=symbol, result=price_quotes, api_url=url_list
+    )
+
+    print(
+        f"Retrieved {extra.get('records_count',[])} intraday quotes for stock ticker {symbol}."
+    )
+
+    return VfObject(
+        results=price_quotes, provider="tcbs", extra=extra, raw_data=data
+    )
 
 
 def quote(symbol: str, limit: int = 100) -> VfObject:
@@ -59,49 +119,99 @@ def quote(symbol: str, limit: int = 100) -> VfObject:
     symbol = params.symbol
     limit = params.limit
 
-    # API logic: paginated returns up to 100 records per page per single API call
-    page_size = 100 if (limit == 0 or limit > 100) else limit
-    page = 0  # start from the 1st page
-    price_quotes = []
-    url_list = []
-    data = []
-
-    # API call
-    while True:
-        url = f"https://apipubaws.tcbs.com.vn/stock-insight/v1/intraday/{symbol}/investor/his/paging?page={page}&size={page_size}&headIndex=-1"
-        response = requests.get(url, headers=tcbs_headers)
-        check_response_error(response)
-        data_chunk = response.json()
-        rows = data_chunk.get("data", [])
+    page_size = _page_size(limit)
 
-        if not rows:
-            break  # stop if no more data
+    # API call: the pages after the 1st one are fetched concurrently
+    url_list, data, rows = fetch_pages(
+        _page_fetcher(symbol, page_size),
+        _get_rows,
+        limit=limit,
+        page_size=page_size,
+        total_key="total",
+    )
 
-        url_list.append(url)
-        data.append(data_chunk)
+    # Add each element of rows into the output list
+    price_quotes = TcbsEquityPriceQuoteData.validate_many(rows)
 
-        # Add each element of rows into the output list
-        price_quotes.extend([TcbsEquityPriceQuoteData(**r) for r in rows])
+    return _parse_response(symbol, price_quotes, url_list, data)
 
-        if 0 < limit <= len(price_quotes):
-            price_quotes = price_quotes[:limit]
-            break  # stop if limit reached
 
-        # increment page number to continue fetching until no more data
-        page += 1
+async def quote_async(symbol: str, limit: int = 100) -> VfObject:
+    """Async version of quote(), sending the requests with the pooled async client.
 
-    if not price_quotes:
-        raise EmptyDataError(f"No data found for this {symbol} ticker.")
+    See quote() for the description of the parameters and the returned VfObject.
+    """
 
-    # Additional metadata about the command run
-    extra = generate_extra_metadata(
-        symbol=symbol, result=price_quotes, api_url=url_list
+    # Validate input param
+    params = BaseOtherParams(
+        symbol=symbol,
+        limit=limit,
     )
+    symbol = params.symbol
+    limit = params.limit
 
-    print(
-        f"Retrieved {extra.get('records_count',[])} intraday quotes for stock ticker {symbol}."
+    page_size = _page_size(limit)
+
+    async def fetch_page(page: int) -> tuple[str, dict]:
+        url = _page_url(symbol, page, page_size)
+        response = await http.aget(url, headers=tcbs_headers)
+        check_response_error(response)
+        return url, response_json(response)
+
+    # API call
+    url_list, data, rows = await afetch_pages(
+        fetch_page, _get_rows, limit=limit, page_size=page_size, total_key="total"
     )
+    price_quotes = TcbsEquityPriceQuoteData.validate_many(rows)
 
-    return VfObject(
-        results=price_quotes, provider="tcbs", extra=extra, raw_data=data
+    return _parse_response(symbol, price_quotes, url_list, data)
+
+
+def iter_quote(
+    symbol: str, limit: int = 0, prefetch: int = DEFAULT_PREFETCH_WINDOW
+) -> Iterator[list[TcbsEquityPriceQuoteData]]:
+    """Stream Equity Price Quote intraday data of the given ticker, page by page.
+
+    Unlike quote(), the pages are not accumulated in memory: each page is parsed and yielded
+    as soon as it arrives, and no more than `prefetch` pages are fetched ahead of the consumer.
+    Stopping the iteration (e.g. `break`) stops fetching pages.
+
+    Parameters
+    ----------
+    symbol : str
+        stock/etf ticker
+    limit : int
+        limit of number of records to be retrieved
+        0 will return all records
+        Default 0
+    prefetch : int
+        maximum number of pages fetched ahead of the consumer. Default 4.
+
+    Yields
+    ------
+    list[TcbsEquityPriceQuoteData]
+        equity quote data of each page, in order. Nothing is yielded if there is no data.
+
+    Raises
+    ------
+    ValidationError
+        if the input param are invalid
+    HttpError
+        if an API call failed
+    """
+
+    # Validate input param
+    params = BaseOtherParams(symbol=symbol, limit=limit)
+    symbol = params.symbol
+    limit = params.limit
+    page_size = _page_size(limit)
+
+    pages = iter_pages(
+        _page_fetcher(symbol, page_size),
+        _get_rows,
+        limit=limit,
+        page_size=page_size,
+        window=prefetch,
+        total_key="total",
     )
+    return (TcbsEquityPriceQuoteData.validate_many(rows) for _, _, rows in pages)
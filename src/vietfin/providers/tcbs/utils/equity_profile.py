@@ -1,7 +1,7 @@
 """TCBS Equity Profile command."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import (
     check_response_error,
@@ -57,14 +57,14 @@ def profile(symbol: str) -> VfObject:
     url_2 = (
         f"https://apipubaws.tcbs.com.vn/tcanalysis/v1/ticker/{symbol}/overview"
     )
-    response_1 = requests.get(url_1, headers=tcbs_headers)
-    response_2 = requests.get(url_2, headers=tcbs_headers)
+    response_1 = http.get(url_1, headers=tcbs_headers)
+    response_2 = http.get(url_2, headers=tcbs_headers)
 
     check_response_error(response_1)
     check_response_error(response_2)
 
-    response_dict_1 = response_1.json()
-    response_dict_2 = response_2.json()
+    response_dict_1 = response_json(response_1)
+    response_dict_2 = response_json(response_2)
 
     data = {}
     data.update(response_dict_1)
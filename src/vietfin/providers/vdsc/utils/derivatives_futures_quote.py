@@ -2,8 +2,8 @@
 
 from datetime import datetime
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.providers.vdsc.utils.helpers import rv_headers
 from vietfin.providers.vdsc.models.derivatives_futures_quote import (
     VdscDerivativesFuturesQuoteData,
@@ -86,12 +86,16 @@ def quote(symbol: str, limit: int) -> VfObject:
 
     payload = {"stockCode": symbol, "boardDate": current_date_string_api}
     url = "https://livedragon.vdsc.com.vn/general/intradaySearch.rv"
-    response = requests.post(
-        url, headers=rv_headers, data=payload, cookies=requests_cookies
+    response = http.post(
+        url,
+        headers=rv_headers,
+        data=payload,
+        cookies=requests_cookies,
+        retry=True,
     )
     check_response_error(response)
 
-    data = response.json()
+    data = response_json(response)
     rows = data.get("list", [])
 
     if not rows:
@@ -1,7 +1,7 @@
 """VNDIRECT Equity Discovery group of functions."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.abstract.vfobject import VfObject
 from vietfin.utils.helpers import (
     generate_extra_metadata,
@@ -70,9 +70,9 @@ def get_top_movers(
         "value": f"https://finfo-api.vndirect.com.vn/v4/top_stocks?q=index:{exchange_api}~accumulatedVal:gt:0&size=10&sort=accumulatedVal",
     }
     url = url_mapping.get(name)
-    response = requests.get(url, headers=vndirect_headers)  # type: ignore
+    response = http.get(url, headers=vndirect_headers)  # type: ignore
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
     rows = data.get("data", [])
 
     if not rows:
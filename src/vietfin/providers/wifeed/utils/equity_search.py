@@ -1,7 +1,7 @@
 """WiFeed Equity Search function."""
 
-import httpx as requests
-
+from vietfin.utils import http
+from vietfin.utils.jsonlib import response_json
 from vietfin.abstract.vfobject import VfObject
 from vietfin.providers.wifeed.models.equity_search import WifeedEquitySearchData
 from vietfin.utils.helpers import (
@@ -50,9 +50,9 @@ def search(symbol: str = "") -> VfObject:
 
     # API call
     url = "https://wifeed.vn/api/thong-tin-co-phieu/danh-sach-ma-chung-khoan"
-    response = requests.get(url)
+    response = http.get(url)
     check_response_error(response)
-    data = response.json()
+    data = response_json(response)
     rows = data["data"]
 
     if not rows:
@@ -0,0 +1,354 @@
+"""VietFin local store of daily OHLCV bars.
+
+Past daily bars never change, so the `historical()` commands called with `cache=True`
+keep the bars they download in a local SQLite database,
+keyed by (provider, asset type, symbol, interval).
+The next call for the same key reads the stored bars, and only fetches from the provider
+the missing head (before the stored range) and tail (after the stored range) of the requested range.
+
+The database file `bars.sqlite` is located in the cache directory,
+see `vietfin.utils.helpers.get_cache_dir()`.
+"""
+
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+import pandas as pd
+
+from vietfin.abstract.vfobject import VfObject
+from vietfin.utils.errors import EmptyDataError
+from vietfin.utils.helpers import (
+    BaseDateParams,
+    generate_extra_metadata,
+    get_cache_dir,
+)
+
+# Only daily bars are cached, the date is the key of a bar
+CACHED_INTERVALS = ["1d"]
+
+BAR_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    provider TEXT NOT NULL,
+    asset_type TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    date TEXT NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume INTEGER,
+    PRIMARY KEY (provider, asset_type, symbol, interval, date)
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    provider TEXT NOT NULL,
+    asset_type TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    PRIMARY KEY (provider, asset_type, symbol, interval)
+);
+"""
+
+
+def _to_sql(value: Any) -> Any:
+    """Convert a value of a dataframe cell to a Python scalar supported by sqlite3, NA to None."""
+    if pd.isna(value):
+        return None
+    # e.g. numpy.int64 or numpy.float64
+    return value.item() if hasattr(value, "item") else value
+
+
+class BarKey(NamedTuple):
+    """Key of a series of bars in the store."""
+
+    provider: str
+    asset_type: str
+    symbol: str
+    interval: str
+
+
+class BarStore:
+    """SQLite store of daily OHLCV bars.
+
+    Besides the bars, the store records the date range already fetched for each key (its coverage),
+    since a range without any bar (e.g. holidays) must not be fetched again.
+
+    Parameters
+    ----------
+    path : str | Path | None
+        path of the SQLite database file. Default to `bars.sqlite` in the cache directory.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else get_cache_dir() / "bars.sqlite"
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def coverage(self, key: BarKey) -> tuple[date, date] | None:
+        """Return the date range already fetched for a key, or None if nothing is stored."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT start_date, end_date FROM coverage"
+                " WHERE provider=? AND asset_type=? AND symbol=? AND interval=?",
+                key,
+            ).fetchone()
+        if row is None:
+            return None
+        return date.fromisoformat(row[0]), date.fromisoformat(row[1])
+
+    def read(self, key: BarKey, start: date, end: date) -> pd.DataFrame:
+        """Return the stored bars of a key within the date range, sorted by date."""
+        with self._connect() as conn:
+            df = pd.read_sql_query(
+                "SELECT date, open, high, low, close, volume FROM bars"
+                " WHERE provider=? AND asset_type=? AND symbol=? AND interval=?"
+                " AND date BETWEEN ? AND ? ORDER BY date",
+                conn,
+                params=(*key, start.isoformat(), end.isoformat()),
+            )
+        df["date"] = pd.to_datetime(df["date"])
+        # whole numbers, as in the results of historical(), also for the stores
+        # created when the volume column was REAL
+        volume = df["volume"]
+        df["volume"] = volume.astype("Int64" if volume.isna().any() else "int64")
+        return df.set_index("date")
+
+    def write(
+        self, key: BarKey, bars: pd.DataFrame, start: date, end: date
+    ) -> None:
+        """Insert or replace the bars of a key, and extend its coverage to the date range.
+
+        The coverage is left unchanged if the date range is empty, i.e. start > end.
+
+        Parameters
+        ----------
+        key : BarKey
+            key of the series of bars.
+        bars : pd.DataFrame
+            the bars, with columns: date, open, high, low, close, volume.
+        start : date
+            start of the date range fetched from the provider.
+        end : date
+            end of the date range fetched from the provider.
+        """
+        rows = [
+            (
+                *key,
+                pd.Timestamp(r.date).date().isoformat(),  # type: ignore
+                *(_to_sql(v) for v in (r.open, r.high, r.low, r.close, r.volume)),
+            )
+            for r in bars[BAR_COLUMNS].itertuples(index=False)
+        ]
+
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+            # e.g. only the bar of today was fetched, which is not final yet
+            if start > end:
+                return
+
+            # the coverage stays a single range, so the fetched range is always adjacent to it
+            row = conn.execute(
+                "SELECT start_date, end_date FROM coverage"
+                " WHERE provider=? AND asset_type=? AND symbol=? AND interval=?",
+                key,
+            ).fetchone()
+            if row is not None:
+                start = min(start, date.fromisoformat(row[0]))
+                end = max(end, date.fromisoformat(row[1]))
+            conn.execute(
+                "INSERT OR REPLACE INTO coverage VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, start.isoformat(), end.isoformat()),
+            )
+
+    def invalidate(
+        self,
+        provider: str | None = None,
+        asset_type: str | None = None,
+        symbol: str | None = None,
+        interval: str | None = None,
+    ) -> int:
+        """Delete the stored bars matching all given criteria. No criteria deletes everything.
+
+        Returns
+        -------
+        int
+            number of deleted bars.
+        """
+        criteria = {
+            "provider": provider.lower() if provider else None,
+            "asset_type": asset_type,
+            "symbol": symbol.upper() if symbol else None,
+            "interval": interval,
+        }
+        criteria = {k: v for k, v in criteria.items() if v is not None}
+        where = " AND ".join(f"{k}=?" for k in criteria) or "1=1"
+        params = list(criteria.values())
+
+        with self._lock, self._connect() as conn:
+            deleted = conn.execute(f"DELETE FROM bars WHERE {where}", params).rowcount
+            conn.execute(f"DELETE FROM coverage WHERE {where}", params)
+        return deleted
+
+
+_store: BarStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_bar_store() -> BarStore:
+    """Return the default bar store, creating it if needed."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = BarStore()
+    return _store
+
+
+def invalidate(
+    provider: str | None = None,
+    asset_type: str | None = None,
+    symbol: str | None = None,
+    interval: str | None = None,
+) -> int:
+    """Delete the cached bars matching all given criteria. No criteria clears the whole cache.
+
+    Parameters
+    ----------
+    provider : str | None
+        provider name, e.g. "tcbs".
+    asset_type : str | None
+        asset type, one of "equity", "etf", "index".
+    symbol : str | None
+        ticker, e.g. "VNM".
+    interval : str | None
+        time interval, e.g. "1d".
+
+    Returns
+    -------
+    int
+        number of deleted bars.
+    """
+    return get_bar_store().invalidate(provider, asset_type, symbol, interval)
+
+
+def _to_bars(result: VfObject) -> pd.DataFrame:
+    """Return the bars of a historical() result as a dataframe with the BAR_COLUMNS."""
+    return result.to_df().reset_index()[BAR_COLUMNS]
+
+
+def cached_historical(
+    fetch: Callable[[str, str], VfObject],
+    provider: str,
+    asset_type: str,
+    symbol: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    interval: str = "1d",
+) -> VfObject:
+    """Load historical daily bars from the bar store, fetching only the missing head and tail.
+
+    The bar of the current day may still change, so today is never marked as fetched
+    and is fetched again on the next call.
+    A date range without data is not marked as fetched either, and is fetched again on the next call.
+
+    Parameters
+    ----------
+    fetch : Callable[[str, str], VfObject]
+        the historical() command of the provider, called with start_date and end_date strings.
+    provider : str
+        provider name, e.g. "tcbs".
+    asset_type : str
+        asset type, one of "equity", "etf", "index".
+    symbol : str
+        ticker, e.g. "VNM".
+    start_date : str | None
+        start date string in YYYY-MM-DD format
+    end_date : str | None
+        end date string in YYYY-MM-DD format
+    interval : str
+        time interval. Only "1d" is cached.
+
+    Returns
+    -------
+    VfObject
+        results : pd.DataFrame
+            historical price data indexed by date, with columns: open, high, low, close, volume.
+        provider : str
+            provider name
+        extra : dict
+            extra metadata about the command run, including:
+            cache : dict
+                path of the store and list of date ranges fetched from the provider.
+        raw_data : None
+
+    Raises
+    ------
+    ValueError
+        if the interval is not cached
+    EmptyDataError
+        if no data is found in the date range
+    """
+    if interval not in CACHED_INTERVALS:
+        raise ValueError(
+            f"Invalid interval: {interval}. The cache only supports interval: {', '.join(CACHED_INTERVALS)}."
+        )
+
+    date_params = BaseDateParams(start_date=start_date, end_date=end_date)
+    start = datetime.strptime(date_params.start_date, "%Y-%m-%d").date()  # type: ignore
+    end = datetime.strptime(date_params.end_date, "%Y-%m-%d").date()  # type: ignore
+    # the bar of today is not final yet
+    last_final_day = date.today() - timedelta(days=1)
+
+    store = get_bar_store()
+    key = BarKey(provider.lower(), asset_type, symbol.upper(), interval)
+
+    # Date ranges to fetch from the provider.
+    # The missing head and tail overlap the stored range by one day, so they are never empty ranges.
+    coverage = store.coverage(key)
+    if coverage is None:
+        missing = [(start, end)]
+    else:
+        missing = []
+        if start < coverage[0]:
+            missing.append((start, coverage[0]))
+        if end > coverage[1]:
+            missing.append((coverage[1], end))
+
+    for fetch_start, fetch_end in missing:
+        try:
+            bars = _to_bars(fetch(fetch_start.isoformat(), fetch_end.isoformat()))
+        except EmptyDataError:
+            # not marked as fetched, the error may be temporary
+            continue
+        store.write(key, bars, fetch_start, min(fetch_end, last_final_day))
+
+    df = store.read(key, start, end)
+    if df.empty:
+        raise EmptyDataError(f"No data found for this {key.symbol} ticker.")
+
+    # Additional metadata about the command run
+    extra = generate_extra_metadata(symbol=key.symbol, result=df)  # type: ignore
+    extra["cache"] = {
+        "path": str(store.path),
+        "fetched": [(s.isoformat(), e.isoformat()) for s, e in missing],
+    }
+
+    print(
+        f"Retrieved {extra.get('records_count',[])} historical price data point for symbol {key.symbol}, {len(missing)} date ranges fetched from {key.provider}."
+    )
+
+    return VfObject(results=df, provider=key.provider, extra=extra, raw_data=None)
@@ -0,0 +1,123 @@
+"""VietFin process-wide caches of reference data.
+
+Reference data, e.g. the list of all listed companies, changes at most a few times a day,
+but is needed by many commands to resolve a ticker.
+A TTLCache loads such data once, keeps it in memory for `ttl` seconds,
+and optionally persists it to a JSON file in the cache directory, so the next runs
+of the program do not download it again.
+
+Disk persistence is disabled by default, enable it with `set_disk_persistence(True)`.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Generic, TypeVar
+
+from vietfin.utils.helpers import get_cache_dir
+
+T = TypeVar("T")
+
+_persist_to_disk = False
+
+
+def set_disk_persistence(enabled: bool) -> None:
+    """Enable or disable the persistence of the caches to disk, for all caches."""
+    global _persist_to_disk
+    _persist_to_disk = enabled
+
+
+def get_disk_persistence() -> bool:
+    """Return True if the caches are persisted to disk."""
+    return _persist_to_disk
+
+
+class TTLCache(Generic[T]):
+    """Process-wide cache of a single value, reloaded after `ttl` seconds.
+
+    The threads calling get() while the value is loading wait for the load in progress,
+    and share its value, instead of loading it again.
+
+    Parameters
+    ----------
+    name : str
+        name of the cache, also the name of its JSON file on disk.
+    loader : Callable[[], Any]
+        function downloading the raw data. The raw data must be JSON serializable to be persisted.
+    ttl : float
+        time to live (in seconds) of the cached value.
+    parse : Callable[[Any], T] | None
+        function building the cached value from the raw data, e.g. an index by ticker.
+        Default: the raw data is the cached value.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        ttl: float,
+        parse: Callable[[Any], T] | None = None,
+    ) -> None:
+        self.name = name
+        self.loader = loader
+        self.ttl = ttl
+        self.parse = parse or (lambda raw: raw)
+        self._value: T | None = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Path of the JSON file of the cache."""
+        return get_cache_dir() / f"{self.name}.json"
+
+    def _is_fresh(self, loaded_at: float) -> bool:
+        return time.time() - loaded_at < self.ttl
+
+    def _read_disk(self) -> tuple[Any, float] | None:
+        """Return the raw data persisted to disk and its saving time, or None if missing or invalid."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                content = json.load(f)
+            return content["data"], float(content["saved_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_disk(self, raw: Any, saved_at: float) -> None:
+        # write to a temporary file first, so a concurrent reader never sees a partial file
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": saved_at, "data": raw}, f, ensure_ascii=False)
+        tmp_path.replace(self.path)
+
+    def get(self) -> T:
+        """Return the cached value, loading it if missing or expired."""
+        value = self._value
+        if value is not None and self._is_fresh(self._loaded_at):
+            return value
+
+        with self._lock:
+            # another thread may have loaded the value while we were waiting for the lock
+            if self._value is not None and self._is_fresh(self._loaded_at):
+                return self._value
+
+            persisted = _persist_to_disk and self._read_disk()
+            if persisted and self._is_fresh(persisted[1]):
+                raw, loaded_at = persisted
+            else:
+                raw, loaded_at = self.loader(), time.time()
+                if _persist_to_disk:
+                    self._write_disk(raw, loaded_at)
+
+            self._value = self.parse(raw)
+            self._loaded_at = loaded_at
+            return self._value
+
+    def clear(self) -> None:
+        """Drop the cached value, in memory and on disk."""
+        with self._lock:
+            self._value = None
+            self._loaded_at = 0.0
+            if _persist_to_disk:
+                self.path.unlink(missing_ok=True)
@@ -0,0 +1,173 @@
+"""VietFin column table, a dict-of-lists payload read without transposing it.
+
+Some APIs, e.g. the OHLCV bars of the DNSE `/ohlcs` and SSI dchart endpoints, return their
+records as a dict-of-lists: {"t": [...], "o": [...], ..., "s": "ok"}.
+`ColumnTable` wraps the lists of such a payload as they are, instead of building one dict
+per record up front:
+
+- `rows()` yields the records one at a time, e.g. to be validated by `Data.validate_many()`:
+  a dict is still built per record, but not the list of all of them up front;
+- `between()` slices the table by a range of its sorted index column, e.g. the timestamps,
+  returning a view of the same lists. Reading a column of a view, e.g. `table["c"]` or
+  `to_df()`, copies the slice of the column;
+- `to_df()`, `Data.validate_columns()` and `helpers.parse_ohlcv_columns()` read the columns
+  directly.
+
+    table = ColumnTable.from_dict(data, index="t")
+    bars = DnseEquityHistoricalPriceData.validate_many(table.between("2024-01-02").rows())
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timezone
+from itertools import compress, islice
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Sequence
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class ColumnTable:
+    """Read-only table of equal-length columns, sliced by `between()` without copying the columns.
+
+    Parameters
+    ----------
+    columns : dict[str, Sequence]
+        the columns, e.g. lists or NumPy arrays, kept as they are.
+    index : str | None
+        name of the column sorted in ascending order, used by `between()`.
+
+    Raises
+    ------
+    ValueError
+        if the columns have different lengths, or the index is not a column
+    """
+
+    __slots__ = ("_columns", "_start", "_stop", "index")
+
+    def __init__(self, columns: Mapping[str, Sequence], index: str | None = None) -> None:
+        lengths = {name: len(values) for name, values in columns.items()}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"Columns of different lengths: {lengths}")
+        if index is not None and index not in columns:
+            raise ValueError(f"Missing index column: {index}")
+        self._columns = columns
+        self._start = 0
+        self._stop = next(iter(lengths.values()), 0)
+        self.index = index
+
+    @classmethod
+    def from_dict(cls, data: dict, index: str | None = None) -> "ColumnTable":
+        """Wrap the columns of a dict-of-lists payload.
+
+        Only the list (or array) values are columns, e.g. a status string like "s": "ok"
+        is skipped. A missing index column, e.g. in an empty payload, is ignored.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        columns: dict[str, Any] = {
+            k: v for k, v in data.items() if isinstance(v, (list, tuple, np.ndarray))
+        }
+        return cls(columns, index=index if index in columns else None)
+
+    def _view(self, start: int, stop: int) -> "ColumnTable":
+        table = object.__new__(ColumnTable)
+        table._columns = self._columns
+        table._start = start
+        table._stop = stop
+        table.index = self.index
+        return table
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._stop - self._start
+
+    def __repr__(self) -> str:
+        return f"<ColumnTable: {len(self)} rows x {len(self._columns)} columns>"
+
+    @property
+    def columns(self) -> list[str]:
+        """Return the names of the columns."""
+        return list(self._columns)
+
+    def keys(self) -> list[str]:
+        """Return the names of the columns, as a dict."""
+        return self.columns
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+
+    def __getitem__(self, name: str) -> Sequence:
+        """Return a column. Only a sliced table copies the slice of its list."""
+        values = self._columns[name]
+        if self._start == 0 and self._stop == len(values):
+            return values
+        return values[self._start : self._stop]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return a column, or default if missing, as a dict."""
+        return self[name] if name in self._columns else default
+
+    def rows(self) -> Iterator[dict]:
+        """Yield the rows one at a time, as dicts keyed by column name."""
+        names = list(self._columns)
+        columns = [
+            islice(values, self._start, self._stop) for values in self._columns.values()
+        ]
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+
+    def between(self, start: Any = None, end: Any = None) -> "ColumnTable":
+        """Return the rows whose index value is in [start, end], without copying the columns.
+
+        Parameters
+        ----------
+        start, end : int | float | str | date | datetime | None
+            bounds of the index column, both included, open if None. A date, or a string
+            in YYYY-MM-DD format, is compared as a unix timestamp in UTC: an end date
+            includes its whole day.
+
+        Returns
+        -------
+        ColumnTable
+            a view of the same columns. Its columns are copied when read, see `__getitem__()`.
+        """
+        if self.index is None:
+            raise ValueError("between() requires an index column.")
+        values = self._columns[self.index]
+        lo, hi = self._start, self._stop
+        if start is not None:
+            lo = bisect_left(values, _to_timestamp(start), lo, hi)
+        if end is not None:
+            hi = bisect_right(values, _to_timestamp(end, end_of_day=True), lo, hi)
+        return self._view(lo, max(lo, hi))
+
+    def filter(self, mask: Sequence[bool]) -> "ColumnTable":
+        """Return the rows where mask is true, as a new table with copied columns."""
+        if len(mask) != len(self):
+            raise ValueError(f"Mask of length {len(mask)} for {len(self)} rows")
+        columns = {name: list(compress(self[name], mask)) for name in self._columns}
+        return ColumnTable(columns, index=self.index)
+
+    def to_dict(self) -> dict[str, Sequence]:
+        """Return the columns as a dict-of-lists."""
+        return {name: self[name] for name in self._columns}
+
+    def to_df(self) -> "pd.DataFrame":
+        """Return the table as a DataFrame, one column per column of the table."""
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        return pd.DataFrame(self.to_dict())
+
+
+def _to_timestamp(value: Any, end_of_day: bool = False) -> Any:
+    """Convert a bound of between() to a unix timestamp, if it is a date or a string."""
+    if isinstance(value, str):
+        value = datetime.strptime(value, "%Y-%m-%d").date()
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, date):
+        moment = time.max if end_of_day else time.min
+        return datetime.combine(value, moment, tzinfo=timezone.utc).timestamp()
+    return value
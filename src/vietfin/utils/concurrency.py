@@ -0,0 +1,96 @@
+"""VietFin helpers to run many provider calls concurrently."""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, Iterable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+R = TypeVar("R")
+
+
+def map_concurrently(
+    func: Callable[[K], R], items: Iterable[K], max_workers: int = 8
+) -> list[R]:
+    """Call func on every item with a pool of threads, returning the results in the order of items.
+
+    Unlike run_concurrently(), the first exception raised by a call is raised again to the caller.
+
+    Parameters
+    ----------
+    func : Callable
+        function called with a single item.
+    items : Iterable
+        the items, e.g. the list of pages to fetch.
+    max_workers : int
+        number of threads. Default 8.
+
+    Returns
+    -------
+    list
+        the result of each call, in the order of items.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1.")
+
+    items = list(items)
+    if len(items) <= 1:
+        # no need to start a pool of threads for a single call
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        # each call runs in a copy of the caller's context, e.g. its raw data policy
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, item)
+            for item in items
+        ]
+        return [future.result() for future in futures]
+
+
+def run_concurrently(
+    func: Callable[[K], R],
+    items: Iterable[K],
+    max_workers: int = 8,
+) -> tuple[dict[K, R], dict[K, Exception]]:
+    """Call func on every item with a pool of threads, collecting results and errors.
+
+    An exception raised by one call does not stop the other calls.
+    The requests sent to a provider stay within the `max_concurrency` of its host,
+    see `vietfin.utils.ratelimit.set_host_limit()`.
+
+    Parameters
+    ----------
+    func : Callable
+        function called with a single item.
+    items : Iterable
+        the items, e.g. the list of symbols.
+    max_workers : int
+        number of threads. Default 8.
+
+    Returns
+    -------
+    tuple[dict, dict]
+        results : dict
+            the result of each successful call, keyed by item, in the order of items.
+        errors : dict
+            the exception raised by each failed call, keyed by item.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1.")
+
+    items = list(dict.fromkeys(items))  # drop duplicates, keep order
+    results: dict[K, R] = {}
+    errors: dict[K, Exception] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # each call runs in a copy of the caller's context, e.g. its raw data policy
+        futures = {
+            item: executor.submit(contextvars.copy_context().run, func, item)
+            for item in items
+        }
+        for item, future in futures.items():
+            try:
+                results[item] = future.result()
+            except Exception as ex:
+                errors[item] = ex
+
+    return results, errors
@@ -1,18 +1,32 @@
 """Custom exceptions for the query from providers in VietFin."""
 
+from typing import Mapping
+
 
 class EmptyDataError(Exception):
-    """Raised if the API response is empty."""
+    """Raised if the API response is empty.
+
+    A command over many items, e.g. tickers, attaches the error of each item to `errors`.
+    """
 
     def __init__(
         self,
         message: str = "API response is empty. Try adjusting the query parameters.",
+        errors: Mapping[str, Exception] | None = None,
     ):
         """Initialize the exception."""
         self.message = message
+        self.errors: dict[str, Exception] = dict(errors or {})
         super().__init__(self.message)
 
 
+class SymbolNotFoundError(EmptyDataError, ValueError):
+    """Raised if the ticker is not found in the provider database.
+
+    A ValueError too, as raised before for an unknown ticker.
+    """
+
+
 class VietFinError(Exception):
     """Raised for Uncategorized Error."""
 
@@ -0,0 +1,146 @@
+"""VietFin reader of the Excel workbooks downloaded from the providers.
+
+The first sheet of a workbook is read with the fastest engine installed:
+
+- "calamine": the Rust reader python-calamine, `poetry add python-calamine`;
+- "openpyxl": openpyxl in read-only mode, streaming the rows of the sheet instead of
+  loading the whole workbook with its styles, as `pd.read_excel()` does.
+
+`read_sheet()` returns the same DataFrame as `pd.read_excel(BytesIO(content), skiprows=...)`
+for the plain tables of values of the provider workbooks.
+"""
+
+from io import BytesIO
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import python_calamine  # type: ignore
+except ImportError:
+    python_calamine = None
+
+# Cell strings read as missing values, the default `na_values` of `pd.read_excel()`
+NA_STRINGS = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
+
+def _calamine_rows(content: bytes) -> Iterator[tuple]:
+    workbook = python_calamine.CalamineWorkbook.from_filelike(BytesIO(content))
+    # keep the leading empty rows, counted by skiprows
+    yield from workbook.get_sheet_by_index(0).to_python(skip_empty_area=False)
+
+
+def _openpyxl_rows(content: bytes) -> Iterator[tuple]:
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(BytesIO(content), read_only=True, data_only=True)
+    try:
+        yield from workbook.worksheets[0].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _available_engines() -> dict[str, Callable[[bytes], Iterator[tuple]]]:
+    engines: dict[str, Callable[[bytes], Iterator[tuple]]] = {}
+    if python_calamine is not None:
+        engines["calamine"] = _calamine_rows
+    engines["openpyxl"] = _openpyxl_rows
+    return engines
+
+
+ENGINES = _available_engines()
+
+# Name of the engine in use, the fastest installed one by default
+engine: str = next(iter(ENGINES))
+
+
+def set_engine(name: str) -> None:
+    """Select the engine reading the Excel workbooks.
+
+    Parameters
+    ----------
+    name : str
+        "calamine" or "openpyxl". The library must be installed.
+    """
+    global engine
+    if name not in ENGINES:
+        raise ValueError(
+            f"Excel engine {name} is not installed. Available engines: {', '.join(ENGINES)}."
+        )
+    engine = name
+
+
+def _clean_row(row: tuple) -> list:
+    """Convert the missing values of a row to None, and drop its trailing empty cells."""
+    values: list[Any] = [
+        None if isinstance(v, str) and v in NA_STRINGS else v for v in row
+    ]
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+def read_sheet(content: bytes, skiprows: int = 0) -> "pd.DataFrame":
+    """Read the first sheet of a workbook into a DataFrame.
+
+    Parameters
+    ----------
+    content : bytes
+        the workbook, e.g. the content of a response.
+    skiprows : int
+        number of rows to skip before the row of the column labels. Default to 0.
+
+    Returns
+    -------
+    pd.DataFrame
+        one column per column of the sheet, labelled by its cell of the header row,
+        or "Unnamed: <position>" if empty. Empty if the sheet has no header row.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    rows = (_clean_row(row) for row in islice(ENGINES[engine](content), skiprows, None))
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+
+    data = list(rows)
+    # drop the trailing empty rows
+    while data and not data[-1]:
+        data.pop()
+
+    width = max([len(header), *(len(row) for row in data)])
+    header += [None] * (width - len(header))
+    columns = [
+        f"Unnamed: {i}" if label is None else label for i, label in enumerate(header)
+    ]
+    for row in data:
+        row += [None] * (width - len(row))
+
+    df = pd.DataFrame(data, columns=columns).infer_objects()
+    # missing values as NaN, also in the columns of text
+    return df.where(df.notna(), np.nan)
@@ -0,0 +1,346 @@
+"""VietFin builder of market-wide panels of fundamentals, resumable from checkpoints.
+
+A panel is a single long-format dataset of the financial ratios and statements of many
+tickers, one row per (symbol, dataset, period, fiscal period, item):
+
+    symbol | dataset | period | fiscal_period | item | value
+    VNM    | income  | annual | 2023          | ...  | 1.2e12
+
+The tickers are fetched concurrently, a partition of `partition_size` tickers at a time.
+Each completed partition is written to its own file in the dataset directory, then the
+tickers it holds are recorded in the checkpoint file `_checkpoint.json`, so that:
+
+- the memory stays bounded by one partition, whatever the number of tickers;
+- a rerun after a crash, or with more tickers, skips the tickers already written.
+
+The partitions are Parquet files with pyarrow installed (`poetry add pyarrow`),
+CSV files otherwise. Read the whole dataset with `read_panel()`.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from vietfin.utils.concurrency import run_concurrently
+from vietfin.utils.errors import EmptyDataError
+
+try:
+    import pyarrow  # type: ignore # noqa: F401
+except ImportError:
+    pyarrow = None
+
+PANEL_COLUMNS = ["symbol", "dataset", "period", "fiscal_period", "item", "value"]
+PANEL_DATASETS = ("ratios", "income", "balance", "cash")
+
+CHECKPOINT_FILE = "_checkpoint.json"
+PARTITION_FORMAT = "parquet" if pyarrow is not None else "csv"
+# Name of the partition files, in either format
+PARTITION_NAME = re.compile(r"^part-\d{5}\.(parquet|csv)$")
+
+# Errors meaning that a ticker has no data for a dataset, not worth retrying on a rerun,
+# including SymbolNotFoundError, an EmptyDataError.
+# NotImplementedError, i.e. a dataset the provider does not support, stops the build instead.
+NO_DATA_ERRORS = (EmptyDataError,)
+
+
+def _fiscal_period(year: pd.Series, quarter: pd.Series) -> np.ndarray:
+    """Label the fiscal periods as the SSI statements do, e.g. "2023" or "Q1 2023"."""
+    year = year.astype(int).astype(str)
+    quarterly = quarter.between(1, 4)
+    return np.where(
+        quarterly, "Q" + quarter.astype(int).astype(str) + " " + year, year
+    )
+
+
+def statement_to_panel(df: pd.DataFrame, symbol: str, dataset: str) -> pd.DataFrame:
+    """Convert the long DataFrame of a financial statement to the rows of a panel.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        results of a statement command called with `results_format="columns"`,
+        with a fiscal_period column (ssi),
+        or fiscal_year and fiscal_quarter columns (tcbs).
+    symbol : str
+        stock ticker.
+    dataset : str
+        "income", "balance" or "cash".
+    """
+    if "fiscal_period" in df.columns:
+        fiscal_period = df["fiscal_period"].astype(str).to_numpy()
+    else:
+        fiscal_period = _fiscal_period(df["fiscal_year"], df["fiscal_quarter"])
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "dataset": dataset,
+            "period": df["period"].to_numpy(),
+            "fiscal_period": fiscal_period,
+            "item": df["items"].to_numpy(),
+            "value": df["values"].to_numpy(dtype="float64"),
+        }
+    )
+
+
+def ratios_to_panel(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    """Convert the wide DataFrame of the financial ratios to the rows of a panel.
+
+    Each ratio column is unpivoted into an item. The values that are not numbers are
+    dropped, the panel only holds numeric values.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        one row per fiscal period, with the columns period, fiscal_year, fiscal_quarter,
+        then one column per ratio.
+    symbol : str
+        stock ticker.
+    """
+    id_columns = ["symbol", "period", "fiscal_year", "fiscal_quarter"]
+    items = [c for c in df.columns if c not in id_columns]
+    values = df[items].apply(pd.to_numeric, errors="coerce").to_numpy(dtype="float64")
+
+    n_rows = len(df)
+    panel = pd.DataFrame(
+        {
+            "symbol": symbol,
+            "dataset": "ratios",
+            "period": np.tile(df["period"].to_numpy(), len(items)),
+            "fiscal_period": np.tile(
+                _fiscal_period(df["fiscal_year"], df["fiscal_quarter"]), len(items)
+            ),
+            "item": np.repeat(np.asarray(items, dtype=object), n_rows),
+            # column after column, i.e. ratio after ratio
+            "value": values.ravel(order="F"),
+        }
+    )
+    return panel[panel["value"].notna()].reset_index(drop=True)
+
+
+class PanelCheckpoint:
+    """Partitions written to a panel dataset, and the tickers they hold.
+
+    Parameters
+    ----------
+    path : Path
+        directory of the dataset, created if missing.
+    params : dict
+        parameters of the panel, e.g. the period.
+        A dataset is only resumed with the same parameters.
+
+    Raises
+    ------
+    ValueError
+        if the dataset was built with other parameters,
+        or the directory holds partition files without a checkpoint file
+    """
+
+    def __init__(self, path: Path, params: dict) -> None:
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.params = params
+        # partition file name: list of its tickers
+        self.partitions: dict[str, list[str]] = {}
+
+        checkpoint_path = self.path / CHECKPOINT_FILE
+        partition_files = [f for f in self.path.iterdir() if PARTITION_NAME.match(f.name)]
+        if checkpoint_path.exists():
+            saved = json.loads(checkpoint_path.read_text())
+            if saved["params"] != params:
+                raise ValueError(
+                    f"The panel dataset {path} was built with other parameters: "
+                    f"{saved['params']}. Use another directory."
+                )
+            self.partitions = saved["partitions"]
+
+            # drop the partitions written by a run stopped before their checkpoint
+            for file in partition_files:
+                if file.name not in self.partitions:
+                    file.unlink()
+        else:
+            # never delete nor overwrite the files of another dataset
+            if partition_files:
+                raise ValueError(
+                    f"The directory {path} holds partition files, e.g. {partition_files[0].name}, "
+                    f"but no {CHECKPOINT_FILE}. Use another directory."
+                )
+            # saved before the first partition, so the partitions of a stopped run
+            # are always next to their checkpoint file
+            self._save()
+
+    def _save(self) -> None:
+        """Replace the checkpoint file at once, never leave it half written."""
+        tmp_path = self.path / f"{CHECKPOINT_FILE}.tmp"
+        tmp_path.write_text(
+            json.dumps({"params": self.params, "partitions": self.partitions})
+        )
+        os.replace(tmp_path, self.path / CHECKPOINT_FILE)
+
+    @property
+    def done(self) -> set[str]:
+        """Return the tickers already written."""
+        return {s for symbols in self.partitions.values() for s in symbols}
+
+    def add(self, df: pd.DataFrame, symbols: list[str]) -> str:
+        """Write a partition, then record its tickers, and return its file name."""
+        name = f"part-{len(self.partitions):05d}.{PARTITION_FORMAT}"
+        if PARTITION_FORMAT == "parquet":
+            df.to_parquet(self.path / name, index=False)
+        else:
+            df.to_csv(self.path / name, index=False)
+
+        self.partitions[name] = symbols
+        self._save()
+        return name
+
+
+def build_panel(
+    path: str | Path,
+    symbols: Iterable[str],
+    fetch: Callable[[str], tuple[pd.DataFrame, dict[str, Exception]]],
+    params: dict,
+    max_workers: int = 8,
+    partition_size: int = 50,
+) -> pd.DataFrame:
+    """Fetch the panel rows of every ticker not written yet, a partition at a time.
+
+    A ticker is written, and skipped by the next runs, once each of its datasets is
+    fetched or has no data. A ticker with another error, e.g. a network error,
+    is not written and is fetched again by the next run.
+
+    Parameters
+    ----------
+    path : str | Path
+        directory of the dataset.
+    symbols : Iterable[str]
+        tickers of the panel.
+    fetch : Callable[[str], tuple[pd.DataFrame, dict[str, Exception]]]
+        function returning the panel rows of a ticker,
+        and the error of each of its datasets that failed.
+    params : dict
+        parameters of the panel, checked against the ones of the dataset to resume.
+    max_workers : int
+        number of tickers fetched concurrently. Default 8.
+    partition_size : int
+        number of tickers per partition. Default 50.
+
+    Returns
+    -------
+    pd.DataFrame
+        status of each ticker, with columns: symbol,
+        status ("written", "skipped" or "failed"), partition and errors.
+
+    Raises
+    ------
+    NotImplementedError
+        if a dataset is not supported by the provider, before writing any partition of it.
+    """
+    if partition_size < 1:
+        raise ValueError("partition_size must be >= 1.")
+
+    checkpoint = PanelCheckpoint(Path(path).expanduser(), params)
+    done = checkpoint.done
+    symbols = list(dict.fromkeys(s.upper() for s in symbols))
+    todo = [s for s in symbols if s not in done]
+
+    status: dict[str, dict[str, Any]] = {
+        s: {"symbol": s, "status": "skipped", "partition": None, "errors": None}
+        for s in symbols
+        if s in done
+    }
+
+    for start in range(0, len(todo), partition_size):
+        chunk = todo[start : start + partition_size]
+        results, errors = run_concurrently(fetch, chunk, max_workers=max_workers)
+
+        frames, written = [], []
+        for symbol in chunk:
+            if symbol in errors:
+                df, failures = pd.DataFrame(), {"*": errors[symbol]}
+            else:
+                df, failures = results[symbol]
+            # a dataset not supported by the provider would fail for every ticker
+            for ex in failures.values():
+                if isinstance(ex, NotImplementedError):
+                    raise ex
+            messages = {k: f"{type(ex).__name__}: {ex}" for k, ex in failures.items()}
+            # written if every dataset is fetched or has no data, retried otherwise
+            ok = all(isinstance(ex, NO_DATA_ERRORS) for ex in failures.values())
+            status[symbol] = {
+                "symbol": symbol,
+                "status": "written" if ok else "failed",
+                "partition": None,
+                "errors": messages,
+            }
+            if ok:
+                written.append(symbol)
+                if not df.empty:
+                    frames.append(df)
+
+        if written:
+            # the tickers without data are written without rows
+            partition = (
+                pd.concat(frames, ignore_index=True)
+                if frames
+                else pd.DataFrame(columns=PANEL_COLUMNS)
+            )
+            partition = partition.reindex(columns=PANEL_COLUMNS)
+            name = checkpoint.add(partition, written)
+            for symbol in written:
+                status[symbol]["partition"] = name
+            print(
+                f"Wrote partition {name}: {len(partition)} rows for {len(written)} symbols, "
+                f"{len(checkpoint.done)}/{len(symbols)} symbols done."
+            )
+
+    return pd.DataFrame(
+        [status[s] for s in symbols],
+        columns=["symbol", "status", "partition", "errors"],
+    )
+
+
+def read_panel(path: str | Path) -> pd.DataFrame:
+    """Read all the partitions of a panel dataset into a single DataFrame.
+
+    Parameters
+    ----------
+    path : str | Path
+        directory of the dataset.
+
+    Returns
+    -------
+    pd.DataFrame
+        one row per (symbol, dataset, period, fiscal_period, item), see PANEL_COLUMNS.
+    """
+    path = Path(path).expanduser()
+    checkpoint_path = path / CHECKPOINT_FILE
+    if not checkpoint_path.exists():
+        raise EmptyDataError(f"No panel dataset found in {path}.")
+
+    frames = []
+    for name in json.loads(checkpoint_path.read_text())["partitions"]:
+        if name.endswith(".parquet"):
+            frames.append(pd.read_parquet(path / name))
+        else:
+            frames.append(
+                pd.read_csv(
+                    path / name,
+                    dtype={
+                        "symbol": str,
+                        "dataset": str,
+                        "period": str,
+                        "fiscal_period": str,
+                        "item": str,
+                        "value": "float64",
+                    },
+                )
+            )
+
+    if not frames:
+        return pd.DataFrame(columns=PANEL_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,515 @@
+"""VietFin HTTP session layer.
+
+All provider functions send their requests through this module instead of calling
+`httpx.get` / `httpx.post` directly. One pooled `httpx.Client` is kept per provider host,
+so consecutive requests to the same host (e.g. the pages of a paginated endpoint)
+reuse the same keep-alive connection instead of paying a new TCP+TLS handshake.
+
+The coroutines `aget` / `apost` do the same with one pooled `httpx.AsyncClient` per host
+and per event loop, for the async API `vf.aio`.
+
+Failed requests are retried according to the retry policy, see `configure_retry()`:
+only idempotent methods (GET) are retried by default, on transport errors and on
+HTTP status 429 and 5xx, with an exponential backoff and jitter, honoring the
+`Retry-After` header. Since each request is retried on its own, a paginated or chunked
+command resumes from the failed page instead of restarting.
+
+Each attempt also waits for the rate limit of its host, see `vietfin.utils.ratelimit`.
+
+The responses of rarely changing endpoints are cached, see `vietfin.utils.response_cache`,
+and identical GET requests sent at the same time share a single request,
+see `vietfin.utils.singleflight`.
+"""
+
+import asyncio
+import atexit
+import random
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+from pydantic import BaseModel, Field
+
+from vietfin.utils import ratelimit, response_cache, singleflight
+
+
+class HttpConfig(BaseModel):
+    """Settings of the pooled HTTP clients.
+
+    Attributes
+    ----------
+    max_connections : int | None
+        maximum number of concurrent connections per host. None means no limit.
+    max_keepalive_connections : int | None
+        maximum number of idle keep-alive connections kept in the pool per host.
+    keepalive_expiry : float | None
+        time (in seconds) an idle keep-alive connection is kept open.
+    http2 : bool
+        enable HTTP/2. Requires the optional `h2` package.
+    timeout : float | None
+        timeout (in seconds) of a single request. Same default as httpx.
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    http2: bool = False
+    timeout: float | None = 5.0
+
+
+class RetryPolicy(BaseModel):
+    """Policy of the retries of failed requests.
+
+    Attributes
+    ----------
+    max_attempts : int
+        maximum number of attempts of a request, including the first one. 1 disables the retries.
+    backoff_factor : float
+        the delay (in seconds) before the n-th retry is `backoff_factor * 2 ** (n - 1)`.
+    max_backoff : float
+        maximum delay (in seconds) before a retry, also caps the `Retry-After` header.
+    jitter : bool
+        draw the delay uniformly between 0 and the backoff ("full jitter"),
+        so concurrent requests do not retry at the same time.
+    retry_statuses : set[int]
+        HTTP status codes of the responses to retry.
+    retry_methods : set[str]
+        HTTP methods retried by default. Only idempotent methods should be retried.
+    respect_retry_after : bool
+        wait at least the delay of the `Retry-After` header of the response, if any.
+    """
+
+    max_attempts: int = Field(default=3, ge=1)
+    backoff_factor: float = Field(default=0.5, ge=0)
+    max_backoff: float = Field(default=30.0, ge=0)
+    jitter: bool = True
+    retry_statuses: set[int] = {429, 500, 502, 503, 504}
+    retry_methods: set[str] = {"GET", "HEAD", "OPTIONS"}
+    respect_retry_after: bool = True
+
+
+_config = HttpConfig()
+_retry_policy = RetryPolicy()
+_NO_RETRY = RetryPolicy(max_attempts=1)
+
+# Methods of the requests coalesced with the identical requests in flight
+COALESCED_METHODS = {"GET"}
+_clients: dict[str, httpx.Client] = {}
+# the async clients of each event loop, dropped with their loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _host_key(url: str) -> str:
+    """Return the `scheme://host:port` part of an url, used as key of the client pool."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _check_http2_installed() -> None:
+    """Raise ImportError if HTTP/2 is enabled but the `h2` package is missing."""
+    try:
+        import h2  # type: ignore # noqa: F401 # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "Please install h2: `poetry add httpx[http2]` to enable HTTP/2."
+        ) from exc
+
+
+def configure(**kwargs: Any) -> HttpConfig:
+    """Update the settings of the pooled HTTP clients.
+
+    The clients already opened are closed, so the new settings apply to the next request.
+
+    Parameters
+    ----------
+    **kwargs
+        any attribute of HttpConfig, e.g. `max_connections=50, http2=True`.
+
+    Returns
+    -------
+    HttpConfig
+        the updated settings.
+    """
+    global _config
+
+    config = HttpConfig(**{**_config.model_dump(), **kwargs})
+    if config.http2:
+        _check_http2_installed()
+
+    close()
+    _config = config
+    return _config
+
+
+def get_config() -> HttpConfig:
+    """Return the current settings of the pooled HTTP clients."""
+    return _config
+
+
+def configure_retry(**kwargs: Any) -> RetryPolicy:
+    """Update the retry policy of the requests.
+
+    Parameters
+    ----------
+    **kwargs
+        any attribute of RetryPolicy, e.g. `max_attempts=5, backoff_factor=1`.
+
+    Returns
+    -------
+    RetryPolicy
+        the updated retry policy.
+    """
+    global _retry_policy
+
+    _retry_policy = RetryPolicy(**{**_retry_policy.model_dump(), **kwargs})
+    return _retry_policy
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Return the current retry policy of the requests."""
+    return _retry_policy
+
+
+def _parse_retry_after(response: httpx.Response) -> float | None:
+    """Return the delay (in seconds) of the `Retry-After` header, in seconds or HTTP-date format."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(
+    policy: RetryPolicy, attempt: int, response: httpx.Response | None
+) -> float:
+    """Return the delay (in seconds) before retrying a request after its n-th failed attempt."""
+    delay = min(policy.max_backoff, policy.backoff_factor * 2 ** (attempt - 1))
+    if policy.jitter:
+        delay = random.uniform(0, delay)
+    if policy.respect_retry_after and response is not None:
+        retry_after = _parse_retry_after(response)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, policy.max_backoff))
+    return delay
+
+
+def _should_retry(
+    policy: RetryPolicy, attempt: int, response: httpx.Response | None
+) -> bool:
+    """Return True if a request should be retried after its n-th attempt.
+
+    A None response means the attempt failed with a transport error.
+    """
+    if attempt >= policy.max_attempts:
+        return False
+    return response is None or response.status_code in policy.retry_statuses
+
+
+def _is_retried(method: str, retry: bool | None) -> bool:
+    """Return True if the requests of this method are retried, unless overridden by `retry`."""
+    if retry is not None:
+        return retry
+    return method.upper() in _retry_policy.retry_methods
+
+
+def _flight_key(method: str, url: str, kwargs: dict[str, Any]) -> tuple:
+    """Return the key identifying identical requests, from the method, url and all arguments."""
+    full_url = httpx.URL(url)
+    if kwargs.get("params"):
+        full_url = full_url.copy_merge_params(kwargs["params"])
+    arguments = sorted((k, repr(v)) for k, v in kwargs.items() if k != "params")
+    return (method.upper(), str(full_url), tuple(arguments))
+
+
+def _client_settings() -> dict[str, Any]:
+    """Return the keyword arguments used to create a pooled client."""
+    limits = httpx.Limits(
+        max_connections=_config.max_connections,
+        max_keepalive_connections=_config.max_keepalive_connections,
+        keepalive_expiry=_config.keepalive_expiry,
+    )
+    return {
+        "limits": limits,
+        "http2": _config.http2,
+        "timeout": _config.timeout,
+    }
+
+
+def get_client(url: str) -> httpx.Client:
+    """Return the pooled client of the host of the given url, creating it if needed.
+
+    Parameters
+    ----------
+    url : str
+        any url of the host.
+
+    Returns
+    -------
+    httpx.Client
+        the client shared by all requests sent to this host.
+    """
+    key = _host_key(url)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        # another thread may have created the client while we were waiting for the lock
+        client = _clients.get(key)
+        if client is None:
+            client = httpx.Client(**_client_settings())
+            _clients[key] = client
+
+    return client
+
+
+def get_async_client(url: str) -> httpx.AsyncClient:
+    """Return the pooled async client of the url's host for the running event loop.
+
+    An `httpx.AsyncClient` can only be used inside the event loop that opened its connections,
+    so each event loop has its own pool of clients, kept until `aclose()` or until the loop is garbage collected.
+
+    Parameters
+    ----------
+    url : str
+        any url of the host.
+
+    Returns
+    -------
+    httpx.AsyncClient
+        the async client shared by all coroutines requesting this host in the running loop.
+    """
+    key = _host_key(url)
+    loop = asyncio.get_running_loop()
+
+    # the event loops of other threads share the pool
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = httpx.AsyncClient(**_client_settings())
+            clients[key] = client
+    return client
+
+
+def _send(
+    method: str, url: str, retry: bool | None, kwargs: dict[str, Any]
+) -> httpx.Response:
+    """Send a request with the pooled client, retrying it according to the retry policy."""
+    client = get_client(url)
+    policy = _retry_policy if _is_retried(method, retry) else _NO_RETRY
+    attempt = 1
+    while True:
+        # the failed response of this attempt, None if no response was received
+        failed: httpx.Response | None = None
+        try:
+            # each attempt waits for the rate limit of the host
+            with ratelimit.limit(url):
+                response = client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if not _should_retry(policy, attempt, None):
+                raise
+        else:
+            if not _should_retry(policy, attempt, response):
+                return response
+            response.close()
+            failed = response
+
+        time.sleep(_retry_delay(policy, attempt, failed))
+        attempt += 1
+
+
+def _request(
+    method: str, url: str, retry: bool | None, kwargs: dict[str, Any]
+) -> httpx.Response:
+    """Send a request, or return its response from the response cache."""
+    key = response_cache.get_key(method, url, kwargs)
+    if key is None:
+        return _send(method, url, retry, kwargs)
+
+    entry = response_cache.get(key)
+    if entry is not None and entry.is_fresh():
+        return entry.to_response(method, url)
+
+    headers = response_cache.conditional_headers(entry, kwargs.get("headers"))
+    if headers is not None:
+        kwargs = {**kwargs, "headers": headers}
+    response = _send(method, url, retry, kwargs)
+    return response_cache.update(key, entry, response, method, url)
+
+
+def request(
+    method: str, url: str, retry: bool | None = None, **kwargs: Any
+) -> httpx.Response:
+    """Send an HTTP request through the pooled client of the url's host.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method, e.g. "GET", "POST".
+    url : str
+        the url to request.
+    retry : bool | None
+        retry the request according to the retry policy. Default None: only the
+        idempotent methods of the retry policy are retried, e.g. GET.
+        Set True for requests that are safe to send again, e.g. a POST search query.
+    **kwargs
+        any other argument accepted by `httpx.Client.request`, e.g. headers, params, json.
+
+    Returns
+    -------
+    httpx.Response
+        the HTTP response, from the response cache if the endpoint is cached.
+        The last response is returned if all attempts fail with a retryable status.
+    """
+    if method.upper() in COALESCED_METHODS:
+        # identical concurrent requests share the same response
+        return singleflight.do(
+            _flight_key(method, url, kwargs),
+            lambda: _request(method, url, retry, kwargs),
+        )
+    return _request(method, url, retry, kwargs)
+
+
+def get(
+    url: str, retry: bool | None = None, **kwargs: Any
+) -> httpx.Response:
+    """Send a GET request through the pooled client of the url's host."""
+    return request("GET", url, retry=retry, **kwargs)
+
+
+def post(
+    url: str, retry: bool | None = None, **kwargs: Any
+) -> httpx.Response:
+    """Send a POST request through the pooled client of the url's host."""
+    return request("POST", url, retry=retry, **kwargs)
+
+
+async def _asend(
+    method: str, url: str, retry: bool | None, kwargs: dict[str, Any]
+) -> httpx.Response:
+    """Send a request with the pooled async client, retrying it according to the retry policy."""
+    client = get_async_client(url)
+    policy = _retry_policy if _is_retried(method, retry) else _NO_RETRY
+    attempt = 1
+    while True:
+        # the failed response of this attempt, None if no response was received
+        failed: httpx.Response | None = None
+        try:
+            async with ratelimit.alimit(url):
+                response = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if not _should_retry(policy, attempt, None):
+                raise
+        else:
+            if not _should_retry(policy, attempt, response):
+                return response
+            await response.aclose()
+            failed = response
+
+        await asyncio.sleep(_retry_delay(policy, attempt, failed))
+        attempt += 1
+
+
+async def _arequest(
+    method: str, url: str, retry: bool | None, kwargs: dict[str, Any]
+) -> httpx.Response:
+    """Async version of _request()."""
+    key = response_cache.get_key(method, url, kwargs)
+    if key is None:
+        return await _asend(method, url, retry, kwargs)
+
+    entry = response_cache.get(key)
+    if entry is not None and entry.is_fresh():
+        return entry.to_response(method, url)
+
+    headers = response_cache.conditional_headers(entry, kwargs.get("headers"))
+    if headers is not None:
+        kwargs = {**kwargs, "headers": headers}
+    response = await _asend(method, url, retry, kwargs)
+    return response_cache.update(key, entry, response, method, url)
+
+
+async def arequest(
+    method: str, url: str, retry: bool | None = None, **kwargs: Any
+) -> httpx.Response:
+    """Send an HTTP request through the pooled async client of the url's host.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method, e.g. "GET", "POST".
+    url : str
+        the url to request.
+    retry : bool | None
+        retry the request according to the retry policy, see `request()`.
+    **kwargs
+        any other argument accepted by `httpx.AsyncClient.request`, e.g. headers, params, json.
+
+    Returns
+    -------
+    httpx.Response
+        the HTTP response.
+    """
+    if method.upper() in COALESCED_METHODS:
+        return await singleflight.ado(
+            _flight_key(method, url, kwargs),
+            lambda: _arequest(method, url, retry, kwargs),
+        )
+    return await _arequest(method, url, retry, kwargs)
+
+
+async def aget(
+    url: str, retry: bool | None = None, **kwargs: Any
+) -> httpx.Response:
+    """Send a GET request through the pooled async client of the url's host."""
+    return await arequest("GET", url, retry=retry, **kwargs)
+
+
+async def apost(
+    url: str, retry: bool | None = None, **kwargs: Any
+) -> httpx.Response:
+    """Send a POST request through the pooled async client of the url's host."""
+    return await arequest("POST", url, retry=retry, **kwargs)
+
+
+async def aclose() -> None:
+    """Close the pooled async clients opened in the running event loop."""
+    with _lock:
+        clients = _async_clients.pop(asyncio.get_running_loop(), {})
+
+    for client in clients.values():
+        await client.aclose()
+
+
+def close() -> None:
+    """Close all pooled sync clients and their connections."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+
+    for client in clients:
+        client.close()
+
+    # async clients cannot be closed outside of their event loop, they are dropped instead
+    with _lock:
+        _async_clients.clear()
+
+
+# Release the open connections when the interpreter exits
+atexit.register(close)
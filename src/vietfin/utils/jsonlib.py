@@ -0,0 +1,202 @@
+"""VietFin JSON decoding of the provider responses.
+
+The responses are decoded with the fastest JSON library installed:
+
+- `msgspec`: `poetry add msgspec`
+- `orjson`: `poetry add orjson`
+- the standard library `json` module otherwise.
+
+With msgspec, `decode_records()` also decodes a list of records straight into typed structs
+mirroring the `__alias_dict__` of a Data subclass: only the keys of the model's fields are
+decoded, the other keys of the records are skipped without building any Python object.
+"""
+
+import json
+import types
+from datetime import date, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Sequence, Union, get_args, get_origin
+
+import httpx
+
+if TYPE_CHECKING:
+    from vietfin.abstract.data import Data
+
+try:
+    import msgspec  # type: ignore
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _available_backends() -> dict[str, Callable[[bytes | str], Any]]:
+    backends: dict[str, Callable[[bytes | str], Any]] = {}
+    if msgspec is not None:
+        backends["msgspec"] = msgspec.json.decode
+    if orjson is not None:
+        backends["orjson"] = orjson.loads
+    backends["json"] = json.loads
+    return backends
+
+
+BACKENDS = _available_backends()
+
+# Errors of the fast backends, on which the standard library has the last word,
+# e.g. a document starting with a UTF-8 BOM, or encoded in UTF-16
+_DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+if msgspec is not None:
+    _DECODE_ERRORS += (msgspec.DecodeError,)
+
+# Name of the backend in use, the fastest installed one by default
+backend: str = next(iter(BACKENDS))
+_loads = BACKENDS[backend]
+
+
+def set_backend(name: str) -> None:
+    """Select the JSON library decoding the responses.
+
+    Parameters
+    ----------
+    name : str
+        "msgspec", "orjson" or "json". The library must be installed.
+    """
+    global backend, _loads
+    if name not in BACKENDS:
+        raise ValueError(
+            f"JSON backend {name} is not installed. Available backends: {', '.join(BACKENDS)}."
+        )
+    backend = name
+    _loads = BACKENDS[name]
+
+
+def loads(content: bytes | str) -> Any:
+    """Decode a JSON document."""
+    try:
+        return _loads(content)
+    except _DECODE_ERRORS:
+        if _loads is json.loads:
+            raise
+        return json.loads(content)
+
+
+def response_json(response: httpx.Response) -> Any:
+    """Decode the JSON content of a response, the fast counterpart of `response.json()`."""
+    return loads(response.content)
+
+
+# JSON type of the raw value of each type of field
+_RAW_TYPES: dict[Any, Any] = {
+    bool: bool,
+    int: int,
+    float: float,
+    str: str,
+    type(None): None,
+    # an ISO 8601 string, or a unix timestamp
+    date: str | int | float,
+    datetime: str | int | float,
+}
+
+
+def _raw_type(annotation: Any) -> Any:
+    """Return the type of the raw JSON value of a field, Any if it is not a simple JSON type."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        raw_types = [_raw_type(arg) for arg in get_args(annotation)]
+        if Any in raw_types:
+            return Any
+        return Union[tuple(raw_types)]
+    return _RAW_TYPES.get(annotation, Any)
+
+
+def _reads_raw_records(model: type["Data"]) -> bool:
+    """Return True if a model validator of the model reads the raw record, i.e. its other keys too."""
+    validators = model.__pydantic_decorators__.model_validators.values()
+    return any(v.info.mode in ("before", "wrap") for v in validators)
+
+
+@lru_cache(maxsize=None)
+def record_struct(model: type["Data"]) -> Any:
+    """Return the msgspec Struct mirroring the fields of a Data subclass, built once per model.
+
+    Each field of the model is decoded from its alias of `__alias_dict__`, or from its own name,
+    with the JSON type of its annotation, e.g. `float | None`, or `str | int | float` for a date.
+    The model still validates and converts the values.
+    """
+    if msgspec is None:
+        raise ImportError("Please install msgspec: `poetry add msgspec`.")
+    fields = model.model_fields
+    return msgspec.defstruct(
+        f"{model.__name__}Struct",
+        [
+            (name, _raw_type(field.annotation), msgspec.UNSET)
+            for name, field in fields.items()
+        ],
+        rename={name: model.__alias_dict__.get(name, name) for name in fields},
+    )
+
+
+@lru_cache(maxsize=None)
+def _records_decoder(model: type["Data"]) -> Any:
+    """Return the msgspec decoder of a list of records of a Data subclass, built once per model."""
+    records_type = types.GenericAlias(list, (record_struct(model),))
+    # lax conversions as the model, e.g. a numeric string to a number
+    return msgspec.json.Decoder(records_type | None, strict=False)
+
+
+def decode_records(
+    content: bytes, model: type["Data"], path: Sequence[str] = ()
+) -> list[dict]:
+    """Decode the list of records found at `path` of a JSON document.
+
+    With msgspec, the records are decoded into the Struct of the model, and returned as dicts
+    of the fields of the model only. The other libraries return the records as they are,
+    as do all libraries for a model whose "before" model validator reads the raw record.
+    In both cases, the records are keyed by alias, as in the response.
+
+    Parameters
+    ----------
+    content : bytes
+        JSON document, e.g. the content of a response.
+    model : type[Data]
+        Data subclass of the records.
+    path : Sequence[str]
+        keys leading to the list of records, e.g. ("data",). Default to the document itself.
+
+    Returns
+    -------
+    list[dict]
+        the records, an empty list if a key of the path is missing.
+    """
+    if backend != "msgspec" or _reads_raw_records(model):
+        data = loads(content)
+        for key in path:
+            if not isinstance(data, dict) or key not in data:
+                return []
+            data = data[key]
+        return data or []
+
+    # only the keys of the path are decoded, the rest of the envelope is skipped
+    raw = content
+    for key in path:
+        envelope = msgspec.json.decode(raw, type=dict[str, msgspec.Raw])
+        if key not in envelope:
+            return []
+        raw = envelope[key]
+    struct = record_struct(model)
+    records = _records_decoder(model).decode(raw) or []
+    # key the values by alias again, as expected by the "before" validators of the models
+    fields = list(
+        zip(struct.__struct_fields__, struct.__struct_encode_fields__)
+    )
+    unset = msgspec.UNSET
+    return [
+        {
+            alias: value
+            for name, alias in fields
+            if (value := getattr(r, name)) is not unset
+        }
+        for r in records
+    ]
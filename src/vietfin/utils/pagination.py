@@ -0,0 +1,229 @@
+"""VietFin paginator of page-indexed endpoints.
+
+Some provider endpoints return their records by pages, requested with `page=0,1,2...`,
+and signal the end of the records with an empty page.
+The paginator fetches the first page alone, then the next pages concurrently by windows:
+
+- when the number of pages is known, from the `limit` of records or from the total
+  revealed by the first page, only these pages are requested;
+- otherwise, a window of pages is prefetched speculatively, and the pages after the first
+  empty page are dropped.
+
+The pages are always yielded in order, so the output is the same as fetching them one by one.
+"""
+
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterator
+
+# Number of pages requested at the same time after the first page
+DEFAULT_PREFETCH_WINDOW = 4
+
+# url, raw json data and records of a page
+Page = tuple[str, dict, list]
+
+
+def _page_count(limit: int, page_size: int, total: int | None) -> int | None:
+    """Return the number of pages to fetch, or None if unknown."""
+    counts = []
+    if limit > 0:
+        counts.append(math.ceil(limit / page_size))
+    if total is not None:
+        counts.append(math.ceil(total / page_size))
+    return min(counts) if counts else None
+
+
+def _read_total(data_chunk: dict, total_key: str | None) -> int | None:
+    """Return the total number of records announced by a page, if any."""
+    if total_key is None:
+        return None
+    total = data_chunk.get(total_key)
+    if isinstance(total, int) and not isinstance(total, bool) and total >= 0:
+        return total
+    return None
+
+
+def _window(next_page: int, n_pages: int | None, window: int) -> range:
+    """Return the page numbers of the next window."""
+    end = next_page + window
+    if n_pages is not None:
+        end = min(end, n_pages)
+    return range(next_page, end)
+
+
+class _Counter:
+    """Track the number of records yielded, to stop at the limit."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.count = 0
+
+    def take(self, rows: list) -> list:
+        """Return the rows within the limit, and count them."""
+        if self.limit > 0:
+            rows = rows[: self.limit - self.count]
+        self.count += len(rows)
+        return rows
+
+    @property
+    def done(self) -> bool:
+        return 0 < self.limit <= self.count
+
+
+def iter_pages(
+    fetch_page: Callable[[int], tuple[str, dict]],
+    get_rows: Callable[[dict], list],
+    limit: int = 0,
+    page_size: int = 100,
+    window: int = DEFAULT_PREFETCH_WINDOW,
+    total_key: str | None = None,
+) -> Iterator[Page]:
+    """Yield the non-empty pages of a page-indexed endpoint, in order.
+
+    Parameters
+    ----------
+    fetch_page : Callable[[int], tuple[str, dict]]
+        send the API call of a page number, return the url and the json data.
+    get_rows : Callable[[dict], list]
+        return the records of the json data of a page.
+    limit : int
+        maximum number of records. 0 means all records. Default 0.
+    page_size : int
+        number of records per page. Default 100.
+    window : int
+        number of pages requested at the same time. Default 4.
+    total_key : str | None
+        key of the total number of records in the json data of a page, if the endpoint has one.
+
+    Yields
+    ------
+    tuple[str, dict, list]
+        url, json data and records of each page. The records of the last page are
+        truncated to the limit.
+    """
+    if window < 1:
+        raise ValueError("window must be >= 1.")
+
+    counter = _Counter(limit)
+
+    url, data_chunk = fetch_page(0)
+    rows = get_rows(data_chunk)
+    if not rows:
+        return
+    yield url, data_chunk, counter.take(rows)
+
+    n_pages = _page_count(limit, page_size, _read_total(data_chunk, total_key))
+    next_page = 1
+
+    executor = ThreadPoolExecutor(max_workers=window)
+    try:
+        while not counter.done and (n_pages is None or next_page < n_pages):
+            pages = _window(next_page, n_pages, window)
+            futures = [executor.submit(fetch_page, page) for page in pages]
+            for future in futures:
+                url, data_chunk = future.result()
+                rows = get_rows(data_chunk)
+                if not rows:
+                    return  # stop at the first empty page
+                yield url, data_chunk, counter.take(rows)
+                if counter.done:
+                    return  # stop if limit reached
+            next_page = pages.stop
+    finally:
+        # drop the prefetched pages not needed anymore
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[tuple[str, dict]]],
+    get_rows: Callable[[dict], list],
+    limit: int = 0,
+    page_size: int = 100,
+    window: int = DEFAULT_PREFETCH_WINDOW,
+    total_key: str | None = None,
+) -> AsyncIterator[Page]:
+    """Async version of iter_pages(), with a coroutine fetch_page.
+
+    See iter_pages() for the description of the parameters.
+    """
+    if window < 1:
+        raise ValueError("window must be >= 1.")
+
+    counter = _Counter(limit)
+
+    url, data_chunk = await fetch_page(0)
+    rows = get_rows(data_chunk)
+    if not rows:
+        return
+    yield url, data_chunk, counter.take(rows)
+
+    n_pages = _page_count(limit, page_size, _read_total(data_chunk, total_key))
+    next_page = 1
+
+    while not counter.done and (n_pages is None or next_page < n_pages):
+        pages = _window(next_page, n_pages, window)
+        responses = await asyncio.gather(*[fetch_page(page) for page in pages])
+        for url, data_chunk in responses:
+            rows = get_rows(data_chunk)
+            if not rows:
+                return  # stop at the first empty page
+            yield url, data_chunk, counter.take(rows)
+            if counter.done:
+                return  # stop if limit reached
+        next_page = pages.stop
+
+
+def fetch_pages(
+    fetch_page: Callable[[int], tuple[str, dict]],
+    get_rows: Callable[[dict], list],
+    limit: int = 0,
+    page_size: int = 100,
+    window: int = DEFAULT_PREFETCH_WINDOW,
+    total_key: str | None = None,
+) -> tuple[list[str], list[dict], list]:
+    """Fetch all pages of a page-indexed endpoint.
+
+    See iter_pages() for the description of the parameters.
+
+    Returns
+    -------
+    tuple[list[str], list[dict], list]
+        url_list : list[str]
+            the url of each non-empty page.
+        data : list[dict]
+            the json data of each non-empty page.
+        rows : list
+            the records of all pages, up to the limit.
+    """
+    url_list = []
+    data = []
+    rows: list = []
+    for url, data_chunk, page_rows in iter_pages(
+        fetch_page, get_rows, limit, page_size, window, total_key
+    ):
+        url_list.append(url)
+        data.append(data_chunk)
+        rows.extend(page_rows)
+    return url_list, data, rows
+
+
+async def afetch_pages(
+    fetch_page: Callable[[int], Awaitable[tuple[str, dict]]],
+    get_rows: Callable[[dict], list],
+    limit: int = 0,
+    page_size: int = 100,
+    window: int = DEFAULT_PREFETCH_WINDOW,
+    total_key: str | None = None,
+) -> tuple[list[str], list[dict], list]:
+    """Async version of fetch_pages(), with a coroutine fetch_page."""
+    url_list = []
+    data = []
+    rows: list = []
+    async for url, data_chunk, page_rows in aiter_pages(
+        fetch_page, get_rows, limit, page_size, window, total_key
+    ):
+        url_list.append(url)
+        data.append(data_chunk)
+        rows.extend(page_rows)
+    return url_list, data, rows
@@ -0,0 +1,330 @@
+"""VietFin rate limiter of the requests sent to each provider host.
+
+Providers throttle clients sending too many requests, and some of them answer with
+empty pages instead of an error, which the paginated commands take as the end of the records.
+Every request of the HTTP session layer `vietfin.utils.http` waits for the limiter of its host:
+
+- a token bucket caps the rate of requests (`rate` requests per second, after an initial `burst`);
+- a pool of slots caps the number of requests in flight (`max_concurrency`).
+
+The limiters are shared by all threads and all event loops of the process, so fanning out
+across symbols with threads (e.g. `historical_many()`) or tasks (e.g. `vf.aio`) runs at the
+maximum sustainable throughput of each host. Hosts without limits are not limited.
+
+The time spent waiting is recorded per host, see `get_metrics()`.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel, Field
+
+
+class HostLimit(BaseModel):
+    """Rate limit of a provider host.
+
+    Attributes
+    ----------
+    rate : float
+        sustained number of requests per second.
+    burst : int
+        number of requests that can be sent at once before the rate applies.
+    max_concurrency : int | None
+        maximum number of requests in flight. None means no limit.
+    """
+
+    rate: float = Field(gt=0)
+    burst: int = Field(default=1, ge=1)
+    max_concurrency: int | None = Field(default=None, ge=1)
+
+
+# Default rate limits of the provider hosts
+DEFAULT_HOST_LIMITS: dict[str, HostLimit] = {
+    "apipubaws.tcbs.com.vn": HostLimit(rate=10, burst=20, max_concurrency=8),
+    "iboard.ssi.com.vn": HostLimit(rate=5, burst=10, max_concurrency=4),
+    "s.cafef.vn": HostLimit(rate=5, burst=10, max_concurrency=4),
+    "api.fmarket.vn": HostLimit(rate=5, burst=10, max_concurrency=4),
+    "services.entrade.com.vn": HostLimit(rate=10, burst=20, max_concurrency=8),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    A request reserves a token, and is told how long to wait for it, so the same bucket
+    serves threads (sleeping) and coroutines (awaiting) without holding a lock while waiting.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve a token, return the delay (in seconds) to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            # a negative balance is the queue of the reservations waiting for a token
+            return max(0.0, -self._tokens / self.rate)
+
+
+class SlotPool:
+    """Pool of slots capping the requests in flight, shared by threads and event loops."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._active = 0
+        self._cond = threading.Condition()
+        # event loop and future of each coroutine waiting for a slot
+        self._async_waiters: deque[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = deque()
+
+    def _try_acquire(self) -> bool:
+        # must be called with the lock held
+        if self._active < self.size:
+            self._active += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        """Wait for a free slot, blocking the thread."""
+        with self._cond:
+            while not self._try_acquire():
+                self._cond.wait()
+
+    async def aacquire(self) -> None:
+        """Wait for a free slot, without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._try_acquire():
+                    return
+                future = loop.create_future()
+                self._async_waiters.append((loop, future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                with self._cond:
+                    # the slot this task was woken up for goes to the next waiter
+                    if future.done() and not future.cancelled():
+                        self._wake_async_waiter()
+                raise
+
+    def _wake_async_waiter(self) -> None:
+        # must be called with the lock held
+        while self._async_waiters:
+            loop, future = self._async_waiters.popleft()
+            if not future.done():
+                loop.call_soon_threadsafe(_set_future_done, future)
+                return
+
+    def release(self) -> None:
+        """Free a slot, and wake up one waiting thread and one waiting coroutine."""
+        with self._cond:
+            self._active -= 1
+            # the woken up waiters compete for the slot, the losers wait again
+            self._cond.notify()
+            self._wake_async_waiter()
+
+
+def _set_future_done(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class HostLimiter:
+    """Rate limiter of a single host, with its wait metrics."""
+
+    def __init__(self, limit: HostLimit) -> None:
+        self.limit = limit
+        self.bucket = TokenBucket(limit.rate, limit.burst)
+        self.slots = (
+            SlotPool(limit.max_concurrency) if limit.max_concurrency else None
+        )
+        self._metrics_lock = threading.Lock()
+        self.requests = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    def _record(self, waited: float) -> None:
+        with self._metrics_lock:
+            self.requests += 1
+            self.wait_time += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """Wait for the limits of the host, blocking the thread, and hold a slot in the with block."""
+        started_at = time.monotonic()
+        if self.slots is not None:
+            self.slots.acquire()
+        try:
+            delay = self.bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+            self._record(time.monotonic() - started_at)
+            yield
+        finally:
+            if self.slots is not None:
+                self.slots.release()
+
+    @asynccontextmanager
+    async def aacquire(self) -> AsyncIterator[None]:
+        """Wait for the limits of the host without blocking the event loop, and hold a slot in the with block."""
+        started_at = time.monotonic()
+        if self.slots is not None:
+            await self.slots.aacquire()
+        try:
+            delay = self.bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._record(time.monotonic() - started_at)
+            yield
+        finally:
+            if self.slots is not None:
+                self.slots.release()
+
+    def metrics(self) -> dict:
+        """Return the number of requests and the time (in seconds) spent waiting for the limits."""
+        with self._metrics_lock:
+            mean_wait = self.wait_time / self.requests if self.requests else 0.0
+            return {
+                "requests": self.requests,
+                "wait_time": self.wait_time,
+                "max_wait": self.max_wait,
+                "mean_wait": mean_wait,
+            }
+
+
+_host_limits: dict[str, HostLimit] = dict(DEFAULT_HOST_LIMITS)
+_limiters: dict[str, HostLimiter] = {}
+_lock = threading.Lock()
+_enabled = True
+
+
+def _hostname(url: str) -> str:
+    """Return the lowercase host name of an url, or the value itself if it is already a host name."""
+    return (urlsplit(url).hostname or url).lower()
+
+
+def set_host_limit(
+    host: str,
+    rate: float,
+    burst: int = 1,
+    max_concurrency: int | None = None,
+) -> HostLimit:
+    """Set the rate limit of a provider host.
+
+    Parameters
+    ----------
+    host : str
+        host name, e.g. "apipubaws.tcbs.com.vn", or any url of the host.
+    rate : float
+        sustained number of requests per second.
+    burst : int
+        number of requests that can be sent at once before the rate applies. Default 1.
+    max_concurrency : int | None
+        maximum number of requests in flight. Default None, no limit.
+
+    Returns
+    -------
+    HostLimit
+        the new rate limit of the host.
+    """
+    limit = HostLimit(rate=rate, burst=burst, max_concurrency=max_concurrency)
+    host = _hostname(host)
+    with _lock:
+        _host_limits[host] = limit
+        # the new limit applies to the requests started after this point
+        _limiters.pop(host, None)
+    return limit
+
+
+def remove_host_limit(host: str) -> None:
+    """Remove the rate limit of a provider host, its requests are not limited anymore."""
+    host = _hostname(host)
+    with _lock:
+        _host_limits.pop(host, None)
+        _limiters.pop(host, None)
+
+
+def get_host_limits() -> dict[str, HostLimit]:
+    """Return the rate limit of each limited host."""
+    return dict(_host_limits)
+
+
+def set_enabled(enabled: bool) -> None:
+    """Enable or disable the rate limiting of all hosts."""
+    global _enabled
+    _enabled = enabled
+
+
+def get_limiter(url: str) -> HostLimiter | None:
+    """Return the limiter of the host of an url, or None if the host is not limited."""
+    if not _enabled:
+        return None
+    host = _hostname(url)
+    limiter = _limiters.get(host)
+    if limiter is not None:
+        return limiter
+
+    with _lock:
+        limiter = _limiters.get(host)
+        if limiter is None and host in _host_limits:
+            limiter = _limiters[host] = HostLimiter(_host_limits[host])
+    return limiter
+
+
+@contextmanager
+def limit(url: str) -> Iterator[None]:
+    """Wait for the rate limit of the url's host, blocking the thread."""
+    limiter = get_limiter(url)
+    if limiter is None:
+        yield
+        return
+    with limiter.acquire():
+        yield
+
+
+@asynccontextmanager
+async def alimit(url: str) -> AsyncIterator[None]:
+    """Wait for the rate limit of the url's host, without blocking the event loop."""
+    limiter = get_limiter(url)
+    if limiter is None:
+        yield
+        return
+    async with limiter.aacquire():
+        yield
+
+
+def get_metrics() -> dict[str, dict]:
+    """Return the wait metrics of each host requested since the last reset.
+
+    Returns
+    -------
+    dict[str, dict]
+        keyed by host name, the number of requests and the total, maximum and mean
+        time (in seconds) spent waiting for the rate limit.
+    """
+    with _lock:
+        limiters = dict(_limiters)
+    return {host: limiter.metrics() for host, limiter in limiters.items()}
+
+
+def reset_metrics() -> None:
+    """Reset the wait metrics of all hosts, and refill their token buckets."""
+    with _lock:
+        _limiters.clear()
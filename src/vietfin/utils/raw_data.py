@@ -0,0 +1,119 @@
+"""VietFin retention policy of the raw data of the command results.
+
+Every command returns a VfObject keeping, in `raw_data`, the decoded data of its API calls
+alongside the parsed results, which roughly doubles the memory held by each result.
+The policy decides what is kept:
+
+- "full": the decoded raw data, as returned by the API calls. Default.
+- "lazy": only a compressed copy of the raw data, decoded on first access of `raw_data`.
+- "none": nothing, `raw_data` is None.
+
+The policy is set for the whole process with `set_raw_data_policy()`, and overridden
+for the commands run in a with block, e.g. a single call, with `raw_data_policy()`:
+
+    with raw_data_policy("none"):
+        vf.equity.price.historical("VNM")
+"""
+
+import pickle
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Literal
+
+from pydantic_core import core_schema
+
+RAW_DATA_POLICIES = Literal["none", "lazy", "full"]
+_VALID_POLICIES = ("none", "lazy", "full")
+
+_policy: str = "full"
+# policy of the current context, set by raw_data_policy()
+_context_policy: ContextVar[str | None] = ContextVar(
+    "vietfin_raw_data_policy", default=None
+)
+
+
+def _check_policy(policy: str) -> str:
+    if policy not in _VALID_POLICIES:
+        raise ValueError(
+            f"Invalid raw data policy: {policy}. Valid policies: {', '.join(_VALID_POLICIES)}."
+        )
+    return policy
+
+
+def set_raw_data_policy(policy: RAW_DATA_POLICIES) -> None:
+    """Set the raw data policy of the whole process.
+
+    Parameters
+    ----------
+    policy : Literal["none", "lazy", "full"]
+        what the results keep of the raw data of their API calls.
+    """
+    global _policy
+    _policy = _check_policy(policy)
+
+
+def get_raw_data_policy() -> str:
+    """Return the raw data policy of the current context, or of the process."""
+    return _context_policy.get() or _policy
+
+
+@contextmanager
+def raw_data_policy(policy: RAW_DATA_POLICIES) -> Iterator[None]:
+    """Override the raw data policy for the commands run in the with block.
+
+    The override is local to the current thread or async task, and is inherited by the
+    async tasks and the concurrent calls it starts.
+    """
+    token = _context_policy.set(_check_policy(policy))
+    try:
+        yield
+    finally:
+        _context_policy.reset(token)
+
+
+class LazyRawData:
+    """Compressed raw data, decoded on demand."""
+
+    __slots__ = ("_blob",)
+
+    def __init__(self, raw_data: Any) -> None:
+        # pickle is faster than json and keeps the exact types, e.g. the dates of Excel sheets
+        self._blob = zlib.compress(
+            pickle.dumps(raw_data, protocol=pickle.HIGHEST_PROTOCOL), 1
+        )
+
+    def __len__(self) -> int:
+        """Return the size in bytes of the compressed raw data."""
+        return len(self._blob)
+
+    def __repr__(self) -> str:
+        return f"<LazyRawData: {len(self._blob)} compressed bytes>"
+
+    def load(self) -> Any:
+        """Decode the raw data."""
+        return pickle.loads(zlib.decompress(self._blob))
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: Any
+    ) -> core_schema.CoreSchema:
+        # kept as is by validation, decoded by serialization, e.g. model_dump()
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.load()
+            ),
+        )
+
+
+def apply_policy(raw_data: Any) -> Any:
+    """Return what a result keeps of its raw data, according to the current policy."""
+    if raw_data is None or isinstance(raw_data, LazyRawData):
+        return raw_data
+    policy = get_raw_data_policy()
+    if policy == "none":
+        return None
+    if policy == "lazy":
+        return LazyRawData(raw_data)
+    return raw_data
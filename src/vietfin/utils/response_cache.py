@@ -0,0 +1,377 @@
+"""VietFin cache of the HTTP responses of rarely changing endpoints.
+
+Some endpoints return data that changes at most once a day, e.g. the list of organizations,
+a company profile or its financial statements. The HTTP session layer `vietfin.utils.http`
+keeps their successful responses in this cache, keyed by method, url, body and headers,
+so the provider functions get them without calling the network again.
+
+The time to live of a response depends on the class of its endpoint:
+
+- "static": reference lists, e.g. the list of organizations. Default 24 hours.
+- "daily": data updated at most once a day, e.g. company profile, financial statements. Default 6 hours.
+- "intraday": lists including the prices of the day, e.g. ETF or futures search. Default 30 seconds.
+
+An endpoint is classified by the first rule of `ENDPOINT_RULES` matching its url.
+The responses of unclassified endpoints, e.g. historical prices, are never cached.
+
+When an expired response has an `ETag` or `Last-Modified` header, the request is sent
+as a conditional request, and a `304 Not Modified` answer renews the cached response.
+
+The cache is enabled by default, disable it with `configure(enabled=False)`.
+The responses are kept in memory (LRU), and also on disk when the persistence of the caches
+is enabled, see `vietfin.utils.cache.set_disk_persistence()`. Other stores can be plugged in
+with `set_stores()`.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import httpx
+
+from vietfin.utils import cache
+from vietfin.utils.helpers import get_cache_dir
+
+# Time to live (in seconds) of the responses of each endpoint class
+ENDPOINT_TTLS: dict[str, float] = {
+    "static": 24 * 60 * 60,
+    "daily": 6 * 60 * 60,
+    "intraday": 30,
+}
+
+# Endpoint class of the urls matching each pattern, the first matching rule wins
+# The SSI list of organizations is not listed, it is cached by its symbol master
+# `vietfin.providers.ssi.utils.symbol_master`
+ENDPOINT_RULES: list[tuple[str, str]] = [
+    (r"wifeed\.vn/api/thong-tin-co-phieu/danh-sach-ma-chung-khoan", "static"),
+    (
+        r"apipubaws\.tcbs\.com\.vn/tcanalysis/v1/(company|ticker)/[^/]+/overview",
+        "daily",
+    ),
+    (
+        r"apipubaws\.tcbs\.com\.vn/tcanalysis/v1/company/[^/]+/(key-officers|large-share-holders)",
+        "daily",
+    ),
+    (r"apipubaws\.tcbs\.com\.vn/tcanalysis/v1/finance/", "daily"),
+    (r"fiin-fundamental\.ssi\.com\.vn/FinancialStatement/", "daily"),
+    (r"api\.fmarket\.vn/res/products/\d+", "daily"),
+    (r"iboard-query\.ssi\.com\.vn/v2/stock/(type|group|exchange)/", "intraday"),
+]
+
+# Methods of the cached requests
+CACHED_METHODS = {"GET"}
+
+# Request headers changing the content of a response, part of the cache key
+KEY_HEADERS = ("accept", "accept-language", "authorization", "cookie")
+
+# Maximum number of responses kept in memory
+DEFAULT_MAX_ENTRIES = 512
+
+# Headers dropped from a cached response, since its content is stored decoded
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CachedResponse(NamedTuple):
+    """Successful response kept in the cache."""
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    endpoint_class: str
+    stored_at: float
+
+    def is_fresh(self) -> bool:
+        """Return True if the response is younger than the TTL of its endpoint class."""
+        ttl = ENDPOINT_TTLS.get(self.endpoint_class, 0)
+        return time.time() - self.stored_at < ttl
+
+    def to_response(self, method: str, url: str) -> httpx.Response:
+        """Rebuild the httpx.Response of the cached response."""
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(method, url),
+        )
+
+
+class ResponseStore(ABC):
+    """Abstract base class of a store of cached responses."""
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response of a key, or None if missing."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store the cached response of a key."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        pass
+
+
+class MemoryStore(ResponseStore):
+    """Thread-safe in-memory LRU store.
+
+    Parameters
+    ----------
+    max_entries : int
+        maximum number of responses, the least recently used ones are dropped first.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskStore(ResponseStore):
+    """Store of one JSON file per response.
+
+    Parameters
+    ----------
+    directory : str | Path | None
+        directory of the files. Default to `http` in the cache directory.
+    """
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self._directory = Path(directory) if directory else None
+
+    @property
+    def directory(self) -> Path:
+        directory = self._directory or get_cache_dir() / "http"
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory
+
+    def get(self, key: str) -> CachedResponse | None:
+        try:
+            with open(self.directory / f"{key}.json", encoding="utf-8") as f:
+                content = json.load(f)
+            return CachedResponse(
+                status_code=content["status_code"],
+                headers=content["headers"],
+                content=bytes.fromhex(content["content"]),
+                endpoint_class=content["endpoint_class"],
+                stored_at=content["stored_at"],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        path = self.directory / f"{key}.json"
+        # write to a temporary file first, so a concurrent reader never sees a partial file
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({**entry._asdict(), "content": entry.content.hex()}, f)
+        tmp_path.replace(path)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+_enabled = True
+_conditional = True
+_memory = MemoryStore()
+_disk = DiskStore()
+# custom stores set by set_stores(), replacing the default ones
+_stores: list[ResponseStore] | None = None
+_compiled_rules: list[tuple[re.Pattern, str]] | None = None
+
+
+def configure(
+    enabled: bool | None = None, conditional: bool | None = None
+) -> None:
+    """Update the settings of the response cache.
+
+    Parameters
+    ----------
+    enabled : bool | None
+        enable or disable the response cache.
+    conditional : bool | None
+        send conditional requests (ETag/Last-Modified) to renew the expired responses.
+    """
+    global _enabled, _conditional
+    if enabled is not None:
+        _enabled = enabled
+    if conditional is not None:
+        _conditional = conditional
+
+
+def set_stores(stores: list[ResponseStore] | None) -> None:
+    """Replace the stores of the cached responses, None restores the default ones.
+
+    The stores are read in order, and every response is written to all stores.
+    """
+    global _stores
+    _stores = stores
+
+
+def _get_stores() -> list[ResponseStore]:
+    if _stores is not None:
+        return _stores
+    if cache.get_disk_persistence():
+        return [_memory, _disk]
+    return [_memory]
+
+
+def set_endpoint_rule(pattern: str, endpoint_class: str | None) -> None:
+    """Classify the urls matching a pattern, taking precedence over the existing rules.
+
+    Parameters
+    ----------
+    pattern : str
+        regular expression searched in the url.
+    endpoint_class : str | None
+        one of the keys of ENDPOINT_TTLS, or None to never cache the matching urls.
+    """
+    global _compiled_rules
+    if endpoint_class is not None and endpoint_class not in ENDPOINT_TTLS:
+        raise ValueError(
+            f"Invalid endpoint class: {endpoint_class}. Valid classes: {', '.join(ENDPOINT_TTLS)}."
+        )
+    ENDPOINT_RULES.insert(0, (pattern, endpoint_class))  # type: ignore[arg-type]
+    _compiled_rules = None
+
+
+def classify(url: str) -> str | None:
+    """Return the endpoint class of an url, or None if its responses are not cached."""
+    global _compiled_rules
+    rules = _compiled_rules
+    if rules is None:
+        rules = _compiled_rules = [(re.compile(p), c) for p, c in ENDPOINT_RULES]
+    for pattern, endpoint_class in rules:
+        if pattern.search(url):
+            return endpoint_class
+    return None
+
+
+def get_key(method: str, url: str, kwargs: dict[str, Any]) -> str | None:
+    """Return the cache key of a request, or None if its response is not cached.
+
+    The key is a hash of the method, the url including the query parameters, the body,
+    and the request headers changing the content of the response, see `KEY_HEADERS`.
+    """
+    if not _enabled or method.upper() not in CACHED_METHODS:
+        return None
+    request = httpx.Request(
+        method,
+        url,
+        params=kwargs.get("params"),
+        json=kwargs.get("json"),
+        data=kwargs.get("data"),
+        content=kwargs.get("content"),
+        headers=kwargs.get("headers"),
+    )
+    if classify(str(request.url)) is None:
+        return None
+    digest = hashlib.sha256(f"{method.upper()} {request.url}\n".encode())
+    for name in KEY_HEADERS:
+        digest.update(f"{name}: {request.headers.get(name, '')}\n".encode())
+    digest.update(request.content)
+    return digest.hexdigest()
+
+
+def get(key: str) -> CachedResponse | None:
+    """Return the cached response of a key, fresh or expired, or None if missing."""
+    stores = _get_stores()
+    for i, store in enumerate(stores):
+        entry = store.get(key)
+        if entry is not None:
+            # copy the response to the faster stores, e.g. from disk to memory
+            for faster_store in stores[:i]:
+                faster_store.set(key, entry)
+            return entry
+    return None
+
+
+def conditional_headers(
+    entry: CachedResponse | None, headers: Any
+) -> dict[str, str] | None:
+    """Return the headers of a conditional request renewing an expired response.
+
+    Returns None if the response has no validator or conditional requests are disabled.
+    """
+    if entry is None or not _conditional:
+        return None
+    validators = {}
+    if "etag" in entry.headers:
+        validators["If-None-Match"] = entry.headers["etag"]
+    if "last-modified" in entry.headers:
+        validators["If-Modified-Since"] = entry.headers["last-modified"]
+    if not validators:
+        return None
+    return {**dict(headers or {}), **validators}
+
+
+def update(
+    key: str,
+    entry: CachedResponse | None,
+    response: httpx.Response,
+    method: str,
+    url: str,
+) -> httpx.Response:
+    """Store a new response, or renew the cached one on `304 Not Modified`.
+
+    Returns
+    -------
+    httpx.Response
+        the response to return to the caller.
+    """
+    if response.status_code == 304 and entry is not None:
+        entry = entry._replace(stored_at=time.time())
+    elif response.status_code == 200:
+        endpoint_class = classify(str(response.request.url))
+        if endpoint_class is None:
+            return response
+        entry = CachedResponse(
+            status_code=response.status_code,
+            headers={
+                k.lower(): v
+                for k, v in response.headers.items()
+                if k.lower() not in _DROPPED_HEADERS
+            },
+            content=response.content,
+            endpoint_class=endpoint_class,
+            stored_at=time.time(),
+        )
+    else:
+        return response
+
+    for store in _get_stores():
+        store.set(key, entry)
+    return response if response.status_code == 200 else entry.to_response(method, url)
+
+
+def clear() -> None:
+    """Drop all cached responses."""
+    for store in _get_stores():
+        store.clear()
@@ -0,0 +1,139 @@
+"""VietFin coalescing of identical concurrent calls (single-flight).
+
+When many threads or tasks ask for the same thing at the same moment, e.g. the FundID
+of the same fund, only the first caller runs the call, the others wait for it and get
+the same result, or the same exception. A call is only shared while it is in flight:
+the next call after it returns runs again (caching is the job of `vietfin.utils.cache`).
+
+Threads are coalesced with threads, and tasks of an event loop with tasks of the same loop.
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+R = TypeVar("R")
+
+
+class _Call:
+    """Call in flight, shared by the threads waiting for it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.n_callers = 1
+
+
+class SingleFlight:
+    """Group of calls coalesced by key."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], R]) -> R:
+        """Run func, unless a call of the same key is in flight, then wait for its result.
+
+        Parameters
+        ----------
+        key : Hashable
+            key of the call, identical calls must have the same key.
+        func : Callable[[], R]
+            the call to run.
+
+        Returns
+        -------
+        R
+            the result of the call, shared by all the callers of the same key.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.n_callers += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as ex:
+            call.error = ex
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def ado(self, key: Hashable, func: Callable[[], Awaitable[R]]) -> R:
+        """Async version of do(), with a coroutine function.
+
+        The call runs in its own task, so cancelling one of the callers does not cancel
+        the call awaited by the others.
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            task = loop.create_task(func())  # type: ignore[arg-type]
+            self._tasks[task_key] = task
+            # no thread switch can happen here, the key is dropped when the call is done
+            task.add_done_callback(lambda _: self._tasks.pop(task_key, None))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._calls) + len(self._tasks)
+
+
+# Default group shared by the whole process
+_group = SingleFlight()
+
+
+def do(key: Hashable, func: Callable[[], R]) -> R:
+    """Run func, sharing its result with the concurrent calls of the same key.
+
+    See SingleFlight.do().
+    """
+    return _group.do(key, func)
+
+
+async def ado(key: Hashable, func: Callable[[], Awaitable[R]]) -> R:
+    """Async version of do(), see SingleFlight.ado()."""
+    return await _group.ado(key, func)
+
+
+def coalesced(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate a function or coroutine function so identical concurrent calls run once.
+
+    Calls are identical if they have the same arguments, which must be hashable.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    def make_key(args: tuple, kwargs: dict) -> Hashable:
+        return (name, args, tuple(sorted(kwargs.items())))
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await ado(make_key(args, kwargs), lambda: func(*args, **kwargs))
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return do(make_key(args, kwargs), lambda: func(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,51 @@
+"""Test all functions in the async Aio class."""
+
+import asyncio
+
+import httpx
+
+from vietfin import vf
+from .utils import assert_run_success as ars, mock_http_transport
+
+# A DNSE response covering 2 trading days
+DNSE_OHLCS = {
+    "t": [1701648000, 1701734400],
+    "o": [20.1, 20.5],
+    "h": [20.8, 20.9],
+    "l": [20.0, 20.3],
+    "c": [20.5, 20.6],
+    "v": [1_000_000, 1_200_000],
+}
+
+
+def test_aio_equity_price_historical_concurrently(monkeypatch):
+    """Test many aio.equity.price.historical() commands run concurrently on one event loop."""
+
+    requested_symbols = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_symbols.append(request.url.params["symbol"])
+        return httpx.Response(200, json=DNSE_OHLCS)
+
+    mock_http_transport(monkeypatch, handler)
+    symbols = ["SSI", "FPT", "VNM"]
+
+    async def main():
+        return await asyncio.gather(
+            *[
+                vf.aio.equity.price.historical(
+                    symbol=s,
+                    start_date="2023-12-01",
+                    end_date="2023-12-10",
+                    provider="dnse",
+                )
+                for s in symbols
+            ]
+        )
+
+    results = asyncio.run(main())
+
+    assert sorted(requested_symbols) == sorted(symbols)
+    for symbol, result in zip(symbols, results):
+        ars(result, symbol, "dnse")
+        assert result.results[0].close == 20500
@@ -0,0 +1,135 @@
+"""Test the VietFin Standardized Data Model."""
+
+import copy
+from datetime import date
+
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from vietfin.abstract.data import Data
+from vietfin.abstract.vfobject import VfObject
+from vietfin.providers.cafef.models.equity_ownership_foreign import (
+    CafefEquityOwnershipForeignTradingData,
+)
+from vietfin.providers.cafef.models.equity_ownership_prop import (
+    CafefEquityOwnershipPropTradingData,
+)
+from vietfin.providers.dnse.models.equity_price_historical import (
+    DnseEquityHistoricalPriceData,
+)
+from vietfin.providers.ssi.models.derivatives_futures_quote import (
+    SsiDerivativesFuturesQuoteData,
+)
+from vietfin.utils.helpers import (
+    convert_dictlists_to_listdicts,
+    parse_ohlcv_columns,
+)
+
+
+class RenamedData(Data):
+    """Model whose alias is also the name of another field."""
+
+    __alias_dict__ = {"first": "second", "second": "third"}
+
+    first: int
+    second: int
+
+
+def test_alias_dict_is_compiled_once():
+    """Each aliased field is read from its alias first."""
+    assert RenamedData.__field_names__ == {"second": "first", "third": "second"}
+    assert RenamedData(second=1, third=2).model_dump() == {"first": 1, "second": 2}
+
+    # the "before" validator of the model still receives the keys of the API response
+    bar = DnseEquityHistoricalPriceData(t=1704153600, o=1, h=2, l=0.5, c=1.5, v=100)
+    assert bar.date == date(2024, 1, 2)
+    assert bar.close == 1500
+
+
+def test_validate_many():
+    """validate_many() returns the same models as validating each row."""
+    rows = [
+        {"t": 1704153600 + d * 86400, "o": 1, "h": 2, "l": 0.5, "c": 1.5, "v": 100}
+        for d in range(3)
+    ]
+
+    assert DnseEquityHistoricalPriceData.validate_many(
+        [dict(r) for r in rows]
+    ) == [DnseEquityHistoricalPriceData(**r) for r in rows]
+    with pytest.raises(ValidationError):
+        DnseEquityHistoricalPriceData.validate_many([{"t": 1704153600}])
+
+
+@pytest.mark.parametrize(
+    "model, row",
+    [
+        (
+            CafefEquityOwnershipForeignTradingData,
+            {"Ngay": "02/01/2024", "KLMua": 100, "ThayDoi": "76.1(-2.65 %)"},
+        ),
+        (
+            CafefEquityOwnershipPropTradingData,
+            {"Date": "02/01/2024", "KLcpMua": 100, "Symbol": "VNM"},
+        ),
+        (
+            SsiDerivativesFuturesQuoteData,
+            {
+                "_id": "0915001704186900000",
+                "time": "09:15:00",
+                "stockSymbol": "VN30F2401",
+                "vol": 10,
+                "price": 1150.5,
+                "side": "BU",
+                "priceChange": 1.5,
+                "priceChangePercent": 0.13,
+                "ref": 1149,
+            },
+        ),
+        (
+            DnseEquityHistoricalPriceData,
+            {"t": 1704153600, "o": 1, "h": 2, "l": 0.5, "c": 1.5, "v": 100},
+        ),
+    ],
+)
+def test_validate_many_keeps_raw_rows(model, row):
+    """The "before" validators do not change the rows, kept as the raw data."""
+    rows = [row, dict(row)]
+    raw = copy.deepcopy(rows)
+
+    first = model.validate_many(rows)
+    assert rows == raw
+    # the same rows validated again give the same models
+    assert model.validate_many(rows) == first
+
+
+def test_parse_ohlcv_columns():
+    """The vectorized OHLCV parser matches the validation of the data models."""
+    data = {
+        "t": [1704240000, 1704153600, 1704153600 + 9 * 3600],
+        "o": [1, 2.5, 3],
+        "h": [2, 3, 4],
+        "l": [0.5, 2, 3],
+        "c": [1.5, 2.5, 3.5],
+        "v": [100, 200.0, 300],
+        "s": "ok",
+    }
+    model = DnseEquityHistoricalPriceData
+
+    df = parse_ohlcv_columns(data)
+    rows = model.validate_many(convert_dictlists_to_listdicts(data))
+    models = VfObject(results=rows, provider="dnse", extra={}, raw_data=None)
+    pd.testing.assert_frame_equal(
+        df.sort_index(kind="stable"), models.to_df().sort_index(kind="stable")
+    )
+    # in the order of the API response, as the models
+    assert [d.date() for d in df.index] == [r.date for r in rows]
+    assert df["close"].tolist() == [r.close for r in rows]
+
+    assert parse_ohlcv_columns({"s": "no_data"}).empty
+    with pytest.raises(ValueError):
+        parse_ohlcv_columns({**data, "c": [1.5, None, 3.5]})
+    with pytest.raises(ValueError):
+        parse_ohlcv_columns({**data, "v": [100, 200]})
+    with pytest.raises(ValueError):
+        parse_ohlcv_columns({**data, "v": [100, 200.5, 300]})
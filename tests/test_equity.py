@@ -1,9 +1,23 @@
 """Test all functions in Equity class."""
 
+from io import BytesIO
+
+import httpx
+import pandas as pd
 import pytest
 
 from vietfin import vf
-from .utils import assert_run_success as ars
+from vietfin.providers.ssi.models.equity_fundamental_income import (
+    SsiEquityFundamentalIncomeData,
+)
+from vietfin.providers.ssi.utils.symbol_master import get_organ_code, symbol_master
+from vietfin.utils import bar_store, excel, fundamentals_panel
+from vietfin.utils.errors import EmptyDataError
+from .utils import (
+    assert_run_success as ars,
+    mock_http_transport,
+    statement_workbook,
+)
 
 
 # Test methods of Equity.Price class
@@ -33,6 +47,118 @@ def test_equity_price_historical(
     ars(result, symbol, provider)
 
 
+@pytest.mark.parametrize("provider", ["dnse", "ssi"])
+def test_equity_price_historical_columns_format(monkeypatch, provider):
+    """Test results_format="columns" returns the same data as the data models."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "s": "ok",
+                "t": [1701734400, 1701648000],
+                "o": [20.1, 20.5],
+                "h": [20.8, 20.9],
+                "l": [20.0, 20.3],
+                "c": [20.5, 20.6],
+                "v": [1000, 1200],
+            },
+        )
+
+    mock_http_transport(monkeypatch, handler)
+    params = dict(symbol="SSI", start_date="2023-12-01", end_date="2023-12-10", provider=provider)
+    models = vf.equity.price.historical(**params)
+    columns = vf.equity.price.historical(**params, results_format="columns")
+
+    assert isinstance(columns.results, pd.DataFrame)
+    assert columns.extra["records_count"] == 2
+    pd.testing.assert_frame_equal(columns.to_df(), models.to_df())
+
+
+def test_equity_price_historical_cache_keeps_dtypes(monkeypatch, tmp_path):
+    """Test cache=True returns the same data and dtypes as results_format="columns"."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "t": [1701648000, 1701734400],
+                "o": [20.1, 20.5],
+                "h": [20.8, 20.9],
+                "l": [20.0, 20.3],
+                "c": [20.5, 20.6],
+                "v": [1000, 1200],
+            },
+        )
+
+    mock_http_transport(monkeypatch, handler)
+    monkeypatch.setattr(bar_store, "_store", bar_store.BarStore(tmp_path / "bars.sqlite"))
+    params = dict(symbol="SSI", start_date="2023-12-01", end_date="2023-12-10", provider="dnse")
+    columns = vf.equity.price.historical(**params, results_format="columns")
+    fetched = vf.equity.price.historical(**params, cache=True)
+    stored = vf.equity.price.historical(**params, cache=True)
+
+    assert stored.extra["cache"]["fetched"] == []
+    assert columns.to_df()["volume"].dtype == "int64"
+    pd.testing.assert_frame_equal(fetched.to_df(), columns.to_df())
+    pd.testing.assert_frame_equal(stored.to_df(), columns.to_df())
+
+    with pytest.raises(ValueError):
+        vf.equity.price.historical(**params, cache=True, results_format="models")
+
+
+def test_equity_price_historical_many():
+    """Test equity.price.historical_many() command with valid params."""
+
+    symbols = ["SSI", "VNM", "FPT"]
+    result = vf.equity.price.historical_many(
+        symbols=symbols, start_date="2023-12-01", end_date="2023-12-10"
+    )
+    df = result.to_df()
+
+    assert result.provider == "tcbs"
+    assert result.extra.get("errors") == {}
+    assert sorted(df["symbol"].unique()) == sorted(symbols)
+    assert list(df.columns[:2]) == ["symbol", "date"]
+
+
+def test_equity_price_historical_many_reports_errors(monkeypatch, capsys):
+    """Test equity.price.historical_many() keeps going when some symbols fail."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["symbol"] == "XXX":
+            return httpx.Response(200, json={"t": [], "o": [], "h": [], "l": [], "c": [], "v": []})
+        return httpx.Response(
+            200,
+            json={"t": [1701648000], "o": [20.1], "h": [20.8], "l": [20.0], "c": [20.5], "v": [1000]},
+        )
+
+    mock_http_transport(monkeypatch, handler)
+    result = vf.equity.price.historical_many(
+        symbols=["SSI", "XXX", "VNM"],
+        start_date="2023-12-01",
+        end_date="2023-12-10",
+        provider="dnse",
+    )
+
+    assert result.extra["symbols"] == ["SSI", "VNM"]
+    assert list(result.extra["errors"]) == ["XXX"]
+    assert "EmptyDataError" in result.extra["errors"]["XXX"]
+    assert len(result) == 2
+    # only the summary of the batch is printed
+    assert capsys.readouterr().out.count("Retrieved") == 1
+
+    with pytest.raises(EmptyDataError) as exc_info:
+        vf.equity.price.historical_many(
+            symbols=["XXX"],
+            start_date="2023-12-01",
+            end_date="2023-12-10",
+            provider="dnse",
+        )
+    assert list(exc_info.value.errors) == ["XXX"]
+    assert isinstance(exc_info.value.errors["XXX"], EmptyDataError)
+
+
 @pytest.mark.parametrize(
     "symbol, limit, provider",
     [
@@ -57,6 +183,40 @@ def test_equity_search_with_default_params():
     )  # expected at least 1600 companies
 
 
+def test_equity_search_uses_symbol_master(monkeypatch):
+    """Test equity.search() from SSI downloads the list of organizations once."""
+
+    n_requests = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal n_requests
+        n_requests += 1
+        items = [
+            {"ticker": "VNM", "organName": "Vinamilk", "organShortName": "Vinamilk", "organCode": "VNM"},
+            {"ticker": "SSI", "organName": "SSI Securities", "organShortName": "SSI", "organCode": "SSI"},
+        ]
+        return httpx.Response(200, json={"items": items})
+
+    mock_http_transport(monkeypatch, handler)
+    symbol_master.clear()
+    try:
+        all_tickers = vf.equity.search(provider="ssi")
+        one_ticker = vf.equity.search("vnm", provider="ssi")
+
+        assert len(all_tickers) == 2
+        assert one_ticker.results[0].name == "Vinamilk"
+        assert get_organ_code("ssi") == "SSI"
+        assert n_requests == 1
+        with pytest.raises(ValueError):
+            vf.equity.search("XXX", provider="ssi")
+
+        # altering the raw data does not alter the cached list
+        all_tickers.raw_data["items"][0]["organName"] = "Altered"
+        assert vf.equity.search("vnm", provider="ssi").results[0].name == "Vinamilk"
+    finally:
+        symbol_master.clear()
+
+
 @pytest.mark.parametrize(
     "symbol, provider",
     [
@@ -142,7 +302,179 @@ class TestEquityFundamentalWithDefaultParams:
         ars(result, symbol)
 
 
+@pytest.mark.parametrize("engine", excel.ENGINES)
+def test_equity_fundamental_income_ssi_workbook(monkeypatch, engine):
+    """Test equity.fundamental.income() from SSI parses its workbook as pd.read_excel()."""
+
+    content = statement_workbook(n_items=5, n_periods=4)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "GetListOrganization" in request.url.path:
+            items = [{"ticker": "VNM", "organName": "Vinamilk", "organCode": "VNM"}]
+            return httpx.Response(200, json={"items": items})
+        return httpx.Response(200, content=content)
+
+    mock_http_transport(monkeypatch, handler)
+    monkeypatch.setattr(excel, "engine", engine)
+    symbol_master.clear()
+    try:
+        models = vf.equity.fundamental.income("vnm", provider="ssi")
+        columns = vf.equity.fundamental.income(
+            "vnm", provider="ssi", results_format="columns"
+        )
+    finally:
+        symbol_master.clear()
+
+    # the former parsing, one model per cell of the melted sheet
+    df = pd.read_excel(BytesIO(content), skiprows=7).iloc[:-3]
+    df["period"] = "annual"
+    df = pd.melt(
+        df,
+        id_vars=["ITEMS", "period"],
+        value_vars=["2020", "2021", "2022", "2023"],
+        var_name="fiscal_period",
+        value_name="values",
+    )
+    expected = [SsiEquityFundamentalIncomeData(**r) for r in df.to_dict("records")]
+
+    expected_df = pd.DataFrame([m.model_dump() for m in expected])
+
+    assert len(models.results) == 20
+    # compared as DataFrames, the missing values are NaN
+    pd.testing.assert_frame_equal(
+        pd.DataFrame([m.model_dump() for m in models.results]), expected_df
+    )
+    pd.testing.assert_frame_equal(columns.results, expected_df)
+
+
+def test_equity_fundamental_statements_ssi(monkeypatch):
+    """Test equity.fundamental.statements() from SSI fetches the statements concurrently."""
+
+    content = statement_workbook(n_items=5, n_periods=4)
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if "GetListOrganization" in request.url.path:
+            items = [{"ticker": "VNM", "organName": "Vinamilk", "organCode": "VNM"}]
+            return httpx.Response(200, json={"items": items})
+        if "CashFlow" in request.url.path:
+            return httpx.Response(404)
+        return httpx.Response(200, content=content)
+
+    mock_http_transport(monkeypatch, handler)
+    symbol_master.clear()
+    try:
+        result = vf.equity.fundamental.statements("vnm", provider="ssi")
+    finally:
+        symbol_master.clear()
+
+    # the organization code is looked up once, for the three statements
+    assert sum("GetListOrganization" in path for path in requested) == 1
+    assert len(requested) == 4
+    assert result.extra["statements"] == ["income", "balance"]
+    assert list(result.extra["errors"]) == ["cash"]
+    assert result.results["statement"].value_counts().to_dict() == {
+        "income": 20,
+        "balance": 20,
+    }
+    assert list(result.results.columns) == [
+        "statement",
+        "fiscal_period",
+        "period",
+        "items",
+        "values",
+    ]
+
+
+def test_equity_fundamental_panel_resumes(monkeypatch, tmp_path):
+    """Test equity.fundamental.panel() skips the tickers written by a previous run."""
+
+    content = statement_workbook(n_items=5, n_periods=4)
+    failing = {"FPT"}
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "GetListOrganization" in request.url.path:
+            items = [
+                {"ticker": "VNM", "organName": "Vinamilk", "organShortName": "Vinamilk", "organCode": "VNM"},
+                {"ticker": "FPT", "organName": "FPT Corp", "organShortName": "FPT", "organCode": "FPT"},
+            ]
+            return httpx.Response(200, json={"items": items})
+        organ_code = request.url.params["OrganCode"]
+        requested.append(organ_code)
+        if organ_code in failing:
+            return httpx.Response(404)
+        return httpx.Response(200, content=content)
+
+    mock_http_transport(monkeypatch, handler)
+    statements = ["income", "balance", "cash"]
+    symbol_master.clear()
+    try:
+        # ratios are not implemented for SSI, the build stops before writing anything
+        with pytest.raises(NotImplementedError):
+            vf.equity.fundamental.panel(tmp_path / "ratios", provider="ssi")
+        assert not list((tmp_path / "ratios").glob("part-*"))
+
+        first = vf.equity.fundamental.panel(
+            tmp_path, provider="ssi", datasets=statements, partition_size=1
+        )
+        assert dict(zip(first.results["symbol"], first.results["status"])) == {
+            "VNM": "written",
+            "FPT": "failed",
+        }
+
+        failing.clear()
+        requested.clear()
+        # a ticker unknown to the provider has no data, it is written without rows
+        second = vf.equity.fundamental.panel(
+            tmp_path, symbols=["VNM", "FPT", "XXX"], provider="ssi", datasets=statements
+        )
+        assert dict(zip(second.results["symbol"], second.results["status"])) == {
+            "VNM": "skipped",
+            "FPT": "written",
+            "XXX": "written",
+        }
+        assert "SymbolNotFoundError" in second.results["errors"].iloc[2]["income"]
+        assert set(requested) == {"FPT"}
+
+        with pytest.raises(ValueError):
+            vf.equity.fundamental.panel(
+                tmp_path, period="quarter", provider="ssi", datasets=statements
+            )
+    finally:
+        symbol_master.clear()
+
+    panel = fundamentals_panel.read_panel(tmp_path)
+    assert list(panel.columns) == fundamentals_panel.PANEL_COLUMNS
+    # 2 symbols x 3 statements x 5 items x 4 periods
+    assert len(panel) == 120
+    assert panel.groupby("symbol").size().to_dict() == {"FPT": 60, "VNM": 60}
+    assert panel["fiscal_period"].iloc[0] == "2020"
+
+
 # Test methods in Equity.Ownership class
+def test_equity_ownership_prop_trading_keeps_raw_data(monkeypatch):
+    """Test equity.ownership.prop_trading() returns the raw data as received."""
+    rows = [
+        {"Date": f"0{d}/01/2024", "KLcpMua": 100 * d, "Symbol": "VNM"}
+        for d in range(2, 5)
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # a single page of records, then an empty page
+        page = rows if request.url.params["PageIndex"] == "1" else []
+        return httpx.Response(200, json={"Data": {"Data": {"ListDataTudoanh": page}}})
+
+    mock_http_transport(monkeypatch, handler)
+    first = vf.equity.ownership.prop_trading("vnm", provider="cafef")
+    second = vf.equity.ownership.prop_trading("vnm", provider="cafef")
+
+    assert first.raw_data[0]["Data"]["Data"]["ListDataTudoanh"] == rows
+    assert second.results == first.results
+    assert first.results[0].date.isoformat() == "2024-01-02"
+
+
 @pytest.mark.parametrize(
     "symbol",
     [
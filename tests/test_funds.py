@@ -1,10 +1,15 @@
 """Test all functions in Funds class."""
 
+import json
+
+import httpx
 import pandas as pd
 import pytest
 
 from vietfin import vf
-from .utils import assert_run_success as ars
+from vietfin.providers.fmarket.utils import helpers
+from vietfin.providers.fmarket.utils.helpers import fund_directory, get_fund_id
+from .utils import assert_run_success as ars, mock_http_transport
 
 
 def test_search_with_default_params():
@@ -48,3 +53,55 @@ class TestFunds:
         """Test holdings() method in Funds class with valid params."""
         result = vf.funds.holdings(symbol=symbol, provider=provider)
         ars(result, symbol, provider)
+
+
+def test_get_fund_id_uses_fund_directory(monkeypatch):
+    """Test the fund directory is loaded once, page by page, and resolves FundIDs."""
+
+    requested_pages = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        requested_pages.append(payload["page"])
+        rows = {
+            1: [{"id": 11, "shortName": "SSISCA"}, {"id": 12, "shortName": "VESAF"}],
+            2: [{"id": 13, "shortName": "DCDS"}],
+        }[payload["page"]]
+        return httpx.Response(200, json={"data": {"total": 3, "rows": rows}})
+
+    mock_http_transport(monkeypatch, handler)
+    monkeypatch.setattr(helpers, "_directory_failed_at", None)
+    fund_directory.clear()
+    try:
+        assert get_fund_id("ssisca") == 11
+        assert get_fund_id("DCDS") == 13
+        assert requested_pages == [1, 2]
+    finally:
+        fund_directory.clear()
+
+
+def test_get_fund_id_falls_back_to_search(monkeypatch):
+    """Test a fund is searched with the API if the fund directory fails to load."""
+
+    search_fields = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        search_fields.append(payload["searchField"])
+        if payload["searchField"] == "":
+            return httpx.Response(500, json={"message": "Internal Server Error"})
+        return httpx.Response(200, json={"data": {"total": 1, "rows": [{"id": 23}]}})
+
+    mock_http_transport(monkeypatch, handler)
+    monkeypatch.setattr(helpers, "_directory_failed_at", None)
+    fund_directory.clear()
+    try:
+        assert get_fund_id("DCDS") == 23
+        directory_requests = search_fields.count("")
+        assert directory_requests > 0
+        # the failed directory is not reloaded on the next lookup
+        assert get_fund_id("VESAF") == 23
+        assert search_fields.count("") == directory_requests
+        assert [f for f in search_fields if f] == ["DCDS", "VESAF"]
+    finally:
+        fund_directory.clear()
@@ -0,0 +1,56 @@
+"""Test the lazy loading of the vietfin package."""
+
+import json
+import subprocess
+import sys
+
+
+def loaded_modules(statement: str) -> list[str]:
+    """Run the statement in a fresh interpreter, return the names of the loaded modules."""
+    code = f"import json, sys; {statement}; print(json.dumps(list(sys.modules)))"
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_vf_is_lazy():
+    """`from vietfin import vf` imports no component, no provider, no pandas and no httpx.
+
+    Keeps the import within its time budget, see `benchmarks/import_time.py`.
+    """
+    modules = loaded_modules("from vietfin import vf")
+
+    assert "pandas" not in modules
+    assert "httpx" not in modules
+    assert not [m for m in modules if m.startswith("vietfin.components")]
+    assert not [m for m in modules if m.startswith("vietfin.providers")]
+
+
+def test_only_selected_provider_is_imported():
+    """Selecting a provider imports its module only."""
+    modules = loaded_modules(
+        "from vietfin import vf; vf.equity.price._get_provider('tcbs')"
+    )
+    provider_modules = {m for m in modules if m.endswith(".provider")}
+
+    assert provider_modules == {"vietfin.providers.tcbs.provider"}
+
+
+def test_commands_load_without_pandas():
+    """The groups of commands and the providers do not import pandas, NumPy or sqlite3,
+    only the commands using them do."""
+    modules = loaded_modules(
+        "from vietfin import vf; from vietfin.abstract import registry; "
+        "[getattr(vf, g) for g in ('equity', 'funds', 'etf', 'index', 'derivatives', 'news', 'aio')]; "
+        "[registry.get_provider(c, p) for c in registry.COMPONENTS for p in registry.list_providers(c)]"
+    )
+
+    assert not {"pandas", "numpy", "sqlite3"} & set(modules)
+
+
+def test_package_namespace():
+    """The component classes are still exposed in the package namespace."""
+    from vietfin import Equity, VietFin, vf
+
+    assert isinstance(vf, VietFin)
+    assert isinstance(vf.equity, Equity)
+    assert vf.equity is vf.equity
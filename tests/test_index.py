@@ -1,9 +1,12 @@
 """Test all functions in Index class."""
 
+from datetime import datetime, timedelta
+
+import httpx
 import pytest
 
 from vietfin import vf
-from .utils import assert_run_success as ars
+from .utils import assert_run_success as ars, mock_http_transport
 
 
 def test_index_search_with_default_params():
@@ -31,3 +34,34 @@ class TestIndex:
         """Test index.price.historical() command with default params."""
         result = vf.index.price.historical(symbol)
         ars(result, symbol)
+
+
+def test_index_price_historical_merges_chunks(monkeypatch):
+    """Test index.price.historical() merges the concurrent yearly chunks in order."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # each chunk returns its last 370 days, so consecutive chunks overlap
+        end = datetime.fromtimestamp(int(request.url.params["to"]))
+        rows = [
+            {
+                "tradingDate": (end - timedelta(days=n)).strftime("%Y-%m-%dT00:00:00.000Z"),
+                "open": 1000.0,
+                "high": 1010.0,
+                "low": 990.0,
+                "close": 1005.0,
+                "volume": 100,
+            }
+            for n in range(370)
+        ]
+        return httpx.Response(200, json={"data": rows[::-1]})
+
+    mock_http_transport(monkeypatch, handler)
+    result = vf.index.price.historical(
+        "vnindex", start_date="2020-01-01", end_date="2023-12-31"
+    )
+    dates = [item.date for item in result.results]
+
+    assert len(result.extra["api_url"]) == 4
+    assert dates == sorted(set(dates))
+    assert dates[0].isoformat() == "2020-01-01"
+    assert dates[-1].isoformat() == "2023-12-31"
@@ -0,0 +1,86 @@
+"""Test the provider registry."""
+
+import importlib.metadata
+
+import pytest
+
+from vietfin.abstract import registry
+from vietfin.abstract import factory
+
+
+class EquityPriceDummy:
+    """Third-party provider of the equity_price component."""
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    """Register the providers of a test in a copy of the registry."""
+    monkeypatch.setattr(
+        registry, "_implementations", dict(registry._implementations)
+    )
+    monkeypatch.setattr(registry, "_instances", {})
+    monkeypatch.setattr(registry, "_entry_points_loaded", False)
+
+
+def test_get_provider_reuses_instance():
+    """A provider is instantiated once, then the same instance is returned."""
+    instance = registry.get_provider("equity_price", "TCBS")
+
+    assert type(instance).__name__ == "EquityPriceTcbs"
+    assert registry.get_provider("equity_price", "tcbs") is instance
+
+
+def test_factory_classes_are_deprecated():
+    """The former Factory classes select the providers in the registry, and warn."""
+    registry.register_provider("equity_price", "dummy", EquityPriceDummy)
+
+    with pytest.warns(DeprecationWarning, match="registry.get_provider"):
+        price_factory = factory.EquityPriceFactory()
+
+    assert isinstance(price_factory, factory.ProviderFactory)
+    assert price_factory.get_provider("tcbs") is registry.get_provider(
+        "equity_price", "tcbs"
+    )
+    assert "dummy" in price_factory.providers_implementations
+    assert factory.EtfFactory is factory.EtfFactory
+    with pytest.raises(AttributeError):
+        factory.UnknownFactory
+
+
+def test_register_provider():
+    """A provider registered at runtime is selected by its name, and can be replaced."""
+    registry.register_provider("equity_price", "dummy", EquityPriceDummy)
+    instance = registry.get_provider("equity_price", "dummy")
+
+    assert isinstance(instance, EquityPriceDummy)
+    assert "dummy" in registry.list_providers("equity_price")
+
+    registry.register_provider(
+        "equity_price", "dummy", f"{__name__}:EquityPriceDummy"
+    )
+    assert registry.get_provider("equity_price", "dummy") is not instance
+
+    with pytest.raises(ValueError):
+        registry.register_provider("unknown", "dummy", EquityPriceDummy)
+    with pytest.raises(ValueError):
+        registry.register_provider("equity_price", "dummy", "no_class_path")
+
+
+def test_entry_point_provider(monkeypatch):
+    """A provider declared in the "vietfin.providers" entry points group is loaded on first use."""
+    entry_point = importlib.metadata.EntryPoint(
+        name="equity_price.dummy",
+        value=f"{__name__}:EquityPriceDummy",
+        group=registry.ENTRY_POINT_GROUP,
+    )
+    monkeypatch.setattr(
+        importlib.metadata,
+        "entry_points",
+        lambda group: [entry_point] if group == registry.ENTRY_POINT_GROUP else [],
+    )
+
+    assert isinstance(
+        registry.get_provider("equity_price", "dummy"), EquityPriceDummy
+    )
+    with pytest.raises(NotImplementedError):
+        registry.get_provider("equity_price", "unknown")
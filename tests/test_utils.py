@@ -0,0 +1,1031 @@
+"""Test the utility modules in vietfin.utils package."""
+
+import asyncio
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any
+
+import httpx
+import pandas as pd
+import pytest
+from pydantic import model_validator
+
+from vietfin.abstract.data import Data
+from vietfin.abstract.vfobject import VfObject
+from vietfin.providers.tcbs.models.equity_price_historical import (
+    TcbsEquityHistoricalPriceData,
+)
+from vietfin.utils import (
+    bar_store,
+    cache,
+    column_table,
+    concurrency,
+    fundamentals_panel,
+    http,
+    jsonlib,
+    pagination,
+    ratelimit,
+    raw_data,
+    response_cache,
+    singleflight,
+)
+from vietfin.utils.errors import EmptyDataError
+
+from .utils import mock_http_transport
+
+
+# Test the HTTP session layer
+class TestHttpSession:
+    """Test the pooled HTTP clients of vietfin.utils.http module."""
+
+    def teardown_method(self):
+        """Restore the default settings after each test."""
+        http.configure(**http.HttpConfig().model_dump())
+
+    def test_one_client_per_host(self):
+        """Requests to the same host share one client, other hosts get their own."""
+        client_1 = http.get_client("https://apipubaws.tcbs.com.vn/stock-insight/a")
+        client_2 = http.get_client("https://apipubaws.tcbs.com.vn/tcanalysis/b")
+        client_3 = http.get_client("https://iboard.ssi.com.vn/dchart/api/history")
+
+        assert client_1 is client_2
+        assert client_1 is not client_3
+
+    def test_configure_resets_clients(self):
+        """Updating the settings closes the clients opened with the old settings."""
+        old_client = http.get_client("https://s.cafef.vn/Ajax")
+        config = http.configure(max_connections=5)
+        new_client = http.get_client("https://s.cafef.vn/Ajax")
+
+        assert config.max_connections == 5
+        assert old_client.is_closed
+        assert new_client is not old_client
+
+    def test_configure_rejects_unknown_values(self):
+        """Invalid settings are rejected by validation."""
+        with pytest.raises(ValueError):
+            http.configure(max_connections="many")
+
+
+class TestRetry:
+    """Test the retry policy of vietfin.utils.http module against a mock transport."""
+
+    URL = "https://apipubaws.tcbs.com.vn/stock-insight/v1/test"
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        """Record the retry delays instead of sleeping."""
+        self.delays = []
+        monkeypatch.setattr(http.time, "sleep", self.delays.append)
+        yield
+        http.configure_retry(**http.RetryPolicy().model_dump())
+
+    def mock_statuses(self, monkeypatch, statuses: list[int], headers=None):
+        """Answer the requests with the given status codes, then 200."""
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            n = len(self.requests) - 1
+            status = statuses[n] if n < len(statuses) else 200
+            return httpx.Response(status, json={"page": n}, headers=headers)
+
+        mock_http_transport(monkeypatch, handler)
+
+    def test_get_is_retried_on_server_error(self, monkeypatch):
+        """GET requests are retried on 5xx until they succeed, with exponential backoff."""
+        http.configure_retry(jitter=False, backoff_factor=1)
+        self.mock_statuses(monkeypatch, [502, 503])
+        response = http.get(self.URL)
+
+        assert response.status_code == 200
+        assert len(self.requests) == 3
+        assert self.delays == [1, 2]
+
+    def test_last_response_is_returned(self, monkeypatch):
+        """After max_attempts, the last failed response is returned."""
+        self.mock_statuses(monkeypatch, [500] * 5)
+        response = http.get(self.URL)
+
+        assert response.status_code == 500
+        assert len(self.requests) == http.get_retry_policy().max_attempts
+
+    def test_post_is_not_retried_by_default(self, monkeypatch):
+        """Non-idempotent methods are only retried when opted in."""
+        self.mock_statuses(monkeypatch, [503])
+        assert http.post(self.URL).status_code == 503
+
+        self.mock_statuses(monkeypatch, [503])
+        assert http.post(self.URL, retry=True).status_code == 200
+
+    def test_client_error_is_not_retried(self, monkeypatch):
+        self.mock_statuses(monkeypatch, [404])
+
+        assert http.get(self.URL).status_code == 404
+        assert len(self.requests) == 1
+
+    def test_retry_after_is_honored(self, monkeypatch):
+        """The delay of the Retry-After header, capped by max_backoff, overrides a shorter backoff."""
+        http.configure_retry(max_backoff=10)
+        self.mock_statuses(monkeypatch, [429, 429], headers={"Retry-After": "7"})
+        http.get(self.URL)
+
+        assert self.delays == [7, 7]
+
+    def test_transport_error_is_retried(self, monkeypatch):
+        """Transport errors are retried, and raised after the last attempt."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        mock_http_transport(monkeypatch, handler)
+        with pytest.raises(httpx.ConnectError):
+            http.get(self.URL)
+        assert len(attempts) == http.get_retry_policy().max_attempts
+
+    def test_async_get_is_retried(self, monkeypatch):
+        async def no_sleep(delay):
+            self.delays.append(delay)
+
+        monkeypatch.setattr(http.asyncio, "sleep", no_sleep)
+        self.mock_statuses(monkeypatch, [503])
+
+        async def main():
+            response = await http.aget(self.URL)
+            await http.aclose()
+            return response
+
+        assert asyncio.run(main()).status_code == 200
+        assert len(self.requests) == 2
+
+    def test_async_clients_are_kept_per_event_loop(self, monkeypatch):
+        """A loop reuses its own client, and does not replace the client of another loop."""
+        mock_http_transport(monkeypatch, lambda request: httpx.Response(200, json={}))
+
+        async def get_client():
+            return http.get_async_client(self.URL)
+
+        loop = asyncio.new_event_loop()
+        try:
+            client = loop.run_until_complete(get_client())
+            assert loop.run_until_complete(get_client()) is client
+
+            other = asyncio.run(get_client())
+            assert other is not client
+            assert loop.run_until_complete(get_client()) is client
+            assert not client.is_closed
+
+            loop.run_until_complete(http.aclose())
+            assert client.is_closed
+            assert loop not in http._async_clients
+        finally:
+            loop.close()
+
+    def test_pagination_resumes_from_failed_page(self, monkeypatch):
+        """A failed page is retried on its own, the pages already fetched are not requested again."""
+        self.mock_statuses(monkeypatch, [200, 200, 502])
+
+        def fetch_page(page: int):
+            response = http.get(self.URL, params={"page": page})
+            return str(response.url), {"data": [page] if page < 3 else []}
+
+        _, _, rows = pagination.fetch_pages(
+            fetch_page, lambda d: d["data"], page_size=1, window=1
+        )
+
+        assert rows == [0, 1, 2]
+        pages = [r.url.params["page"] for r in self.requests]
+        assert pages == ["0", "1", "2", "2", "3"]
+
+
+class TestRateLimit:
+    """Test the per-host rate limiter of vietfin.utils.ratelimit module."""
+
+    HOST = "apipubaws.tcbs.com.vn"
+    URL = f"https://{HOST}/stock-insight/v1/test"
+
+    @pytest.fixture(autouse=True)
+    def isolated_limits(self, monkeypatch):
+        monkeypatch.setattr(ratelimit, "_host_limits", ratelimit.get_host_limits())
+        monkeypatch.setattr(ratelimit, "_limiters", {})
+
+    def test_token_bucket_delays(self):
+        """After the burst, the reservations are spaced by 1/rate."""
+        bucket = ratelimit.TokenBucket(rate=10, burst=2)
+        delays = [bucket.reserve() for _ in range(4)]
+
+        assert delays[:2] == [0, 0]
+        assert delays[2:] == pytest.approx([0.1, 0.2], abs=0.01)
+
+    def test_max_concurrency_is_shared_by_threads(self, monkeypatch):
+        """The requests in flight to a host never exceed its max_concurrency."""
+        ratelimit.set_host_limit(self.HOST, rate=1000, burst=100, max_concurrency=2)
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+
+        def handler(request):
+            with lock:
+                in_flight.append(1)
+                max_in_flight.append(len(in_flight))
+            time.sleep(0.02)
+            with lock:
+                in_flight.pop()
+            return httpx.Response(200, json={})
+
+        mock_http_transport(monkeypatch, handler)
+        results, errors = concurrency.run_concurrently(
+            lambda i: http.get(self.URL, params={"i": i}), range(8)
+        )
+
+        assert len(results) == 8 and not errors
+        assert max(max_in_flight) == 2
+        metrics = ratelimit.get_metrics()[self.HOST]
+        assert metrics["requests"] == 8
+        assert metrics["wait_time"] > 0
+
+    def test_slots_are_shared_by_async_tasks(self):
+        """Coroutines wait for a free slot without blocking the event loop."""
+        slots = ratelimit.SlotPool(2)
+        in_flight = []
+        max_in_flight = []
+
+        async def task():
+            await slots.aacquire()
+            in_flight.append(1)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+            slots.release()
+
+        async def main():
+            await asyncio.gather(*[task() for _ in range(6)])
+
+        asyncio.run(main())
+        assert len(max_in_flight) == 6
+        assert max(max_in_flight) == 2
+
+    def test_unlimited_host(self, monkeypatch):
+        """Hosts without limits, and disabled limits, are not limited."""
+        assert ratelimit.get_limiter("https://example.com/api") is None
+
+        ratelimit.remove_host_limit(self.URL)
+        assert ratelimit.get_limiter(self.URL) is None
+
+        ratelimit.set_host_limit(self.HOST, rate=1)
+        monkeypatch.setattr(ratelimit, "_enabled", False)
+        assert ratelimit.get_limiter(self.URL) is None
+
+
+# Test the concurrency helpers
+def test_run_concurrently_collects_results_and_errors():
+    """Errors of some items do not stop the other items."""
+
+    def func(x: int) -> int:
+        if x % 2:
+            raise ValueError(f"odd {x}")
+        return x * 10
+
+    results, errors = concurrency.run_concurrently(
+        func, [1, 2, 3, 4, 4], max_workers=3
+    )
+
+    assert results == {2: 20, 4: 40}
+    assert list(errors) == [1, 3]
+    assert isinstance(errors[1], ValueError)
+
+
+def test_map_concurrently_copies_context():
+    """Every call sees the context variables of the caller, e.g. its raw data policy."""
+    with raw_data.raw_data_policy("none"):
+        policies = concurrency.map_concurrently(
+            lambda _: raw_data.get_raw_data_policy(), range(4), max_workers=4
+        )
+
+    assert policies == ["none"] * 4
+
+
+# Test the paginator of page-indexed endpoints
+class TestPagination:
+    """Test vietfin.utils.pagination module against a fake endpoint of 250 records."""
+
+    N_RECORDS = 250
+
+    def setup_method(self):
+        self.requested_pages = []
+
+    def fetch_page(self, page: int, page_size: int = 100, total: bool = False):
+        self.requested_pages.append(page)
+        rows = list(range(self.N_RECORDS))[page * page_size : (page + 1) * page_size]
+        data_chunk = {"data": rows}
+        if total:
+            data_chunk["total"] = self.N_RECORDS
+        return f"page={page}", data_chunk
+
+    @staticmethod
+    def get_rows(data_chunk: dict) -> list:
+        return data_chunk["data"]
+
+    def test_fetch_all_pages_in_order(self):
+        """Speculative windows return the same ordered records as a sequential loop."""
+        url_list, data, rows = pagination.fetch_pages(
+            self.fetch_page, self.get_rows, limit=0, page_size=100, window=2
+        )
+
+        assert rows == list(range(self.N_RECORDS))
+        assert url_list == ["page=0", "page=1", "page=2"]
+        assert len(data) == 3
+
+    def test_fetch_pages_stops_at_limit(self):
+        """Only the pages needed to reach the limit are requested."""
+        _, _, rows = pagination.fetch_pages(
+            self.fetch_page, self.get_rows, limit=150, page_size=100
+        )
+
+        assert rows == list(range(150))
+        assert sorted(self.requested_pages) == [0, 1]
+
+    def test_fetch_pages_uses_total(self):
+        """The total revealed by the 1st page avoids requesting empty pages."""
+        _, _, rows = pagination.fetch_pages(
+            lambda page: self.fetch_page(page, total=True),
+            self.get_rows,
+            page_size=100,
+            total_key="total",
+        )
+
+        assert len(rows) == self.N_RECORDS
+        assert sorted(self.requested_pages) == [0, 1, 2]
+
+    def test_afetch_pages(self):
+        """The async paginator returns the same records as the sync one."""
+
+        async def fetch_page(page: int):
+            return self.fetch_page(page)
+
+        _, _, rows = asyncio.run(
+            pagination.afetch_pages(fetch_page, self.get_rows, page_size=100, window=3)
+        )
+
+        assert rows == list(range(self.N_RECORDS))
+
+
+    def test_iter_pages_stops_on_break(self):
+        """No more pages are requested once the consumer stops the iteration."""
+        pages = pagination.iter_pages(
+            lambda page: self.fetch_page(page, page_size=10),
+            self.get_rows,
+            page_size=10,
+            window=2,
+        )
+        for _, _, rows in pages:
+            if rows[0] >= 10:
+                break
+        pages.close()
+
+        # 25 pages, but no more than the 1st window of 2 pages fetched ahead
+        assert max(self.requested_pages) <= 2
+
+    def test_iter_futures_quote_yields_each_page(self, monkeypatch):
+        """The cursor-paginated SSI futures quote is streamed as one batch of models per page."""
+        from vietfin.providers.ssi.utils.derivatives_futures_quote import iter_quote
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            last_id = int(request.url.params.get("lastId", "0")[6:] or 0)
+            items = [
+                {
+                    "_id": f"093000{last_id + i}",
+                    "time": "09:30:00",
+                    "vol": 1,
+                    "price": 1300.0,
+                    "priceChange": 0,
+                    "priceChangePercent": 0,
+                    "ref": 1300.0,
+                    "side": "bu",
+                    "stockSymbol": "VN30F2412",
+                }
+                for i in range(1, 51)
+            ]
+            return httpx.Response(200, json={"data": {"items": items}})
+
+        mock_http_transport(monkeypatch, handler)
+        batches = iter_quote("VN30F2412", limit=120)
+
+        first = next(batches)
+        assert len(first) == 50
+        assert len(requests) == 1  # the next page is only fetched on demand
+        assert [len(batch) for batch in batches] == [50, 20]
+        assert requests[-1].url.params["lastId"] == "093000100"
+
+
+# Test the local store of daily bars
+class TestBarStore:
+    """Test vietfin.utils.bar_store module with a fake provider."""
+
+    @pytest.fixture(autouse=True)
+    def store(self, monkeypatch, tmp_path):
+        store = bar_store.BarStore(tmp_path / "bars.sqlite")
+        monkeypatch.setattr(bar_store, "_store", store)
+        self.fetched = []
+        return store
+
+    def fetch(self, start_date: str, end_date: str) -> VfObject:
+        """Return one bar per day of the date range."""
+        self.fetched.append((start_date, end_date))
+        start = date.fromisoformat(start_date)
+        n_days = (date.fromisoformat(end_date) - start).days + 1
+        bars = [
+            TcbsEquityHistoricalPriceData(
+                date=start + timedelta(days=n),
+                open=10.0,
+                high=11.0,
+                low=9.0,
+                close=10.5,
+                volume=100,
+            )
+            for n in range(n_days)
+        ]
+        return VfObject(results=bars, provider="tcbs", extra={}, raw_data=None)
+
+    def load(self, start_date: str, end_date: str) -> VfObject:
+        return bar_store.cached_historical(
+            self.fetch, "tcbs", "equity", "vnm", start_date, end_date
+        )
+
+    def test_fetch_only_missing_head_and_tail(self):
+        """Bars already stored are not fetched again."""
+        first = self.load("2023-01-10", "2023-01-20")
+        second = self.load("2023-01-05", "2023-01-25")
+        third = self.load("2023-01-12", "2023-01-18")
+
+        assert len(first) == 11
+        assert len(second) == 21
+        assert len(third) == 7
+        assert self.fetched == [
+            ("2023-01-10", "2023-01-20"),
+            ("2023-01-05", "2023-01-10"),
+            ("2023-01-20", "2023-01-25"),
+        ]
+        assert list(second.to_df().columns) == ["open", "high", "low", "close", "volume"]
+
+    def test_today_is_fetched_again(self):
+        """The bar of the current day is not final, so it is refreshed on the next call."""
+        today = date.today()
+        start = (today - timedelta(days=5)).isoformat()
+        self.load(start, today.isoformat())
+        self.load(start, today.isoformat())
+
+        assert self.fetched[-1] == (
+            (today - timedelta(days=1)).isoformat(),
+            today.isoformat(),
+        )
+
+    def test_today_only_is_not_marked_as_fetched(self, store):
+        """A date range of only the current day does not extend the coverage."""
+        today = date.today().isoformat()
+        self.load(today, today)
+
+        assert store.coverage(bar_store.BarKey("tcbs", "equity", "VNM", "1d")) is None
+
+    def test_range_without_data_is_fetched_again(self, store):
+        """A range without data is not marked as fetched, e.g. after a temporary failure."""
+
+        def fetch(start_date: str, end_date: str) -> VfObject:
+            self.fetched.append((start_date, end_date))
+            raise EmptyDataError("No data found.")
+
+        for _ in range(2):
+            with pytest.raises(EmptyDataError):
+                bar_store.cached_historical(
+                    fetch, "tcbs", "equity", "VNM", "2023-01-10", "2023-01-20"
+                )
+
+        assert len(self.fetched) == 2
+        assert store.coverage(bar_store.BarKey("tcbs", "equity", "VNM", "1d")) is None
+
+    def test_nullable_volumes_are_stored(self, store):
+        """Missing values of nullable columns are stored as NULL."""
+        key = bar_store.BarKey("tcbs", "equity", "VNM", "1d")
+        bars = pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2023-01-10", "2023-01-11"]),
+                "open": [10.0, 10.5],
+                "high": [11.0, 11.5],
+                "low": [9.0, 9.5],
+                "close": [10.5, float("nan")],
+                "volume": pd.array([100, None], dtype="Int64"),
+            }
+        )
+        store.write(key, bars, date(2023, 1, 10), date(2023, 1, 11))
+
+        df = store.read(key, date(2023, 1, 10), date(2023, 1, 11))
+        assert df["volume"].dtype == "Int64"
+        assert df["volume"].tolist()[0] == 100
+        assert df["volume"].isna().tolist() == [False, True]
+        assert df["close"].isna().tolist() == [False, True]
+
+    def test_invalidate(self, store):
+        """Invalidated bars are fetched again."""
+        self.load("2023-01-10", "2023-01-20")
+        assert bar_store.invalidate(symbol="VNM") == 11
+        assert store.coverage(bar_store.BarKey("tcbs", "equity", "VNM", "1d")) is None
+
+        self.load("2023-01-10", "2023-01-20")
+        assert len(self.fetched) == 2
+
+    def test_only_daily_bars_are_cached(self):
+        """Intraday intervals are rejected by the cache."""
+        with pytest.raises(ValueError):
+            bar_store.cached_historical(
+                self.fetch, "dnse", "equity", "VNM", "2023-01-10", "2023-01-20", "1h"
+            )
+
+
+# Test the process-wide caches of reference data
+class TestTTLCache:
+    """Test vietfin.utils.cache module."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("VIETFIN_CACHE_DIR", str(tmp_path))
+        yield tmp_path
+        cache.set_disk_persistence(False)
+
+    def setup_method(self):
+        self.n_loads = 0
+
+    def loader(self) -> dict:
+        self.n_loads += 1
+        return {"items": [{"ticker": "vnm"}]}
+
+    def test_value_is_loaded_once_until_expired(self, monkeypatch):
+        """The value is reused within its ttl, then reloaded."""
+        ttl_cache = cache.TTLCache("test", self.loader, ttl=60, parse=lambda raw: raw["items"])
+
+        assert ttl_cache.get() == [{"ticker": "vnm"}]
+        assert ttl_cache.get() is ttl_cache.get()
+        assert self.n_loads == 1
+
+        now = time.time()
+        monkeypatch.setattr(cache.time, "time", lambda: now + 61)
+        ttl_cache.get()
+        assert self.n_loads == 2
+
+    def test_value_is_persisted_to_disk(self, cache_dir):
+        """With disk persistence, a new process reads the value from disk."""
+        cache.set_disk_persistence(True)
+        cache.TTLCache("test", self.loader, ttl=60).get()
+        # a new cache object plays the role of the next run of the program
+        value = cache.TTLCache("test", self.loader, ttl=60).get()
+
+        assert (cache_dir / "test.json").exists()
+        assert value == {"items": [{"ticker": "vnm"}]}
+        assert self.n_loads == 1
+
+
+# Test the cache of the HTTP responses
+class TestResponseCache:
+    """Test vietfin.utils.response_cache module against a mock transport."""
+
+    PROFILE_URL = "https://apipubaws.tcbs.com.vn/tcanalysis/v1/ticker/VNM/overview"
+    BARS_URL = "https://apipubaws.tcbs.com.vn/stock-insight/v2/stock/bars-long-term"
+
+    @pytest.fixture(autouse=True)
+    def mock_server(self, monkeypatch, tmp_path):
+        """Answer with a counter of requests, and an ETag, unless the ETag matches."""
+        monkeypatch.setenv("VIETFIN_CACHE_DIR", str(tmp_path))
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(
+                200, json={"n": len(self.requests)}, headers={"ETag": '"v1"'}
+            )
+
+        mock_http_transport(monkeypatch, handler)
+        yield
+        cache.set_disk_persistence(False)
+
+    def test_classify(self):
+        assert response_cache.classify(self.PROFILE_URL) == "daily"
+        assert (
+            response_cache.classify(
+                "https://wifeed.vn/api/thong-tin-co-phieu/danh-sach-ma-chung-khoan"
+            )
+            == "static"
+        )
+        # cached by the SSI symbol master instead
+        assert (
+            response_cache.classify(
+                "https://fiin-core.ssi.com.vn/Master/GetListOrganization?language=vi"
+            )
+            is None
+        )
+        assert response_cache.classify(self.BARS_URL) is None
+
+    def test_response_is_cached(self):
+        """A cached endpoint is requested once, other endpoints every time."""
+        assert http.get(self.PROFILE_URL).json() == {"n": 1}
+        assert http.get(self.PROFILE_URL).json() == {"n": 1}
+        assert http.get(self.PROFILE_URL, params={"a": 1}).json() == {"n": 2}
+
+        http.get(self.BARS_URL)
+        http.get(self.BARS_URL)
+        assert len(self.requests) == 4
+
+    def test_key_includes_content_headers(self):
+        """A response is cached per value of the headers changing its content."""
+        http.get(self.PROFILE_URL, headers={"Accept-Language": "vi"})
+        http.get(self.PROFILE_URL, headers={"accept-language": "vi"})
+        http.get(self.PROFILE_URL, headers={"Accept-Language": "en"})
+        http.get(self.PROFILE_URL, headers={"Accept-Language": "vi", "Referer": "a"})
+
+        assert len(self.requests) == 2
+
+    def test_expired_response_is_renewed_by_conditional_request(self, monkeypatch):
+        """An expired response with an ETag is renewed by a 304 Not Modified answer."""
+        http.get(self.PROFILE_URL)
+        now = time.time()
+        ttl = response_cache.ENDPOINT_TTLS["daily"]
+        monkeypatch.setattr(response_cache.time, "time", lambda: now + ttl + 1)
+        response = http.get(self.PROFILE_URL)
+
+        assert len(self.requests) == 2
+        assert self.requests[1].headers["If-None-Match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.json() == {"n": 1}
+        # the renewed response is fresh again
+        http.get(self.PROFILE_URL)
+        assert len(self.requests) == 2
+
+    def test_response_is_persisted_to_disk(self, monkeypatch):
+        """With disk persistence, the responses survive the memory store."""
+        cache.set_disk_persistence(True)
+        http.get(self.PROFILE_URL)
+        monkeypatch.setattr(response_cache, "_memory", response_cache.MemoryStore())
+
+        assert http.get(self.PROFILE_URL).json() == {"n": 1}
+        assert len(self.requests) == 1
+
+    def test_response_store_is_abstract(self):
+        with pytest.raises(TypeError):
+            response_cache.ResponseStore()  # type: ignore[abstract]
+
+    def test_memory_store_is_lru(self):
+        store = response_cache.MemoryStore(max_entries=2)
+        entry = response_cache.CachedResponse(200, {}, b"", "daily", time.time())
+        store.set("a", entry)
+        store.set("b", entry)
+        store.get("a")
+        store.set("c", entry)
+
+        assert store.get("b") is None
+        assert store.get("a") is entry
+
+    def test_disabled_cache(self):
+        response_cache.configure(enabled=False)
+        try:
+            http.get(self.PROFILE_URL)
+            http.get(self.PROFILE_URL)
+        finally:
+            response_cache.configure(enabled=True)
+        assert len(self.requests) == 2
+
+
+# Test the coalescing of identical concurrent calls
+class TestSingleFlight:
+    """Test vietfin.utils.singleflight module."""
+
+    N_CALLERS = 5
+
+    def setup_method(self):
+        self.n_calls = 0
+        self.release = threading.Event()
+
+    def slow_call(self):
+        self.n_calls += 1
+        self.release.wait(timeout=5)
+        return {"n_calls": self.n_calls}
+
+    def run_threads(self, target) -> list:
+        """Run target in N_CALLERS threads, release the calls when all callers are waiting."""
+        results = []
+
+        def call():
+            results.append(target())
+
+        threads = [threading.Thread(target=call) for _ in range(self.N_CALLERS)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_calls_share_one_call(self):
+        group = singleflight.SingleFlight()
+        results = self.run_threads(lambda: group.do("key", self.slow_call))
+
+        assert self.n_calls == 1
+        assert all(r is results[0] for r in results)
+        assert group.in_flight() == 0
+
+        # the next call after the call returned runs again
+        group.do("key", self.slow_call)
+        assert self.n_calls == 2
+
+    def test_error_is_shared(self):
+        group = singleflight.SingleFlight()
+
+        def failing_call():
+            self.slow_call()
+            raise ValueError("boom")
+
+        def call():
+            try:
+                return group.do("key", failing_call)
+            except ValueError as ex:
+                return ex
+
+        errors = self.run_threads(call)
+        assert self.n_calls == 1
+        assert all(isinstance(e, ValueError) for e in errors)
+
+    def test_async_calls_share_one_call(self):
+        @singleflight.coalesced
+        async def fetch(symbol: str):
+            self.n_calls += 1
+            await asyncio.sleep(0.01)
+            return symbol
+
+        async def main():
+            return await asyncio.gather(
+                *[fetch("VN30") for _ in range(self.N_CALLERS)], fetch("VN100")
+            )
+
+        results = asyncio.run(main())
+        assert results == ["VN30"] * self.N_CALLERS + ["VN100"]
+        assert self.n_calls == 2
+
+    def test_identical_get_requests_share_one_request(self, monkeypatch):
+        """Concurrent identical GET requests of the HTTP session layer send a single request."""
+
+        def handler(request):
+            self.slow_call()
+            return httpx.Response(200, json={"n": self.n_calls})
+
+        mock_http_transport(monkeypatch, handler)
+        url = "https://apipubaws.tcbs.com.vn/stock-insight/v1/test"
+        responses = self.run_threads(lambda: http.get(url, params={"page": 0}))
+
+        assert self.n_calls == 1
+        assert [r.json() for r in responses] == [{"n": 1}] * self.N_CALLERS
+
+
+# Test the JSON decoding of the responses
+class TestJsonLib:
+    """Test vietfin.utils.jsonlib module with every installed backend."""
+
+    @pytest.fixture(autouse=True, params=list(jsonlib.BACKENDS))
+    def json_backend(self, request):
+        default = jsonlib.backend
+        jsonlib.set_backend(request.param)
+        yield request.param
+        jsonlib.set_backend(default)
+
+    def test_loads(self):
+        """Every backend decodes the same document, including one with a UTF-8 BOM."""
+        document = {"data": [{"ticker": "VNM", "close": 1.5, "volume": 100}]}
+        content = b'{"data": [{"ticker": "VNM", "close": 1.5, "volume": 100}]}'
+
+        assert jsonlib.loads(content) == document
+        assert jsonlib.loads(b"\xef\xbb\xbf" + content) == document
+        with pytest.raises(ValueError):
+            jsonlib.set_backend("simdjson")
+
+    def test_decode_records(self):
+        """The records are validated into the same models as the ones of the full document."""
+        content = (
+            b'{"ticker": "VNM", "data": [{"tradingDate": "2023-01-02T00:00:00.000Z",'
+            b' "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 100, "extra": [1]}]}'
+        )
+        records = jsonlib.decode_records(
+            content, TcbsEquityHistoricalPriceData, ("data",)
+        )
+
+        assert [TcbsEquityHistoricalPriceData(**r) for r in records] == [
+            TcbsEquityHistoricalPriceData(**r) for r in jsonlib.loads(content)["data"]
+        ]
+        assert jsonlib.decode_records(
+            content, TcbsEquityHistoricalPriceData, ("missing",)
+        ) == []
+
+    def test_decode_records_of_model_reading_raw_records(self):
+        """The other keys of the records are kept for a model validator reading them."""
+
+        class TickerCloseData(Data):
+            __alias_dict__ = {"close": "c"}
+
+            symbol: str
+            close: float
+
+            @model_validator(mode="before")
+            @classmethod
+            def read_ticker(cls, data: Any) -> Any:
+                return {**data, "symbol": data["ticker"]}
+
+        content = b'{"data": [{"ticker": "VNM", "c": 1.5}, {"ticker": "FPT", "c": 2.5}]}'
+        records = jsonlib.decode_records(content, TickerCloseData, ("data",))
+
+        assert [TickerCloseData(**r).symbol for r in records] == ["VNM", "FPT"]
+
+    def test_historical_without_raw_data(self, monkeypatch):
+        """The tcbs historical price only decodes the fields of its model when the raw data is dropped."""
+
+        def handler(request):
+            rows = [
+                {
+                    "tradingDate": f"2023-01-{d:02d}T00:00:00.000Z",
+                    "open": 1.0,
+                    "high": 2.0,
+                    "low": 0.5,
+                    "close": 1.5,
+                    "volume": 100,
+                }
+                for d in range(2, 7)
+            ]
+            return httpx.Response(200, json={"ticker": "VNM", "data": rows})
+
+        from vietfin.providers.tcbs.utils.equity_price_historical import (
+            historical,
+        )
+
+        mock_http_transport(monkeypatch, handler)
+        full = historical("VNM", "2023-01-01", "2023-01-10", "1d")
+        with raw_data.raw_data_policy("none"):
+            result = historical("VNM", "2023-01-01", "2023-01-10", "1d")
+
+        assert result.raw_data is None
+        assert result.results == full.results
+
+
+def test_record_struct_is_typed():
+    """With msgspec, the fields of the record struct have the JSON types of the model fields."""
+    msgspec = pytest.importorskip("msgspec")
+
+    struct = jsonlib.record_struct(TcbsEquityHistoricalPriceData)
+    field_types = {f.encode_name: f.type for f in msgspec.structs.fields(struct)}
+
+    assert field_types == {
+        "tradingDate": str | int | float,
+        "open": float,
+        "high": float,
+        "low": float,
+        "close": float,
+        "volume": int | float,
+    }
+    # lax conversions, as the model, and the other keys are skipped
+    content = b'[{"tradingDate": "2023-01-02", "open": 1, "high": 2, "low": 0.5, "close": "1.5", "volume": 100, "extra": {}}]'
+    default = jsonlib.backend
+    jsonlib.set_backend("msgspec")
+    try:
+        records = jsonlib.decode_records(content, TcbsEquityHistoricalPriceData)
+    finally:
+        jsonlib.set_backend(default)
+    assert records == [
+        {"tradingDate": "2023-01-02", "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 100}
+    ]
+
+
+# Test the zero-transpose table of dict-of-lists payloads
+class TestColumnTable:
+    """Test vietfin.utils.column_table module against 3 days of daily bars."""
+
+    DATA = {
+        "t": [1704153600, 1704240000, 1704326400],  # 2024-01-02 to 2024-01-04
+        "c": [1.5, 2.5, 3.5],
+        "v": [100, 200, 300],
+        "s": "ok",
+    }
+
+    def test_rows_and_columns(self):
+        """The table reads the rows and the columns of the payload, skipping the status."""
+        table = column_table.ColumnTable.from_dict(self.DATA, index="t")
+
+        assert len(table) == 3
+        assert table.columns == ["t", "c", "v"]
+        assert table["c"] is self.DATA["c"]
+        assert list(table.rows())[1] == {"t": 1704240000, "c": 2.5, "v": 200}
+        assert table.to_df()["v"].tolist() == [100, 200, 300]
+        with pytest.raises(ValueError):
+            column_table.ColumnTable({"t": [1, 2], "c": [1.5]})
+
+    def test_between(self):
+        """between() returns a view of the rows within the range, both ends included."""
+        table = column_table.ColumnTable.from_dict(self.DATA, index="t")
+
+        assert table.between("2024-01-03")["t"] == [1704240000, 1704326400]
+        assert table.between(end=date(2024, 1, 3))["c"] == [1.5, 2.5]
+        view = table.between(1704240000, 1704240000)
+        assert view._columns is table._columns
+        assert list(view.rows()) == [{"t": 1704240000, "c": 2.5, "v": 200}]
+        assert len(table.between("2025-01-01")) == 0
+
+    def test_filter(self):
+        """filter() keeps the rows of the mask."""
+        table = column_table.ColumnTable.from_dict(self.DATA, index="t")
+
+        assert table.filter([True, False, True])["v"] == [100, 300]
+
+    def test_historical_models_and_columns(self, monkeypatch):
+        """The dnse historical price reads its payload through the table."""
+
+        def handler(request):
+            bars = {**self.DATA, "o": [1, 2, 3], "h": [2, 3, 4], "l": [0.5, 1, 2]}
+            return httpx.Response(200, json=bars)
+
+        from vietfin.providers.dnse.utils.equity_price_historical import (
+            historical,
+        )
+
+        mock_http_transport(monkeypatch, handler)
+        models = historical("VNM", "2024-01-01", "2024-01-05").results
+        df = historical(
+            "VNM", "2024-01-01", "2024-01-05", results_format="columns"
+        ).results
+
+        assert [m.date for m in models] == [d.date() for d in df.index]
+        assert [m.close for m in models] == [1500.0, 2500.0, 3500.0]
+        assert df["volume"].tolist() == [100, 200, 300]
+
+
+def test_fundamentals_panel_rows():
+    """The tcbs ratios and statements are converted to the rows of a panel."""
+    ratios = pd.DataFrame(
+        {
+            "symbol": ["VNM", "VNM"],
+            "period": ["quarter", "quarter"],
+            "fiscal_year": [2023, 2023],
+            "fiscal_quarter": [4, 3],
+            "priceToEarning": [15.2, None],
+            "roe": [0.3, 0.25],
+        }
+    )
+    panel = fundamentals_panel.ratios_to_panel(ratios, "VNM")
+
+    assert list(panel.columns) == fundamentals_panel.PANEL_COLUMNS
+    assert panel[["fiscal_period", "item", "value"]].values.tolist() == [
+        ["Q4 2023", "priceToEarning", 15.2],
+        ["Q4 2023", "roe", 0.3],
+        ["Q3 2023", "roe", 0.25],
+    ]
+
+    income = pd.DataFrame(
+        {
+            "fiscal_year": [2023],
+            "fiscal_quarter": [5],
+            "period": ["annual"],
+            "items": ["gross profit"],
+            "values": [1.5],
+            "symbol": ["VNM"],
+        }
+    )
+    rows = fundamentals_panel.statement_to_panel(income, "VNM", "income")
+    assert rows.values.tolist() == [
+        ["VNM", "income", "annual", "2023", "gross profit", 1.5]
+    ]
+
+
+def test_fundamentals_panel_keeps_other_files(tmp_path):
+    """Only the orphan partitions of a panel dataset are deleted."""
+    params = {"period": "annual"}
+    notes = tmp_path / "part-notes.txt"
+    notes.write_text("not a partition")
+
+    checkpoint = fundamentals_panel.PanelCheckpoint(tmp_path, params)
+    rows = pd.DataFrame(columns=fundamentals_panel.PANEL_COLUMNS)
+    name = checkpoint.add(rows, ["VNM"])
+    # written by a run stopped before its checkpoint
+    orphan = tmp_path / "part-00001.csv"
+    orphan.write_text("")
+
+    assert fundamentals_panel.PanelCheckpoint(tmp_path, params).done == {"VNM"}
+    assert not orphan.exists()
+    assert (tmp_path / name).exists() and notes.exists()
+
+    # partitions of another dataset, without a checkpoint file
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "part-00000.csv").write_text("")
+    with pytest.raises(ValueError):
+        fundamentals_panel.PanelCheckpoint(other, params)
+    assert (other / "part-00000.csv").exists()
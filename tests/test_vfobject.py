@@ -0,0 +1,98 @@
+"""Test the VietFin Object."""
+
+import pytest
+
+from vietfin.abstract.vfobject import VfObject
+from vietfin.utils import raw_data
+from vietfin.providers.tcbs.models.equity_price_historical import (
+    TcbsEquityHistoricalPriceData,
+)
+
+
+def make_vfobject(n_days: int) -> VfObject:
+    """Return a VfObject of n_days daily price data points."""
+    results = [
+        TcbsEquityHistoricalPriceData(
+            date=f"2023-01-{d:02d}", open=1.0, high=2.0, low=0.5, close=1.5, volume=100
+        )
+        for d in range(1, n_days + 1)
+    ]
+    return VfObject(results=results, provider="tcbs", extra={}, raw_data=None)
+
+
+def test_to_df_is_cached(monkeypatch):
+    """The dataframe is built once, and later calls do not alter the cache."""
+    vfobject = make_vfobject(10)
+    df = vfobject.to_df()
+    df["new_column"] = 0
+    df["close"] *= 10
+    df.iloc[0, 0] = 999
+
+    # any conversion of the models again would fail
+    monkeypatch.setattr(
+        TcbsEquityHistoricalPriceData, "model_dump", lambda self: 1 / 0
+    )
+
+    df = vfobject.to_df()
+    assert "new_column" not in df.columns
+    assert df["close"].tolist() == [1.5] * 10
+    assert df.iloc[0, 0] == 1.0
+    assert len(vfobject) == 10
+    assert vfobject.to_numpy().shape == (10, 6)
+
+
+def test_cache_is_dropped_when_results_are_replaced():
+    """Replacing the results drops the cached dataframe."""
+    vfobject = make_vfobject(10)
+    assert vfobject.to_df().shape[0] == 10
+
+    vfobject.results = vfobject.results[:3]  # type: ignore
+
+    assert len(vfobject) == 3
+    assert vfobject.to_df().shape[0] == 3
+
+
+def test_to_df_of_dataframe_results():
+    """DataFrame results are returned as a copy, indexed and sorted on demand."""
+    vfobject = make_vfobject(5)
+    results = vfobject.to_df().reset_index()
+    results["close"] = [3.0, 1.0, 2.0, 5.0, 4.0]
+    vfobject.results = results
+
+    df = vfobject.to_df()
+    df["new_column"] = 0
+    df.drop(columns="open", inplace=True)
+    df["close"] *= 10
+    assert list(vfobject.results.columns) == list(results.columns)
+    assert vfobject.results["close"].tolist() == [3.0, 1.0, 2.0, 5.0, 4.0]
+
+    df = vfobject.to_df(index="date", sort_by="close")
+    assert df.index.name == "date"
+    assert df["close"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert vfobject.results["close"].tolist() == [3.0, 1.0, 2.0, 5.0, 4.0]
+
+
+def test_raw_data_policy(monkeypatch):
+    """The raw data is kept, dropped, or compressed and decoded on first access."""
+    monkeypatch.setattr(raw_data, "_policy", "full")
+    raw = {"data": [{"open": 1.0, "close": 1.5}] * 1000}
+
+    def make(raw: dict) -> VfObject:
+        return VfObject(results=[], provider="tcbs", extra={}, raw_data=raw)
+
+    with raw_data.raw_data_policy("none"):
+        assert make(raw).raw_data is None
+
+    raw_data.set_raw_data_policy("lazy")
+    vfobject = make(raw)
+    stored = vfobject.__dict__["raw_data"]
+    assert isinstance(stored, raw_data.LazyRawData)
+    assert len(stored) < len(str(raw)) / 10
+    assert vfobject.model_dump()["raw_data"] == raw
+    assert vfobject.raw_data == raw
+    assert vfobject.__dict__["raw_data"] == raw  # decoded once
+
+    with raw_data.raw_data_policy("full"):
+        assert make(raw).raw_data == raw
+    with pytest.raises(ValueError):
+        raw_data.set_raw_data_policy("compressed")  # type: ignore
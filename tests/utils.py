@@ -1,6 +1,7 @@
 """Utility functions for testing."""
 
-from typing import Any
+import weakref
+from typing import Any, Callable
 
 
 def assert_run_success(
@@ -27,3 +28,61 @@ def assert_run_success(
 
     # Assert results attribute is not null
     assert result.extra.get("records_count") > 0
+
+
+def mock_http_transport(monkeypatch: Any, handler: Callable) -> None:
+    """Route the requests of the HTTP session layer to a mock handler instead of the network.
+
+    The handler receives each `httpx.Request` and returns the `httpx.Response` to be used.
+    """
+    import httpx
+
+    from vietfin.utils import http, response_cache
+
+    settings = http._client_settings
+
+    def mock_settings() -> dict:
+        return {**settings(), "transport": httpx.MockTransport(handler)}
+
+    monkeypatch.setattr(http, "_client_settings", mock_settings)
+    # the mocked clients live in their own pools, dropped at the end of the test
+    monkeypatch.setattr(http, "_clients", {})
+    monkeypatch.setattr(http, "_async_clients", weakref.WeakKeyDictionary())
+    # nor are the cached responses
+    monkeypatch.setattr(response_cache, "_memory", response_cache.MemoryStore())
+
+
+def statement_workbook(n_items: int = 5, n_periods: int = 4) -> bytes:
+    """Return an XLSX financial statement laid out as the SSI downloads.
+
+    7 title rows, the header row (ITEMS, then one column per year), one row per line item,
+    with a missing value every 7 cells, then 3 footer rows.
+    """
+    from io import BytesIO
+
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Income Statement"])
+    sheet.append(["Company: VNM"])
+    for _ in range(5):
+        sheet.append([])
+    sheet.append(["ITEMS", *(str(2024 - n_periods + p) for p in range(n_periods))])
+    for i in range(n_items):
+        sheet.append(
+            [
+                f"Item {i}",
+                *(
+                    None if (i + p) % 7 == 0 else i * 1000 + p * 1.5
+                    for p in range(n_periods)
+                ),
+            ]
+        )
+    sheet.append([])
+    sheet.append(["Source: SSI"])
+    sheet.append(["Unit: VND"])
+
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()